@@ -1,37 +1,24 @@
 import sys
 import os
+from time import perf_counter
+
+_STARTED = perf_counter()
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# --profile-startup [report.json]: time every import and the first frame, then exit.
+# The profiler has to be in place before anything else is imported.
+_profiler = None
+if "--profile-startup" in sys.argv:
+    from core.startup_profile import StartupProfiler
+    _profiler = StartupProfiler(_STARTED).install()
+
 import asyncio
-import json
 import platform
-import shutil
-import subprocess
-import time
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict
-
-from prompt_toolkit.application import Application
-from prompt_toolkit.layout.containers import DynamicContainer
-from prompt_toolkit.layout.layout import Layout
-from prompt_toolkit.output import ColorDepth
-from prompt_toolkit.patch_stdout import patch_stdout
-from prompt_toolkit.widgets import TextArea
-from rich.console import Console
-
-from ui.components.input_area import get_input_key_bindings, get_input_text_area
-from commands.functions.theme.theme_logic import ensure_config_exists
-from core.theme_engine import get_current_theme_colors, get_app_style
-from ui.styles.theme_styles import get_theme_style
-from core.logger import log_global_crash
-from core.constants import APP_VERSION
-from ui.screens.cmd_screen import get_cmd_screen_container
-from ui.screens.intro_screen import get_intro_screen_container
-
-if TYPE_CHECKING:
-    pass
-
-ensure_config_exists()
+from typing import Any, Dict
+
+# Everything else (prompt_toolkit, the UI, the command registry, Rich) is imported in
+# main_app, after settings.json is guaranteed to exist; Rich and psutil are not needed
+# until something is rendered through them or a command asks for them.
 
 
 def _get_settings_path():
@@ -48,15 +35,17 @@ def set_terminal_title(title: str):
     # Method 1: ANSI escape sequence (works in Windows Terminal, VT100 compatible)
     sys.stdout.write(f"\x1b]2;{title}\x07")
     sys.stdout.flush()
-    
-    # Method 2: Windows title command (backup)
-    if platform.system() == "Windows":
+
+    # Method 2: Windows title command (backup for consoles without VT support)
+    if platform.system() == "Windows" and not os.environ.get("WT_SESSION"):
         os.system(f"title {title}")
 
 
 def early_window_resize():
+    """Size the Windows console from window_settings; `mode` returns once the resize is done."""
     if platform.system() == "Windows":
         try:
+            import json
             config_path = _get_settings_path()
             if os.path.exists(config_path):
                 with open(config_path, "r") as f:
@@ -65,28 +54,27 @@ def early_window_resize():
                     cols = ws.get("cols", 120)
                     lines = ws.get("lines", 30)
                     os.system(f"mode con: cols={cols} lines={lines}")
-                    time.sleep(0.3)
         except Exception:
             pass
 
 
-sys.argv = [arg for arg in sys.argv]
+def parse_args(argv):
+    """(mode, profile_output) from the command line."""
+    mode = "default"
+    if "--mode" in argv:
+        idx = argv.index("--mode")
+        if idx + 1 < len(argv):
+            mode = argv[idx + 1]
 
-mode = "default"
-if len(sys.argv) > 1 and "--mode" in sys.argv:
-    try:
-        idx = sys.argv.index("--mode")
-        if idx + 1 < len(sys.argv):
-            mode = sys.argv[idx + 1]
-    except ValueError:
-        pass
-
-early_window_resize()
+    profile_output = None
+    if "--profile-startup" in argv:
+        idx = argv.index("--profile-startup")
+        if idx + 1 < len(argv) and not argv[idx + 1].startswith("--"):
+            profile_output = argv[idx + 1]
+    return mode, profile_output
 
-# Set terminal title immediately on startup
-set_terminal_title(f"MYCOLOR - {APP_VERSION}")
 
-async def main_app(mode="default"):
+async def main_app(mode="default", profiler=None):
     try:
         reconfig = getattr(sys.stdout, "reconfigure", None)
         if reconfig:
@@ -95,6 +83,8 @@ async def main_app(mode="default"):
         pass
 
     if platform.system() == "Windows" and not os.environ.get("WT_SESSION"):
+        import subprocess
+        import time
         try:
             project_directory = os.getcwd()
             app_dir = os.path.join(project_directory, "app")
@@ -106,8 +96,7 @@ async def main_app(mode="default"):
                 sys.executable,
                 myworld_path,
             ]
-            if mode != "default":
-                cmd_args.extend(["--mode", mode])
+            cmd_args.extend(sys.argv[1:])
 
             subprocess.Popen(cmd_args)
             sys.exit(0)
@@ -115,18 +104,36 @@ async def main_app(mode="default"):
             print(
                 "Windows Terminal (wt.exe) not found. Falling back to current terminal. ANSI colors may not display correctly."
             )
+            # Leave the warning readable before the full-screen UI takes over
             time.sleep(3)
         except Exception as e:
             print(f"Error relaunching in Windows Terminal: {e}")
             time.sleep(3)
 
-    if platform.system() == "Windows":
-        os.system("mode con: cols=120 lines=30")
-        time.sleep(0.2)
-
-    os.system("cls" if os.name == "nt" else "clear")
-
-    console = Console(width=shutil.get_terminal_size().columns)
+    from commands.functions.theme.theme_logic import ensure_config_exists
+    ensure_config_exists()
+
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.key_binding import ConditionalKeyBindings, merge_key_bindings
+    from prompt_toolkit.layout.containers import DynamicContainer
+    from prompt_toolkit.layout.layout import Layout
+    from prompt_toolkit.output import ColorDepth
+    from prompt_toolkit.patch_stdout import patch_stdout
+
+    from core.constants import APP_VERSION
+    from ui.components.input_area import get_input_key_bindings, get_input_text_area
+    from ui.components.scrollback import ScrollbackArea
+    from ui.layout import screen_manager
+    from ui.screens.cmd_screen import get_cmd_screen_container
+    from ui.screens.intro_screen import get_intro_screen_container
+    from ui.styles.theme_styles import get_theme_style
+
+    if profiler:
+        profiler.mark("imports done")
+
+    # Clear the screen with an escape sequence rather than spawning cls/clear
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
     # Set terminal window title using ANSI escape sequence
     set_terminal_title(f"MYCOLOR - {APP_VERSION}")
@@ -141,15 +148,21 @@ async def main_app(mode="default"):
         style=None,
     )
 
-    kb = get_input_key_bindings(application)
-    application.key_bindings = kb
+    output_buffer = ScrollbackArea()
 
-    output_buffer = TextArea(
-        style="class:output-field", read_only=True, scrollbar=True, focus_on_click=True
-    )
+    # The command line's keys step aside while the task manager or settings is shown
+    application.key_bindings = merge_key_bindings([
+        ConditionalKeyBindings(
+            get_input_key_bindings(application, output_buffer),
+            filter=~screen_manager.screen_shown,
+        ),
+        screen_manager.get_screen_key_bindings(),
+    ])
 
-    kb = get_input_key_bindings(application, output_buffer)
-    application.key_bindings = kb
+    # --mode taskmgr|settings opens that screen over the intro once the app runs
+    start_screen = mode if mode in screen_manager.EMBEDDED_SCREENS else None
+    if start_screen:
+        mode = "default"
 
     app_state: Dict[str, Any] = {"current_screen": "intro" if mode == "default" else mode}
     setattr(application, "app_state", app_state)
@@ -169,10 +182,10 @@ async def main_app(mode="default"):
     cmd_container = get_cmd_screen_container(text_area, output_buffer)
 
     def get_root_container():
-        if app_state["current_screen"] == "intro":
+        screen = app_state["current_screen"]
+        if screen == "intro":
             return intro_container
-        else:
-            return cmd_container
+        return screen_manager.get_screen_container(screen) or cmd_container
 
     application.style = get_theme_style()
 
@@ -182,22 +195,39 @@ async def main_app(mode="default"):
 
     application.layout = Layout(root_container, focused_element=initial_focus)
 
+    if profiler:
+        profiler.mark("layout built")
+
+        def on_first_frame(app):
+            application.after_render -= on_first_frame
+            profiler.mark("first frame")
+            application.exit()
+
+        application.after_render += on_first_frame
+    else:
+        def preload_screens(app):
+            application.after_render -= preload_screens
+            screen_manager.preload()
+
+        application.after_render += preload_screens
+
+    def pre_run():
+        if start_screen:
+            screen_manager.open_screen(application, start_screen)
+
     with patch_stdout():
-        await application.run_async()
+        await application.run_async(pre_run=pre_run)
 
 
 if __name__ == "__main__":
+    mode, profile_output = parse_args(sys.argv)
     try:
-        if platform.system() == "Windows":
-            os.system("mode con: cols=120 lines=30")
-            time.sleep(0.3)
-            os.system("cls")
-            sys.stdout.write("\033[H")
-            sys.stdout.flush()
-
-        asyncio.run(main_app(mode=mode))
+        early_window_resize()
+        asyncio.run(main_app(mode=mode, profiler=_profiler))
     except Exception:
         import traceback
+        from datetime import datetime
+        from core.logger import log_global_crash
         crash_report = (
             f"Crash Report - {datetime.now()}\n"
             f"{'-' * 30}\n"
@@ -206,4 +236,10 @@ if __name__ == "__main__":
         )
         log_global_crash(crash_report)
         print(crash_report, file=sys.stderr)
-        input("Press Enter to close...")
\ No newline at end of file
+        input("Press Enter to close...")
+
+    if _profiler is not None:
+        _profiler.uninstall()
+        _profiler.report()
+        if profile_output:
+            _profiler.save(profile_output)
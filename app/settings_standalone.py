@@ -10,8 +10,6 @@ from datetime import datetime
 from typing import Any, Dict
 
 from prompt_toolkit.application import Application
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.keys import Keys
 from prompt_toolkit.layout.containers import DynamicContainer
 from prompt_toolkit.layout.layout import Layout
 from prompt_toolkit.output import ColorDepth
@@ -20,7 +18,7 @@ from rich.console import Console
 
 from commands.functions.theme.theme_logic import ensure_config_exists
 from core.theme_engine import get_current_theme_colors, get_app_style
-from ui.layout.settings_layout import build_settings_layout, get_settings_layout, get_current_settings_interface
+from ui.layout.settings_layout import get_settings_key_bindings, get_settings_layout, get_current_settings_interface
 from core.logger import log_global_crash, CrashLogger
 
 
@@ -81,8 +79,6 @@ async def main_settings():
         _write_debug_log(f"Application creation failed: {e}")
         raise
 
-    kb = KeyBindings()
-
     try:
         container, focus = get_settings_layout(application)
         _write_debug_log("Layout built successfully")
@@ -98,183 +94,15 @@ async def main_settings():
         console.print("[red]Failed to initialize settings interface.[/red]")
         return
 
-    @kb.add("escape", eager=True)
-    def handle_escape(event):
-        if interface.popup_mode:
-            interface.popup_mode = False
-            interface.edit_key = None
-            event.app.invalidate()
-        elif interface.edit_mode:
-            interface.cancel_edit()
-            event.app.invalidate()
-        elif interface.listening_mode:
-            interface.listening_mode = False
-            event.app.invalidate()
-        else:
-            interface.running = False
-            event.app.exit()
-
-    @kb.add("q", eager=True)
-    def quit_only(event):
-        if not (interface.popup_mode or interface.edit_mode or interface.listening_mode):
-            interface.running = False
-            event.app.exit()
-
-    @kb.add("left")
-    def prev_tab(event):
-        if interface.edit_mode or interface.popup_mode or interface.listening_mode:
-            interface.cancel_popup()
-        else:
-            interface.switch_tab(-1)
-            event.app.invalidate()
-
-    @kb.add("right")
-    def next_tab(event):
-        if interface.edit_mode or interface.popup_mode or interface.listening_mode:
-            interface.cancel_popup()
-        else:
-            interface.switch_tab(1)
-            event.app.invalidate()
-
-    @kb.add("up")
-    def move_up(event):
-        if interface.popup_mode:
-            interface.move_selection(-1)
-            event.app.invalidate()
-        elif not interface.edit_mode and not interface.listening_mode:
-            interface.move_selection(-1)
-            event.app.invalidate()
-
-    @kb.add("down")
-    def move_down(event):
-        if interface.popup_mode:
-            interface.move_selection(1)
-            event.app.invalidate()
-        elif not interface.edit_mode and not interface.listening_mode:
-            interface.move_selection(1)
-            event.app.invalidate()
-
-    @kb.add("enter")
-    def handle_enter(event):
-        if interface.popup_mode:
-            theme_changed = interface.confirm_popup()
-            if theme_changed:
-                event.app.style = get_app_style()
-            event.app.invalidate()
-        elif interface.edit_mode:
-            interface.confirm_edit()
-            event.app.invalidate()
-        elif interface.listening_mode:
-            pass
-        else:
-            interface.handle_enter()
-            event.app.invalidate()
-
-    @kb.add("backspace")
-    def handle_backspace(event):
-        if interface.edit_mode:
-            interface.backspace_edit_value()
-            event.app.invalidate()
-
-    @kb.add("delete")
-    def handle_delete(event):
-        if not interface.popup_mode and not interface.listening_mode:
-            interface.handle_delete()
-            event.app.invalidate()
-
-    @kb.add("c-s")
-    def save_settings(event):
-        colors = _get_colors()
-        success_color = colors.get("success", "#6A8759")
-        error_color = colors.get("error", "#CC7832")
-        if interface.save_all():
-            console.print(f"[{success_color}]Settings saved successfully![/{success_color}]")
-        else:
-            console.print(f"[{error_color}]Failed to save settings.[/{error_color}]")
-
-    @kb.add("escape", "s")
-    def alt_save_settings(event):
-        colors = _get_colors()
-        success_color = colors.get("success", "#6A8759")
-        error_color = colors.get("error", "#CC7832")
-        if interface.save_all():
-            console.print(f"[{success_color}]Settings saved successfully![/{success_color}]")
-        else:
-            console.print(f"[{error_color}]Failed to save settings.[/{error_color}]")
-
-    @kb.add("escape", "q")
-    def alt_quit_no_save(event):
-        if interface.has_changes():
-            console.print("[yellow]Exiting without saving changes.[/yellow]")
-        interface.running = False
+    def quit_app(event):
         event.app.exit()
 
-    @kb.add("c-q")
-    def ctrl_quit_no_save(event):
-        if interface.has_changes():
-            console.print("[yellow]Exiting without saving changes.[/yellow]")
-        interface.running = False
-        event.app.exit()
+    def notify(message, is_success):
+        colors = _get_colors()
+        color = colors.get("success", "#6A8759") if is_success else colors.get("error", "#CC7832")
+        console.print(f"[{color}]{message}[/{color}]")
 
-    @kb.add(Keys.Up)
-    def handle_up(event):
-        if interface.popup_mode:
-            interface.move_selection(-1)
-            event.app.invalidate()
-        elif not interface.edit_mode and not interface.listening_mode:
-            interface.move_selection(-1)
-            event.app.invalidate()
-
-    @kb.add(Keys.Down)
-    def handle_down(event):
-        if interface.popup_mode:
-            interface.move_selection(1)
-            event.app.invalidate()
-        elif not interface.edit_mode and not interface.listening_mode:
-            interface.move_selection(1)
-            event.app.invalidate()
-
-    @kb.add(Keys.Left)
-    def handle_left(event):
-        if interface.edit_mode or interface.popup_mode or interface.listening_mode:
-            interface.cancel_popup()
-        else:
-            interface.switch_tab(-1)
-            event.app.invalidate()
-
-    @kb.add(Keys.Right)
-    def handle_right(event):
-        if interface.edit_mode or interface.popup_mode or interface.listening_mode:
-            interface.cancel_popup()
-        else:
-            interface.switch_tab(1)
-            event.app.invalidate()
-
-    @kb.add(Keys.Enter)
-    def handle_enter_key(event):
-        if interface.popup_mode:
-            interface.confirm_popup()
-            event.app.invalidate()
-        elif interface.edit_mode:
-            interface.confirm_edit()
-            event.app.invalidate()
-        elif interface.listening_mode:
-            pass
-        else:
-            interface.handle_enter()
-            event.app.invalidate()
-
-    @kb.add(Keys.Backspace)
-    def handle_backspace_key(event):
-        if interface.edit_mode:
-            interface.backspace_edit_value()
-            event.app.invalidate()
-
-    @kb.add(Keys.Delete)
-    def handle_delete_key(event):
-        if not interface.popup_mode and not interface.listening_mode:
-            interface.handle_delete()
-            event.app.invalidate()
+    kb = get_settings_key_bindings(interface, quit_app, notify, get_app_style)
 
     application.key_bindings = kb
 
@@ -0,0 +1,148 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import csv
+import json
+import threading
+from time import monotonic
+
+from api.system_api import get_system_bridge
+from services.datasource import create_source, get_source, set_source
+from services.metrics_server import start_metrics_server, stop_metrics_server
+from services.snapshot import SNAPSHOT_FIELDS, build_self_metrics, build_snapshot, get_snapshot_store
+
+
+class NDJSONWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, snapshot):
+        row = {field: snapshot.get(field) for field in SNAPSHOT_FIELDS}
+        self.stream.write(json.dumps(row, separators=(",", ":")) + "\n")
+        self.stream.flush()
+
+
+class CSVWriter:
+    def __init__(self, stream, header=True):
+        self.stream = stream
+        self._writer = csv.DictWriter(stream, fieldnames=SNAPSHOT_FIELDS, extrasaction="ignore")
+        if header:
+            self._writer.writeheader()
+
+    def write(self, snapshot):
+        self._writer.writerow(snapshot)
+        self.stream.flush()
+
+
+WRITERS = {
+    "ndjson": NDJSONWriter,
+    "csv": CSVWriter,
+}
+
+
+def sample_once(monitors):
+    import psutil
+    # The export interval is the sampling rate; the UI's per-collector intervals don't apply
+    for monitor in monitors.values():
+        monitor.update(force=True)
+    try:
+        process_count = len(get_source().pids())
+    except psutil.Error:
+        process_count = None
+    return build_snapshot(
+        cpu=monitors.get("cpu"),
+        ram=monitors.get("ram"),
+        gpu=monitors.get("gpu"),
+        net=monitors.get("net"),
+        process_count=process_count,
+        self_metrics=build_self_metrics(),
+    )
+
+
+def run_headless(writer, interval=1.0, count=None, stop_event=None):
+    """Sample the monitor engine every `interval` seconds and hand each snapshot to writer."""
+    stop_event = stop_event or threading.Event()
+    bridge = get_system_bridge()
+    monitors = bridge.get_all_monitors()
+    store = get_snapshot_store()
+
+    written = 0
+    # Fixed-rate schedule: deadlines advance by interval, so slow ticks don't accumulate drift
+    next_tick = monotonic()
+    try:
+        while not stop_event.is_set():
+            snapshot = sample_once(monitors)
+            store.publish(snapshot)
+            writer.write(snapshot)
+            written += 1
+            if count is not None and written >= count:
+                break
+            next_tick += interval
+            delay = next_tick - monotonic()
+            if delay < 0:
+                next_tick = monotonic()
+                delay = 0
+            stop_event.wait(delay)
+    finally:
+        monitors["gpu"].stop()
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream task manager metrics without the terminal UI")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="ndjson")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between snapshots")
+    parser.add_argument("--count", type=int, default=None, help="stop after N snapshots")
+    parser.add_argument("--output", "-o", default="-", help="file path, or - for stdout")
+    parser.add_argument("--append", action="store_true", help="append to --output instead of truncating")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="also serve OpenMetrics on localhost:PORT/metrics")
+    parser.add_argument("--source", default=None,
+                        help="data source: psutil, synthetic or trace:PATH (default: taskmgr.data_source)")
+    args = parser.parse_args(argv)
+
+    if args.source:
+        try:
+            set_source(create_source(args.source))
+        except (OSError, ValueError) as e:
+            print(f"Invalid data source: {e}", file=sys.stderr)
+            return 2
+
+    if args.metrics_port is not None:
+        server = start_metrics_server(port=args.metrics_port)
+        if server is None:
+            print(f"Could not bind metrics endpoint on port {args.metrics_port}", file=sys.stderr)
+            return 1
+        print(f"Serving metrics on {server.url}", file=sys.stderr)
+
+    if args.output == "-":
+        stream = sys.stdout
+    else:
+        header = not (args.append and os.path.exists(args.output) and os.path.getsize(args.output) > 0)
+        stream = open(args.output, "a" if args.append else "w", encoding="utf-8", newline="")
+    if args.format == "csv":
+        writer = CSVWriter(stream, header=args.output == "-" or header)
+    else:
+        writer = WRITERS[args.format](stream)
+
+    try:
+        run_headless(writer, interval=max(0.1, args.interval), count=args.count)
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); exit quietly
+        try:
+            sys.stdout = open(os.devnull, "w")
+        except OSError:
+            pass
+    finally:
+        stop_metrics_server()
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,6 @@ from datetime import datetime
 from typing import Any, Dict
 
 from prompt_toolkit.application import Application
-from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.layout.containers import DynamicContainer
 from prompt_toolkit.layout.layout import Layout
 from prompt_toolkit.output import ColorDepth
@@ -18,7 +17,7 @@ from rich.console import Console
 
 from commands.functions.theme.theme_logic import ensure_config_exists
 from core.theme_engine import get_current_theme_colors, get_app_style
-from ui.layout.taskmgr_layout import get_taskmgr_layout, get_current_taskmgr_interface
+from ui.layout.taskmgr_layout import get_taskmgr_layout, get_taskmgr_key_bindings, get_current_taskmgr_interface
 from core.logger import log_global_crash, CrashLogger
 
 
@@ -58,8 +57,6 @@ async def main_taskmgr():
         style=None,
     )
 
-    kb = KeyBindings()
-
     container, focus = get_taskmgr_layout(application)
     interface = get_current_taskmgr_interface()
 
@@ -68,19 +65,11 @@ async def main_taskmgr():
         console.print("[red]Failed to initialize task manager interface.[/red]")
         return
 
-    @kb.add("q", eager=True)
-    @kb.add("escape", eager=True)
     def quit_app(event):
         interface.running = False
         event.app.exit()
 
-    @kb.add("left")
-    def prev_tab(event):
-        interface.switch_tab(-1)
-
-    @kb.add("right")
-    def next_tab(event):
-        interface.switch_tab(1)
+    kb = get_taskmgr_key_bindings(interface, quit_app)
 
     application.key_bindings = kb
 
@@ -0,0 +1,432 @@
+"""Benchmarks for monitors, tabs and the command pipeline.
+
+    python benchmarks/bench.py                  # run and compare with the baseline
+    python benchmarks/bench.py --save-baseline  # store current figures as the baseline
+    python benchmarks/bench.py --filter render --quick
+
+Timings only compare on the same machine, so no baseline is committed: record
+one from the base commit, then compare the change against it on the same
+runner (see "Benchmarks" in README.md). benchmarks/baseline.json is ignored.
+
+Each case is timed with the GC disabled (best and median of several batches),
+then run once more under tracemalloc for peak and retained allocation. Cases
+whose best batch is slower than --threshold x the baseline are reported as
+regressions and the exit status is 1.
+
+Behaviour checks registered with @check run first; a failing one also exits 1
+(without timing anything), since the figures would not mean what they claim.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import gc
+import io
+import json
+import platform
+import random
+import statistics
+import tracemalloc
+from time import perf_counter, time
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+HISTORY_SIZES = [100, 10_000, 100_000]
+PROCESS_SIZES = [100, 1_000, 10_000]
+BUFFER_SIZES = [1_000, 10_000, 100_000]
+LOGO_WIDTHS = [80, 120, 200]
+GRAPH_W, GRAPH_H = 60, 14
+
+_CASES = []
+_CHECKS = []
+
+
+def case(name, sizes):
+    """Register a benchmark. The decorated function does the setup for one size and returns the callable to time."""
+    def register(func):
+        for size in sizes:
+            _CASES.append((name, size, func))
+        return func
+    return register
+
+
+def check(func):
+    """Register a behaviour check: a function that raises AssertionError when it fails."""
+    _CHECKS.append(func)
+    return func
+
+
+def _wave(n, seed=1):
+    rnd = random.Random(seed)
+    return [max(0.0, min(100.0, 50 + 40 * ((i % 97) / 97.0 - 0.5) + rnd.uniform(-5, 5))) for i in range(n)]
+
+
+@check
+def check_monitor_backoff():
+    """A collector the scheduler backs off samples less often than one at its base interval."""
+    import services.monitors.base_monitor as base_monitor
+    import services.scheduler as scheduler
+    from services.monitors.cpu_monitor import CPUMonitor
+
+    clock = [1000.0]
+    saved = scheduler._scheduler, base_monitor.monotonic
+    scheduler._scheduler = scheduler.AdaptiveScheduler(cpu_budget=0.02, max_interval=30.0)
+    base_monitor.monotonic = lambda: clock[0]
+    try:
+        def samples_per_minute(cost):
+            monitor = CPUMonitor()
+            scheduler._scheduler.record(monitor.collector_name, cost)
+            count = 0
+            for _ in range(600):
+                count += monitor.should_update()
+                clock[0] += 0.1
+            return count
+
+        base = samples_per_minute(0.0)
+        backed_off = samples_per_minute(1.0)
+    finally:
+        scheduler._scheduler, base_monitor.monotonic = saved
+    assert backed_off * 10 < base, f"backed-off collector sampled {backed_off} times a minute, {base} at base interval"
+
+
+@case("monitor.graph_text", HISTORY_SIZES)
+def bench_graph_text(size):
+    from services.monitors.cpu_monitor import CPUMonitor
+    monitor = CPUMonitor()
+    data = _wave(size)
+    return lambda: monitor._get_graph_text(data, GRAPH_W, GRAPH_H, "#00FF41")
+
+
+@case("monitor.render", HISTORY_SIZES)
+def bench_monitor_render(size):
+    from services.monitors.cpu_monitor import CPUMonitor
+    monitor = CPUMonitor()
+    monitor.history = _wave(size)
+    monitor.last_value = monitor.history[-1]
+    return lambda: monitor.render(GRAPH_W, GRAPH_H)
+
+
+@case("monitor.render_zoom_24h", HISTORY_SIZES)
+def bench_monitor_render_zoom(size):
+    from services.monitors.cpu_monitor import CPUMonitor
+    monitor = CPUMonitor()
+    now = time()
+    step = 86400.0 / size
+    rollup = monitor.get_rollup(monitor.collector_name)
+    rollup.extend((now - 86400 + i * step, v) for i, v in enumerate(_wave(size)))
+    monitor.zoom_span = 86400
+    return lambda: monitor.render(GRAPH_W, GRAPH_H)
+
+
+@case("net.render", HISTORY_SIZES)
+def bench_net_render(size):
+    from services.monitors.net_monitor import NetMonitor
+    monitor = NetMonitor()
+    monitor.down_history = _wave(size, seed=2)
+    monitor.up_history = _wave(size, seed=3)
+    monitor.last_down = 3.2 * 1024 * 1024
+    monitor.last_up = 0.4 * 1024 * 1024
+    return lambda: monitor.render(GRAPH_W, GRAPH_H)
+
+
+def synthetic_processes(count, seed=7):
+    rnd = random.Random(seed)
+    names = ["python.exe", "chrome.exe", "code.exe", "svchost.exe", "explorer.exe", "node.exe", "postgres"]
+    users = ["user", "SYSTEM", "LOCAL SERVICE", "root"]
+    return [
+        {
+            "pid": 4 + i * 4,
+            "name": rnd.choice(names),
+            "cpu_percent": round(rnd.uniform(0, 25), 1),
+            "memory_percent": round(rnd.uniform(0, 8), 2),
+            "num_threads": rnd.randint(1, 120),
+            "username": rnd.choice(users),
+            "num_handles": rnd.randint(10, 4000),
+        }
+        for i in range(count)
+    ]
+
+
+@case("processes.render", PROCESS_SIZES)
+def bench_processes_render(size):
+    from ui.modules.tabs.taskmgr.processes_tab import ProcessesTab
+    tab = ProcessesTab(None)
+    tab.processes = synthetic_processes(size)
+    tab.selected_index = size // 2
+
+    def run():
+        # Defeat the render cache: every call is a data change
+        tab._cached_process_hash = None
+        return tab.render()
+    return run
+
+
+@case("processes.fetch_synthetic", PROCESS_SIZES)
+def bench_processes_fetch(size):
+    from services.datasource import SyntheticSource, set_source
+    from ui.modules.tabs.taskmgr.processes_tab import ProcessesTab
+    set_source(SyntheticSource(process_count=size, churn_per_second=size / 100.0))
+    tab = ProcessesTab(None)
+    config = {"taskmgr": {"process_limit": size, "exclude_system_apps": False}}
+    return lambda: tab._fetch_processes(config)
+
+
+@case("logo.render_logo", LOGO_WIDTHS)
+def bench_logo(size):
+    from core.logo_engine import LogoEngine
+    return lambda: LogoEngine.render_logo(size)
+
+
+@case("logo.render_logo_cold", LOGO_WIDTHS)
+def bench_logo_cold(size):
+    from core.logo_engine import LogoEngine
+
+    def run():
+        LogoEngine.clear_cache()
+        return LogoEngine.render_logo(size)
+    return run
+
+
+def _ansi_lines(count):
+    colors = ["\x1b[38;2;0;255;65m", "\x1b[38;2;204;120;50m", "\x1b[1m", ""]
+    return "".join(f"{colors[i % 4]}line {i}: lorem ipsum dolor sit amet\x1b[0m\n" for i in range(count))
+
+
+@case("cmd.scrollback_append", BUFFER_SIZES)
+def bench_cmd_scrollback(size):
+    from ui.components.scrollback import ScrollbackArea
+
+    # Scrollback as large as the case, so trimming doesn't hide the cost of a big buffer
+    output = ScrollbackArea(max_lines=size)
+    output.append_text(_ansi_lines(size).rstrip("\n"))
+    counter = [0]
+
+    def run():
+        # One streamed line, then the redraw of a 30-row window at the tail
+        counter[0] += 1
+        output.append_text(f"\x1b[1mappended {counter[0]}\x1b[0m")
+        content = output.control.create_content(80, 30)
+        return [content.get_line(i) for i in range(max(0, content.line_count - 30), content.line_count)]
+    return run
+
+
+@case("completer.keystroke", [10, 1_000, 100_000])
+def bench_completer(size):
+    from prompt_toolkit.document import Document
+    from ui.components.completer import DynamicCommandCompleter
+
+    flags = {f"/cmd{i:06d}": ["--all", "--help", "-h"] for i in range(size)}
+    completer = DynamicCommandCompleter(command_flags=flags, flag_choices={})
+    queries = [Document(q) for q in ("/", "/c", "/cm", "/cmd0", "/cmd000001 --", "/cmd000001 --h")]
+
+    def run():
+        # The query cache would answer everything after the first round
+        completer._command_index._cache.clear()
+        completer._flag_indexes["/cmd000001"]._cache.clear()
+        return [list(completer.get_completions(doc, None)) for doc in queries]
+    return run
+
+
+@case("registry.dispatch", ["/help", "/theme --help", "/copy --help", "/unknown"])
+def bench_dispatch(command):
+    from rich.console import Console
+    from commands.registry import dispatch
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=80)
+
+    def log_to_buffer(renderable, save_to_history=True):
+        console.print(renderable)
+
+    def run():
+        console.file.seek(0)
+        console.file.truncate(0)
+        return dispatch(command, log_to_buffer, None, None)
+    return run
+
+
+def measure(run, repeat=10, min_batch=0.05):
+    run()  # warm caches and lazy imports
+    number = 1
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while True:
+            start = perf_counter()
+            for _ in range(number):
+                run()
+            elapsed = perf_counter() - start
+            if elapsed >= min_batch or number >= 1 << 20:
+                break
+            number *= 2
+        times = []
+        for _ in range(repeat):
+            start = perf_counter()
+            for _ in range(number):
+                run()
+            times.append((perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = run()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "peak_bytes": max(0, peak - before),
+        "retained_bytes": max(0, after - before),
+        "loops": number,
+    }
+
+
+def _key(name, size):
+    return f"{name}[{size}]"
+
+
+def _format_time(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.2f} ms"
+    return f"{seconds:8.2f} s "
+
+
+def _format_bytes(n):
+    if n < 1024:
+        return f"{n:7d} B "
+    if n < 1024 * 1024:
+        return f"{n / 1024:7.1f} KB"
+    return f"{n / (1024 * 1024):7.1f} MB"
+
+
+def run_checks():
+    """Run every @check; returns the names of those that failed."""
+    failed = []
+    for func in _CHECKS:
+        try:
+            func()
+        except AssertionError as e:
+            failed.append(func.__name__)
+            print(f"check {func.__name__:<36} FAILED: {e}", flush=True)
+        else:
+            print(f"check {func.__name__:<36} ok", flush=True)
+    return failed
+
+
+def run_benchmarks(name_filter=None, quick=False, repeat=10):
+    from services.datasource import get_source, set_source
+
+    results = {}
+    for name, size, func in _CASES:
+        key = _key(name, size)
+        if name_filter and name_filter not in key:
+            continue
+        if quick and isinstance(size, int) and size > 10_000:
+            continue
+        # Cases may install their own data source; the next case gets the previous one back
+        source = get_source()
+        try:
+            run = func(size)
+            results[key] = measure(run, repeat=repeat)
+        finally:
+            set_source(source)
+        stats = results[key]
+        print(f"{key:<42} {_format_time(stats['median'])}  peak {_format_bytes(stats['peak_bytes'])}", flush=True)
+    return results
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def compare(results, baseline, threshold):
+    """Print a comparison table; returns the keys that regressed."""
+    base_results = baseline.get("results", {})
+    regressions = []
+    print()
+    print(f"{'case':<42} {'baseline':>11} {'current':>11} {'ratio':>7}  {'peak':>10}")
+    for key, stats in results.items():
+        base = base_results.get(key)
+        if not base:
+            print(f"{key:<42} {'-':>11} {_format_time(stats['min'])} {'new':>7}")
+            continue
+        # Best-of-N is far less noisy than the median for short cases
+        ratio = stats["min"] / base["min"] if base["min"] else 1.0
+        mem_ratio = (stats["peak_bytes"] + 1) / (base["peak_bytes"] + 1)
+        flag = ""
+        if ratio > threshold or mem_ratio > threshold * 2:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(
+            f"{key:<42} {_format_time(base['min'])} {_format_time(stats['min'])} {ratio:6.2f}x"
+            f"  {_format_bytes(stats['peak_bytes'])}{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the performance benchmarks")
+    parser.add_argument("--filter", default=None, help="only run cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="skip the largest sizes")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    # Back-to-back runs of the same tree differ by up to ~1.8x on shared machines
+    parser.add_argument("--threshold", type=float, default=2.0, help="allowed slowdown ratio before failing")
+    args = parser.parse_args(argv)
+
+    failed = run_checks()
+    if failed:
+        print(f"\n{len(failed)} check(s) failed: {', '.join(failed)}")
+        return 1
+    print()
+
+    results = run_benchmarks(args.filter, args.quick, args.repeat)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+    recorded_on = (baseline.get("machine"), baseline.get("python"))
+    if recorded_on != (platform.platform(), platform.python_version()):
+        # Timings only compare on like hardware; see "Benchmarks" in README.md
+        print(f"\nNote: baseline recorded on {recorded_on[0]} / Python {recorded_on[1]}, not this machine.")
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.2f}x: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
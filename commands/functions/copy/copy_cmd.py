@@ -1,8 +1,16 @@
+import asyncio
 import os
-import json
-from template.result_response import BaseResponseTemplate
+
+from prompt_toolkit.application.current import get_app_or_none
+
+from commands.registry import usage_guide
+from template.styled_line import StyledLine
 from core.theme_engine import get_current_theme_colors
-from .copy_logic import copy_last_n_pairs, export_history_to_file
+from .copy_logic import ExportProgress, copy_last_n_pairs, export_history_to_file
+
+PROGRESS_INTERVAL = 0.5
+
+_export_task = None
 
 
 def handle_copy_command(command_text, log_func, output_buffer, notification_trigger):
@@ -10,16 +18,7 @@ def handle_copy_command(command_text, log_func, output_buffer, notification_trig
 
     # 1. No arguments or Help -> Show Usage Guide (No notification)
     if len(parts) == 1 or "--help" in parts or "-h" in parts:
-        flags = {
-            "--last <1-3>": "Copy last N command-result pairs to clipboard (default: 1)",
-            "--export <path>[optional]": "Export all history to a file",
-            "-h, --help": "Show this guide",
-        }
-
-        # Generate base response
-        base_output = BaseResponseTemplate("Copy Manager", "/copy [flags]", flags)
-
-        log_func(base_output)
+        log_func(usage_guide("/copy"))
         return
 
     # 2. Export
@@ -40,10 +39,8 @@ def handle_copy_command(command_text, log_func, output_buffer, notification_trig
 
 
 def _handle_export(parts, log_func, output_buffer, notification_trigger):
-    colors = get_current_theme_colors()
-    success_color = colors.get("success", "#6A8759")
-    error_color = colors.get("error", "#CC7832")
-    
+    global _export_task
+
     user_path = None
     try:
         idx = parts.index("--export")
@@ -51,33 +48,56 @@ def _handle_export(parts, log_func, output_buffer, notification_trigger):
             user_path = parts[idx + 1]
     except ValueError:
         pass
+    compress = True if "--gzip" in parts or "-z" in parts else None
 
-    # Config handling
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    config_path = os.path.join(base_dir, "config", "settings.json")
-    config = {}
+    app = get_app_or_none()
+    if app is None or not app.is_running:
+        # No event loop to hand the work to (e.g. scripted dispatch): export inline
+        _report_export(export_history_to_file(user_path, compress), log_func, notification_trigger)
+        return
 
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Cảnh báo: Không thể đọc file config do lỗi: {e}")
+    if _export_task is not None and not _export_task.done():
+        _notify(notification_trigger, log_func, "An export is already running.", False)
+        return
+    _export_task = app.create_background_task(
+        _export_in_background(user_path, compress, log_func, notification_trigger)
+    )
+
+
+async def _export_in_background(user_path, compress, log_func, notification_trigger):
+    """Runs the export on a worker thread and reports progress while it writes."""
+    progress = ExportProgress()
+    worker = asyncio.ensure_future(asyncio.to_thread(export_history_to_file, user_path, compress, progress))
+    while not worker.done():
+        await asyncio.wait({worker}, timeout=PROGRESS_INTERVAL)
+        if not worker.done() and notification_trigger:
+            notification_trigger(
+                f"Exporting history... {progress.fraction:.0%} ({progress.written / (1024 * 1024):.1f} MB)",
+                is_success=True,
+            )
+    _report_export(worker.result(), log_func, notification_trigger)
 
-    success, message, final_path = export_history_to_file(user_path)
 
+def _report_export(outcome, log_func, notification_trigger):
+    success, message, final_path = outcome
     if success:
         abs_path = os.path.abspath(str(final_path))
-        log_func(f"[{success_color}]{abs_path}[/{success_color}]")
+        success_color = get_current_theme_colors().get("success", "#6A8759")
+        log_func(StyledLine(abs_path, success_color))
         if notification_trigger:
             notification_trigger(
                 f"Export successful! Path: {abs_path}", is_success=True
             )
     else:
-        if notification_trigger:
-            notification_trigger(message, is_success=False)
-        else:
-            log_func(f"[bold {error_color}]{message}[/bold {error_color}]")
+        _notify(notification_trigger, log_func, message, False)
+
+
+def _notify(notification_trigger, log_func, message, is_success):
+    if notification_trigger:
+        notification_trigger(message, is_success=is_success)
+    else:
+        error_color = get_current_theme_colors().get("error", "#CC7832")
+        log_func(StyledLine(message, f"bold {error_color}"))
 
 
 def _handle_last(parts, log_func, notification_trigger):
@@ -104,9 +124,9 @@ def _handle_last(parts, log_func, notification_trigger):
         if notification_trigger:
             notification_trigger("Copied successfully", is_success=True)
         else:
-            log_func(f"[{success_color}]{message}[/{success_color}]")
+            log_func(StyledLine(message, success_color))
     else:
         if notification_trigger:
             notification_trigger(message, is_success=False)
         else:
-            log_func(f"[bold {error_color}]{message}[/bold {error_color}]")
+            log_func(StyledLine(message, f"bold {error_color}"))
@@ -1,10 +1,14 @@
 import datetime
+import gzip
+import io
 import os
 
 from ui.modules.tracker.history_tracker import get_history_tracker
 from utils.clipboard_manager import copy_to_clipboard
 
 DEFAULT_LOG_PATH = os.path.join(os.path.expanduser("~"), "Documents", "mycolor", "log")
+EXPORT_BUFFER_SIZE = 1024 * 1024
+EXPORT_GZIP_LEVEL = 6
 
 
 def ensure_log_directory(path):
@@ -16,16 +20,27 @@ def ensure_log_directory(path):
         return False, str(e)
 
 
-def format_pairs_for_clipboard(pairs):
-    """Formats command-result pairs into a readable string for clipboard."""
-    if not pairs:
-        return ""
+SEPARATOR = "----------------------------------------"
+
+
+def iter_formatted_pairs(pairs):
+    """Yields the clipboard/export text for (command, result) pairs piece by piece.
+    result may be a string or an iterable of text chunks (see HistoryEntry.iter_chunks).
+    """
+    for i, (cmd, result) in enumerate(pairs):
+        if i:
+            yield "\n"
+        yield f"> {cmd}\n"
+        if isinstance(result, str):
+            yield result
+        else:
+            yield from result
+        yield f"\n{SEPARATOR}"
 
-    parts = []
-    for cmd, result in pairs:
-        parts.append(f"> {cmd}\n{result}\n----------------------------------------")
 
-    return "\n".join(parts)
+def format_pairs_for_clipboard(pairs):
+    """Formats command-result pairs into a readable string for clipboard."""
+    return "".join(iter_formatted_pairs(pairs))
 
 
 def copy_last_n_pairs(n):
@@ -38,8 +53,7 @@ def copy_last_n_pairs(n):
         return False, "No commands found in history."
 
     # Pull the last N entries
-    last_n_entries = entries[-n:]
-    pairs = [(entry["command"], entry["result"]) for entry in last_n_entries]
+    pairs = list(get_history_tracker().iter_entries(last=n))
 
     if not pairs:
         return False, "No commands found in buffer."
@@ -56,35 +70,77 @@ def copy_last_n_pairs(n):
         return False, f"Failed to copy to clipboard: {e}"
 
 
-def export_history_to_file(custom_path=None):
-    """Exports the entire history to a file.
-    Returns (success, message, file_path).
-    """
+class ExportProgress:
+    """Counters updated by an export running on a worker thread; read from the UI loop."""
+
+    def __init__(self):
+        self.written = 0
+        self.total = 0
+        self.done = False
+
+    @property
+    def fraction(self):
+        if not self.total:
+            return 0.0
+        # Totals mix characters and bytes (see HistoryTracker), so never claim 100% early
+        return min(0.99, self.written / self.total)
+
+
+def resolve_export_path(custom_path=None, compress=False):
+    """Returns (full_path, target_dir) for an export to a file or a directory."""
     target_path_str = custom_path if custom_path and custom_path.strip() else DEFAULT_LOG_PATH
     target_path = os.path.abspath(target_path_str)
 
     # Check if the provided path is a directory or a file path
     if os.path.splitext(target_path)[1]:  # It's a file path
         full_path = target_path
+        if compress and not full_path.endswith(".gz"):
+            full_path += ".gz"
         target_dir = os.path.dirname(full_path)
     else:  # It's a directory path
         target_dir = target_path
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        full_path = os.path.join(target_dir, f"session_log_{timestamp}.txt")
+        full_path = os.path.join(target_dir, f"session_log_{timestamp}.txt" + (".gz" if compress else ""))
+    return full_path, target_dir
+
+
+def _open_export(path, compress):
+    raw = gzip.open(path, "wb", compresslevel=EXPORT_GZIP_LEVEL) if compress else open(path, "wb")
+    return io.TextIOWrapper(io.BufferedWriter(raw, EXPORT_BUFFER_SIZE), encoding="utf-8")
+
+
+def export_history_to_file(custom_path=None, compress=None, progress=None):
+    """Exports the entire history to a file, streaming entry by entry.
+    compress=None gzips when the path ends in .gz. Safe to run on a worker thread;
+    progress (an ExportProgress) is updated as text is written.
+    Returns (success, message, file_path).
+    """
+    if compress is None:
+        compress = bool(custom_path) and custom_path.endswith(".gz")
+    full_path, target_dir = resolve_export_path(custom_path, compress)
 
     success, result = ensure_log_directory(target_dir)
     if not success:
         return False, f"Failed to create log directory: {result}", None
 
-    entries = get_history_tracker().get_entries()
+    tracker = get_history_tracker()
+    progress = progress or ExportProgress()
+    progress.total = tracker.total_size()
+    # Written to a side file and renamed at the end, so a failed export never leaves half a log
+    part_path = full_path + ".part"
 
     try:
-        pairs = [(entry["command"], entry["result"]) for entry in entries]
-        content = format_pairs_for_clipboard(pairs)
-
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
+        with _open_export(part_path, compress) as f:
+            for piece in iter_formatted_pairs(tracker.iter_entries()):
+                f.write(piece)
+                progress.written += len(piece)
+        os.replace(part_path, full_path)
         return True, f"History exported successfully to: {full_path}", full_path
     except Exception as e:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
         return False, f"Failed to export history: {e}", None
+    finally:
+        progress.done = True
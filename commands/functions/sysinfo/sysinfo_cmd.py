@@ -1,4 +1,6 @@
-from template.result_response import BaseResponseTemplate
+from rich.text import Text
+
+from commands.registry import usage_guide
 from core.constants import get_theme_primary, get_theme_secondary
 from .sysinfo_logic import (
     get_cpu_info,
@@ -19,7 +21,8 @@ def format_output(title, data_dict, log_to_buffer, primary_hex, secondary_hex):
 
     # Rows
     for key, value in data_dict.items():
-        log_to_buffer(f"  [white]{key}:[/white] [bold {secondary_hex}]{str(value)}[/bold {secondary_hex}]")
+        # Values come from the system (device names, paths): no markup parsing
+        log_to_buffer(Text.assemble("  ", (f"{key}:", "white"), " ", (str(value), f"bold {secondary_hex}")))
 
 def handle_sysinfo_command(log_to_buffer, command_text=""):
     parts = command_text.split()
@@ -30,19 +33,7 @@ def handle_sysinfo_command(log_to_buffer, command_text=""):
 
     if not flags or "--help" in flags or "-h" in flags:
         # Show Guide
-        log_to_buffer(BaseResponseTemplate(
-            "System Information Tool (DxDiag Style)",
-            "/sysinfo [flags]",
-            {
-                "--g": "General System Information",
-                "--cpu": "Processor Specifications",
-                "--ram": "Memory Statistics",
-                "--disk": "Storage Devices",
-                "--display": "Graphics Devices",
-                "--input": "Peripherals",
-                "-h, --help": "Show this guide"
-            }
-        ))
+        log_to_buffer(usage_guide("/sysinfo"))
         return
 
     if "--g" in flags:
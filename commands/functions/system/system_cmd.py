@@ -1,6 +1,9 @@
+from rich.text import Text
+
 from core.theme_engine import get_current_theme_colors
 
-from template.result_response import BaseResponseTemplate
+from commands.registry import usage_guide
+from template.styled_line import StyledLine
 
 from .system_logic import (
     find_processes_by_name,
@@ -52,11 +55,11 @@ def confirm_and_execute_kill(log_to_buffer, notification_trigger=None):
         notification_trigger(msg, is_success=(killed > 0))
     else:
         color = success_color if killed > 0 else error_color
-        log_to_buffer(f"[bold {color}]{msg}[/bold {color}]")
+        log_to_buffer(StyledLine(msg, f"bold {color}"))
     return True
 
 
-def handle_system_command(log_to_buffer, command_text, notification_trigger=None):
+def handle_system_command(log_to_buffer, command_text, notification_trigger=None, application_ref=None):
     parts = command_text.split()
     flags = parts[1:] if len(parts) > 1 else []
 
@@ -66,27 +69,19 @@ def handle_system_command(log_to_buffer, command_text, notification_trigger=None
     error_color = colors.get("error")
 
     if not flags or "-h" in flags or "--help" in flags:
-        log_to_buffer(BaseResponseTemplate(
-            "System Task Manager & Control",
-            "/system [flags]",
-            {
-                "--taskmgr": "Open Interactive Task Manager UI",
-                "--end-task <pid>": "Terminate a process by its Process ID (PID)",
-                "--kill <name>": "Kill all processes matching name (dry-run + confirm)",
-                "--run-new <cmd>": "Start a new process",
-                "--d <name>": "Disable a startup app",
-                "--e <name>": "Enable a startup app",
-                "-h, --help": "Show this guide"
-            }
-        ))
+        log_to_buffer(usage_guide("/system"))
         return
 
     if "--taskmgr" in flags:
+        from ui.layout.screen_manager import open_screen, prefers_window
+        # In-process screen unless a window is asked for (or there is no app to host it)
+        if "--window" not in flags and not prefers_window() and open_screen(application_ref, "taskmgr"):
+            return
         success, msg = launch_taskmgr_window()
         if success:
-            log_to_buffer(f"[bold {secondary_hex}][System] {msg}[/bold {secondary_hex}]")
+            log_to_buffer(StyledLine(f"[System] {msg}", f"bold {secondary_hex}"))
         else:
-            log_to_buffer(f"[bold {error_color}]Error: {msg}[/bold {error_color}]")
+            log_to_buffer(StyledLine(f"Error: {msg}", f"bold {error_color}"))
         return
 
     if "--end-task" in flags:
@@ -98,13 +93,13 @@ def handle_system_command(log_to_buffer, command_text, notification_trigger=None
                 notification_trigger(msg, is_success=success)
             else:
                 color = success_color if success else error_color
-                log_to_buffer(f"[bold {color}]{msg}[/bold {color}]")
+                log_to_buffer(StyledLine(msg, f"bold {color}"))
         except (IndexError, ValueError):
             error_msg = f"Error: Missing or invalid PID."
             if notification_trigger:
                 notification_trigger(error_msg, is_success=False)
             else:
-                log_to_buffer(f"[bold {error_color}]{error_msg}[/bold {error_color}]")
+                log_to_buffer(StyledLine(error_msg, f"bold {error_color}"))
         return
 
     if "--kill" in flags:
@@ -122,7 +117,7 @@ def handle_system_command(log_to_buffer, command_text, notification_trigger=None
                 if notification_trigger:
                     notification_trigger(error_msg, is_success=False)
                 else:
-                    log_to_buffer(f"[bold {error_color}]{error_msg}[/bold {error_color}]")
+                    log_to_buffer(StyledLine(error_msg, f"bold {error_color}"))
                 return
 
             colors = get_current_theme_colors()
@@ -137,11 +132,12 @@ def handle_system_command(log_to_buffer, command_text, notification_trigger=None
             log_to_buffer(f"[{primary_hex} bold]{'-' * 75}[/{primary_hex} bold]")
 
             for proc in matches:
-                row = (
-                    f"[{pid_color} bold]{proc['pid']:<8}[/{pid_color} bold]"
-                    f"[white]{proc['name']:<35}[/white]"
-                    f"[{secondary_hex}]{proc['status']:<10}[/{secondary_hex}]"
-                    f"[{secondary_hex}]{proc['memory_mb']:>12.1f}[/{secondary_hex}]"
+                # Process names are arbitrary text: build the row without markup
+                row = Text.assemble(
+                    (f"{proc['pid']:<8}", f"{pid_color} bold"),
+                    (f"{proc['name']:<35}", "white"),
+                    (f"{proc['status']:<10}", secondary_hex),
+                    (f"{proc['memory_mb']:>12.1f}", secondary_hex),
                 )
                 log_to_buffer(row)
 
@@ -161,7 +157,7 @@ def handle_system_command(log_to_buffer, command_text, notification_trigger=None
             cmd = " ".join(flags[cmd_idx:])
             success, msg = run_new_task(cmd)
             color = success_color if success else error_color
-            log_to_buffer(f"[bold {color}]{msg}[/bold {color}]")
+            log_to_buffer(StyledLine(msg, f"bold {color}"))
         except IndexError:
             log_to_buffer(f"[bold {error_color}]Error: Missing command.[/bold {error_color}]")
 
@@ -173,7 +169,7 @@ def handle_system_command(log_to_buffer, command_text, notification_trigger=None
                 name = " ".join(flags[name_idx:])
                 success, msg = set_startup_state(name, enable)
                 color = success_color if success else error_color
-                log_to_buffer(f"[bold {color}]{msg}[/bold {color}]")
+                log_to_buffer(StyledLine(msg, f"bold {color}"))
                 return
             except IndexError:
                 log_to_buffer(f"[bold {error_color}]Error: Missing app name.[/bold {error_color}]")
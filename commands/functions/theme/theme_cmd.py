@@ -1,6 +1,7 @@
 from rich.table import Table
 
-from template.result_response import BaseResponseTemplate
+from commands.registry import usage_guide
+from template.styled_line import StyledLine
 
 from .theme_logic import THEMES, set_theme, get_current_theme_colors
 
@@ -13,15 +14,7 @@ def handle_theme_command(command_text, log_to_buffer, app_ref):
     primary_hex = colors.get("primary")
 
     if len(parts) == 1 or (len(parts) == 2 and (parts[1] in ["--help", "-h"])):
-        log_to_buffer(BaseResponseTemplate(
-            "Theme Manager",
-            "/theme [flags]",
-            {
-                "--style <name>": "Set a specific theme (applied after restart)",
-                "--list": "List available themes",
-                "-h, --help": "Show this guide"
-            }
-        ))
+        log_to_buffer(usage_guide("/theme"))
     elif len(parts) == 2 and parts[1] == "--list":
         table = Table(title="Available Themes", show_header=False, box=None)
         table.add_column("Name", style=primary_hex)
@@ -31,8 +24,8 @@ def handle_theme_command(command_text, log_to_buffer, app_ref):
     elif len(parts) == 3 and parts[1] == "--style":
         style_name = parts[2]
         if set_theme(style_name):
-            log_to_buffer(f"[bold {success_color}]Theme '{style_name}' saved! Changes will be applied after restarting the application.[/bold {success_color}]")
+            log_to_buffer(StyledLine(f"Theme '{style_name}' saved! Changes will be applied after restarting the application.", f"bold {success_color}"))
         else:
-            log_to_buffer(f"[bold {error_color}]Error: Theme '{style_name}' not found. Use /theme --list to see options.[/bold {error_color}]")
+            log_to_buffer(StyledLine(f"Error: Theme '{style_name}' not found. Use /theme --list to see options.", f"bold {error_color}"))
     else:
         log_to_buffer(f"[bold {error_color}]Error: Invalid arguments. Use /theme -h or /theme --help for usage.[/bold {error_color}]")
\ No newline at end of file
@@ -7,6 +7,7 @@ from core.constants import (
     config_manager,
 )
 from core.theme_engine import get_current_theme_colors
+from commands.registry import command_summaries
 import os
 import json
 
@@ -22,15 +23,8 @@ def handle_help_command(log_to_buffer):
     log_to_buffer(f"[bold {primary_hex}]--- COMMANDS ---[/bold {primary_hex}]")
     log_to_buffer("")
 
-    command_list = [
-        ("/theme", "Switch UI color schemes (classic, matrix, cyber, darcula)"),
-        ("/sysinfo", "Display hardware specs, CPU, RAM, disk, OS info"),
-        ("/copy", "Copy history to clipboard or export to file (--export)"),
-        ("/system", "Manage processes & startup apps (Task Manager)"),
-        ("/settings", "Open Settings UI to customize shortcuts & commands"),
-        ("/clear", "Flush terminal buffer"),
-        ("/quit", "Gracefully exit the application"),
-    ]
+    # Generated from the command table; /help itself is this page
+    command_list = [(cmd, desc) for cmd, desc in command_summaries().items() if cmd != "/help"]
 
     for cmd, desc in command_list:
         log_to_buffer(f"[{table_text}]{cmd:<12}[/{table_text}] {desc}")
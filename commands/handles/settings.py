@@ -0,0 +1,30 @@
+from core.theme_engine import get_current_theme_colors
+from template.styled_line import StyledLine
+
+
+def handle_settings_command(command_text, log_to_buffer, application_ref=None):
+    colors = get_current_theme_colors()
+    primary_hex = colors.get("primary")
+    secondary_hex = colors.get("secondary")
+    error_color = colors.get("error")
+
+    if "--help" in command_text or "-h" in command_text:
+        log_to_buffer("")
+        log_to_buffer(f"[bold {primary_hex}]--- Settings UI ---[/bold {primary_hex}]")
+        log_to_buffer("")
+        log_to_buffer("[bold]Usage:[/bold] /settings \\[--window]")
+        log_to_buffer("")
+        log_to_buffer("Opens the settings screen (--window: a separate window) to manage:")
+        log_to_buffer("  - Customs: theme, logo style, tips visibility")
+        log_to_buffer("  - Shortcuts: keyboard shortcut mappings")
+        log_to_buffer("  - Commands: command aliases")
+        log_to_buffer("")
+        log_to_buffer(f"[bold {secondary_hex}]Tip: Alt+S saves changes, Alt+Q quits without saving.[/bold {secondary_hex}]")
+    else:
+        from ui.layout.screen_manager import open_screen, prefers_window
+        if "--window" not in command_text and not prefers_window() and open_screen(application_ref, "settings"):
+            return
+        from commands.functions.system.system_logic import launch_settings_window
+        success, msg = launch_settings_window()
+        color = secondary_hex if success else error_color
+        log_to_buffer(StyledLine(msg, f"bold {color}"))
@@ -1,16 +1,192 @@
-from commands.handles.help import handle_help_command
-from commands.handles.clear import handle_clear_command
-from commands.handles.quit import handle_quit_command
-from commands.functions.theme.theme_cmd import handle_theme_command
-from commands.functions.sysinfo.sysinfo_cmd import handle_sysinfo_command
-from commands.functions.system.system_cmd import (
-    handle_system_command,
-    get_pending_kill,
-    confirm_and_execute_kill,
-)
-from commands.functions.copy.copy_cmd import handle_copy_command
-from commands.functions.system.system_logic import launch_settings_window
-from core.theme_engine import get_current_theme_colors
+"""Central command table.
+
+Every slash command is declared once as a CommandSpec: its handler as a
+"module:function" path (imported on first use), the dispatch arguments it
+takes, and its flags. Dispatch, help detection, the /help page, each
+command's usage guide and the input completer are all generated from
+COMMANDS, so adding a command means adding one entry here.
+"""
+import importlib
+import sys
+
+from template.styled_line import StyledLine
+
+
+class Flag:
+    __slots__ = ("name", "description", "metavar", "aliases", "choices")
+
+    def __init__(self, name, description, metavar=None, aliases=(), choices=None):
+        self.name = name
+        self.description = description
+        self.metavar = metavar
+        self.aliases = tuple(aliases)
+        # Values offered after the flag; a callable is resolved when asked for
+        self.choices = choices
+
+    @property
+    def names(self):
+        return (self.name,) + self.aliases
+
+    @property
+    def label(self):
+        label = ", ".join(self.aliases + (self.name,)) if self.aliases else self.name
+        return f"{label} {self.metavar}" if self.metavar else label
+
+
+HELP_FLAG = Flag("--help", "Show this guide", aliases=("-h",))
+
+
+def _theme_names():
+    from core.theme_engine import THEMES
+    return list(THEMES)
+
+
+class CommandSpec:
+    """One command: where its handler lives, what it receives, and what it accepts."""
+
+    __slots__ = ("name", "handler", "args", "summary", "title", "flags", "aliases", "exact", "_func")
+
+    def __init__(self, name, handler, args, summary, title=None, flags=(), aliases=(), exact=False):
+        self.name = name
+        self.handler = handler
+        # Names of dispatch() arguments passed to the handler, in order
+        self.args = tuple(args)
+        self.summary = summary
+        self.title = title or name
+        self.flags = tuple(flags)
+        # Other words that run this command (matched case-insensitively)
+        self.aliases = tuple(aliases)
+        # Only the bare command runs it; anything longer falls through to the shell
+        self.exact = exact
+        self._func = None
+
+    @property
+    def usage(self):
+        return f"{self.name} [flags]" if self.flags else self.name
+
+    def flag_names(self):
+        return [name for flag in self.flags for name in flag.names]
+
+    def resolve(self):
+        if self._func is None:
+            module_name, func_name = self.handler.split(":")
+            self._func = getattr(importlib.import_module(module_name), func_name)
+        return self._func
+
+
+COMMANDS = [
+    CommandSpec(
+        "/theme", "commands.functions.theme.theme_cmd:handle_theme_command",
+        ("command_text", "log_to_buffer", "application_ref"),
+        "Switch UI color schemes (classic, matrix, cyber, darcula)",
+        title="Theme Manager",
+        flags=(
+            Flag("--style", "Set a specific theme (applied after restart)", metavar="<name>", choices=_theme_names),
+            Flag("--list", "List available themes"),
+            HELP_FLAG,
+        ),
+    ),
+    CommandSpec(
+        "/sysinfo", "commands.functions.sysinfo.sysinfo_cmd:handle_sysinfo_command",
+        ("log_to_buffer", "command_text"),
+        "Display hardware specs, CPU, RAM, disk, OS info",
+        title="System Information Tool (DxDiag Style)",
+        flags=(
+            Flag("--g", "General System Information"),
+            Flag("--cpu", "Processor Specifications"),
+            Flag("--ram", "Memory Statistics"),
+            Flag("--disk", "Storage Devices"),
+            Flag("--display", "Graphics Devices"),
+            Flag("--input", "Peripherals"),
+            HELP_FLAG,
+        ),
+    ),
+    CommandSpec(
+        "/copy", "commands.functions.copy.copy_cmd:handle_copy_command",
+        ("command_text", "log_to_buffer", "output_buffer", "notification_trigger"),
+        "Copy history to clipboard or export to file (--export)",
+        title="Copy Manager",
+        flags=(
+            Flag("--last", "Copy last N command-result pairs to clipboard (default: 1)",
+                 metavar="<1-3>", choices=("1", "2", "3")),
+            Flag("--export", "Export all history to a file (in the background)", metavar="<path>[optional]"),
+            Flag("--gzip", "Compress the export with gzip (implied by a .gz path)", aliases=("-z",)),
+            HELP_FLAG,
+        ),
+    ),
+    CommandSpec(
+        "/system", "commands.functions.system.system_cmd:handle_system_command",
+        ("log_to_buffer", "command_text", "notification_trigger", "application_ref"),
+        "Manage processes & startup apps (Task Manager)",
+        title="System Task Manager & Control",
+        flags=(
+            Flag("--taskmgr", "Open Interactive Task Manager UI"),
+            Flag("--window", "With --taskmgr: open it in a separate terminal window"),
+            Flag("--end-task", "Terminate a process by its Process ID (PID)", metavar="<pid>"),
+            Flag("--kill", "Kill all processes matching name (dry-run + confirm)", metavar="<name>"),
+            Flag("--run-new", "Start a new process", metavar="<cmd>"),
+            Flag("--d", "Disable a startup app", metavar="<name>"),
+            Flag("--e", "Enable a startup app", metavar="<name>"),
+            HELP_FLAG,
+        ),
+    ),
+    CommandSpec(
+        "/settings", "commands.handles.settings:handle_settings_command",
+        ("command_text", "log_to_buffer", "application_ref"),
+        "Open Settings UI to customize shortcuts & commands",
+        title="Settings UI",
+        flags=(
+            Flag("--window", "Open it in a separate terminal window"),
+            HELP_FLAG,
+        ),
+    ),
+    CommandSpec(
+        "/clear", "commands.handles.clear:handle_clear_command",
+        ("output_buffer",),
+        "Flush terminal buffer",
+        aliases=("cls", "clear"),
+        exact=True,
+    ),
+    CommandSpec(
+        "/quit", "commands.handles.quit:handle_quit_command",
+        ("application_ref",),
+        "Gracefully exit the application",
+        exact=True,
+    ),
+    CommandSpec(
+        "/help", "commands.handles.help:handle_help_command",
+        ("log_to_buffer",),
+        "Show this overview",
+        exact=True,
+    ),
+]
+
+
+def _build_index(commands):
+    index = {}
+    for spec in commands:
+        index[spec.name] = spec
+        for alias in spec.aliases:
+            index[alias.lower()] = spec
+    return index
+
+
+_BY_NAME = _build_index(COMMANDS)
+
+
+def get_command(name):
+    """The CommandSpec for a command name or alias, or None."""
+    return _BY_NAME.get(name) or _BY_NAME.get(name.lower())
+
+
+def _lookup(command_text):
+    head = command_text.split(None, 1)[0] if command_text else ""
+    spec = get_command(head) if head else None
+    if spec is None:
+        return None
+    if spec.exact and command_text != spec.name and command_text.lower() not in spec.aliases:
+        return None
+    return spec
 
 
 def dispatch(
@@ -20,94 +196,66 @@ def dispatch(
     application_ref,
     notification_trigger=None,
 ):
-    colors = get_current_theme_colors()
-    success_color = colors.get("success")
-    error_color = colors.get("error")
-    primary_hex = colors.get("primary")
-    secondary_hex = colors.get("secondary")
-
-    if command_text == "/quit":
-        application_ref.exit()
-        return True
-
-    elif command_text.startswith("/theme"):
-        handle_theme_command(command_text, log_to_buffer, application_ref)
-        return True
-
-    elif command_text.startswith("/sysinfo"):
-        handle_sysinfo_command(log_to_buffer, command_text)
-        return True
-
-    elif command_text.startswith("/system"):
-        handle_system_command(log_to_buffer, command_text, notification_trigger)
-        return True
-
-    elif command_text == "/help":
-        handle_help_command(log_to_buffer)
-        return True
-
-    elif command_text.startswith("/settings"):
-        if "--help" in command_text or "-h" in command_text:
-            log_to_buffer("")
-            log_to_buffer(f"[bold {primary_hex}]--- Settings UI ---[/bold {primary_hex}]")
-            log_to_buffer("")
-            log_to_buffer("[bold]Usage:[/bold] /settings")
-            log_to_buffer("")
-            log_to_buffer("Opens a standalone window to manage:")
-            log_to_buffer("  - Customs: theme, logo style, tips visibility")
-            log_to_buffer("  - Shortcuts: keyboard shortcut mappings")
-            log_to_buffer("  - Commands: command aliases")
-            log_to_buffer("")
-            log_to_buffer(f"[bold {secondary_hex}]Tip: Alt+S saves changes, Alt+Q quits without saving.[/bold {secondary_hex}]")
-        else:
-            success, msg = launch_settings_window()
-            color = secondary_hex if success else error_color
-            log_to_buffer(f"[bold {color}]{msg}[/bold {color}]")
-        return True
-
-    elif command_text.startswith("/copy"):
-        handle_copy_command(
-            command_text,
-            log_to_buffer,
-            output_buffer,
-            notification_trigger,
-        )
-        return True
-
-    elif command_text == "/clear" or command_text.lower() in ("cls", "clear"):
-        handle_clear_command(output_buffer)
-        return True
-
-    return False
+    spec = _lookup(command_text)
+    if spec is None:
+        return False
+
+    context = {
+        "command_text": command_text,
+        "log_to_buffer": log_to_buffer,
+        "output_buffer": output_buffer,
+        "application_ref": application_ref,
+        "notification_trigger": notification_trigger,
+    }
+    spec.resolve()(*(context[arg] for arg in spec.args))
+    return True
 
 
 def check_pending_confirmation(command_text: str, log_to_buffer):
-    pending = get_pending_kill()
-    if pending:
-        cmd_lower = command_text.lower().strip()
-        if cmd_lower in ("y", "yes"):
-            confirm_and_execute_kill(log_to_buffer)
-            return True
-        else:
-            log_to_buffer("[bold yellow]Operation aborted by user.[/bold yellow]")
-            return True
-    return False
+    # A kill can only be pending once /system has been loaded; don't import it just to ask
+    system_cmd = sys.modules.get("commands.functions.system.system_cmd")
+    if system_cmd is None or not system_cmd.get_pending_kill():
+        return False
+    cmd_lower = command_text.lower().strip()
+    if cmd_lower in ("y", "yes"):
+        system_cmd.confirm_and_execute_kill(log_to_buffer)
+    else:
+        log_to_buffer(StyledLine("Operation aborted by user.", "bold yellow"))
+    return True
 
 
 def is_help_request(command_text: str) -> bool:
-    help_patterns = [
-        ("/theme", [" -h ", " -h", " --help", " --help"]),
-        ("/system", [" -h ", " -h", " --help", " --help"]),
-        ("/sysinfo", [" -h ", " -h", " --help", " --help"]),
-        ("/copy", [" -h ", " -h", " --help", " --help"]),
-    ]
-
-    for prefix, suffixes in help_patterns:
-        if command_text.startswith(prefix):
-            for suffix in suffixes:
-                if suffix in command_text:
-                    return True
-            if command_text == prefix + " -h" or command_text == prefix + " --help":
-                return True
-
-    return False
\ No newline at end of file
+    spec = _lookup(command_text.strip())
+    if spec is None:
+        return False
+    return any(part in HELP_FLAG.names for part in command_text.split()[1:])
+
+
+def usage_guide(name):
+    """The BaseResponseTemplate usage page for a command, built from its declared flags."""
+    from template.result_response import BaseResponseTemplate
+    spec = _BY_NAME[name]
+    return BaseResponseTemplate(spec.title, spec.usage, {flag.label: flag.description for flag in spec.flags})
+
+
+def command_flags():
+    """{command: [flag names]} for completion."""
+    return {spec.name: spec.flag_names() for spec in COMMANDS}
+
+
+def command_summaries():
+    """{command: one-line summary}, shown next to completions and on /help."""
+    return {spec.name: spec.summary for spec in COMMANDS}
+
+
+def flag_choices():
+    """{(command, flag name): [values]} for completion."""
+    choices = {}
+    for spec in COMMANDS:
+        for flag in spec.flags:
+            if flag.choices is None:
+                continue
+            values = list(flag.choices() if callable(flag.choices) else flag.choices)
+            for name in flag.names:
+                choices[(spec.name, name)] = values
+    return choices
@@ -22,7 +22,40 @@ DEFAULT_SETTINGS = {
     "hide_system_exes": [],
     "taskmgr": {
         "process_limit": 20,
-        "exclude_system_apps": True
+        "exclude_system_apps": True,
+        "ram_extended": False,
+        "gpu_backend": "auto",
+        "gpu_probe_timeout": 2.0,
+        "adaptive_sampling": True,
+        "sampling_cpu_budget": 0.02,
+        "max_sample_interval": 30.0,
+        "history_persist": True,
+        "history_dir": "",
+        "history_retention": 86400,
+        "history_segment_bytes": 1048576,
+        "history_segment_age": 3600,
+        "history_max_bytes": 33554432,
+        "metrics_server": False,
+        "metrics_host": "127.0.0.1",
+        "metrics_port": 9464,
+        "show_profiler": False,
+        "data_source": "psutil",
+        "synthetic": {}
+    },
+    "session_history": {
+        "max_entries": 10,
+        "max_bytes": 67108864,
+        "spill_bytes": 1048576,
+        "spill_dir": ""
+    },
+    "command_history": {
+        "persist": True,
+        "path": "",
+        "max_entries": 100000
+    },
+    "screens": {
+        "open_in": "app",
+        "preload": True
     },
     "customs": {
         "theme": "matrix",
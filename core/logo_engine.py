@@ -1,4 +1,6 @@
 import io
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 from rich.align import Align
@@ -8,14 +10,19 @@ from rich.style import Style
 from rich.text import Text
 
 from core.config_manager import get_manager
-from core.theme_engine import get_current_theme_colors
-from ui.styles.logo_styles import LOGO_STYLES_RAW
+from core.theme_engine import get_current_theme_colors, get_current_theme_name, get_theme_colors, get_theme_version
+from ui.styles.logo_styles import LOGO_STYLES_RAW, get_configured_logo_style
 
 
 LOGO_WORD = "MYCOLOR"
 LOGO_HEIGHT = 7
 CHAR_SPACING = 2
 
+# Rendered logos by (style, theme, theme version, width, shadow); a resize costs one miss per new width
+LOGO_CACHE_SIZE = 32
+_logo_cache: "OrderedDict[tuple, Text]" = OrderedDict()
+_logo_cache_lock = threading.Lock()
+
 
 def _parse_hex6(hex_str: str) -> tuple[int, int, int]:
     s = hex_str.lstrip("#")
@@ -45,6 +52,39 @@ def _get_hex(s) -> str:
     return "#A9B7C6"
 
 
+def _style_pool(bg_hex: str):
+    """Style per foreground colour on bg_hex; equal colours share one object, so their cells merge into one span."""
+    bg = Color.parse(bg_hex)
+    pool = {None: Style(bgcolor=bg)}
+
+    def style_for(fg):
+        style = pool.get(fg)
+        if style is None:
+            style = pool[fg] = Style(color=Color.parse(fg), bgcolor=bg)
+        return style
+    return style_for
+
+
+def _grid_to_text(grid) -> Text:
+    """Rows of (char, style) cells to a Text with one span per run of identical style."""
+    result = Text()
+    last = len(grid) - 1
+    for y, row in enumerate(grid):
+        run_style = None
+        run_chars = []
+        for ch, style in row:
+            if style is not run_style and run_chars:
+                result.append("".join(run_chars), style=run_style)
+                run_chars = []
+            run_style = style
+            run_chars.append(ch)
+        if run_chars:
+            result.append("".join(run_chars), style=run_style)
+        if y < last:
+            result.append("\n")
+    return result
+
+
 class LogoEngine:
     _instance = None
 
@@ -55,11 +95,7 @@ class LogoEngine:
 
     @staticmethod
     def get_logo_style():
-        cfg = get_manager()
-        style = cfg.get_nested("customs", "logo_style", default="gradient")
-        if isinstance(style, str):
-            return style
-        return "gradient"
+        return get_configured_logo_style()
 
     @staticmethod
     def set_logo_style(style: str) -> bool:
@@ -73,18 +109,35 @@ class LogoEngine:
         return list(LOGO_STYLES_RAW.keys())
 
     @staticmethod
-    def render_logo(width: int) -> Text:
-        style_name = LogoEngine.get_logo_style()
-        colors = get_current_theme_colors()
-        style_cfg = LOGO_STYLES_RAW.get(style_name, LOGO_STYLES_RAW["gradient"])
+    def render_logo(width: int, shadow: bool = True, style_name: Optional[str] = None,
+                    theme_name: Optional[str] = None) -> Text:
+        style_name = style_name or LogoEngine.get_logo_style()
+        theme_name = theme_name or get_current_theme_name()
+        key = (style_name, theme_name, get_theme_version(), width, shadow)
+        with _logo_cache_lock:
+            cached = _logo_cache.get(key)
+            if cached is not None:
+                _logo_cache.move_to_end(key)
+        if cached is None:
+            colors = get_theme_colors(theme_name)
+            style_cfg = LOGO_STYLES_RAW.get(style_name, LOGO_STYLES_RAW["gradient"])
+            if style_name == "minimal":
+                cached = LogoEngine._render_minimal(width, colors, style_cfg)
+            elif style_name == "dither":
+                cached = LogoEngine._render_dither(width, colors, style_cfg, shadow)
+            else:
+                cached = LogoEngine._render_gradient(width, colors, style_cfg, shadow)
+            with _logo_cache_lock:
+                _logo_cache[key] = cached
+                while len(_logo_cache) > LOGO_CACHE_SIZE:
+                    _logo_cache.popitem(last=False)
+        # Shared between callers: wrap it (Align, Group) but don't append to it
+        return cached
 
-        if style_name == "gradient":
-            return LogoEngine._render_gradient(width, colors, style_cfg)
-        elif style_name == "minimal":
-            return LogoEngine._render_minimal(width, colors, style_cfg)
-        elif style_name == "dither":
-            return LogoEngine._render_dither(width, colors, style_cfg)
-        return LogoEngine._render_gradient(width, colors, style_cfg)
+    @staticmethod
+    def clear_cache():
+        with _logo_cache_lock:
+            _logo_cache.clear()
 
     @staticmethod
     def _calc_geometry(logo_word: str, logo_map: dict, spacing: int) -> tuple[int, int]:
@@ -96,7 +149,7 @@ class LogoEngine:
         return total_w, LOGO_HEIGHT
 
     @staticmethod
-    def _render_gradient(width: int, colors: dict, style_cfg: dict) -> Text:
+    def _render_gradient(width: int, colors: dict, style_cfg: dict, shadow: bool = True) -> Text:
         logo_map = style_cfg["logo_map"]
         logo_char = style_cfg["logo_char"]
         shadow_char = style_cfg["shadow_char"]
@@ -132,9 +185,11 @@ class LogoEngine:
             sub = (ratio - idx * seg) / seg if seg > 0 else 0
             return interpolate_hex(gradient_hex[idx], gradient_hex[idx + 1], sub)
 
-        bg_style = Style(bgcolor=Color.parse(bg_hex))
-        grid = [[(" ", bg_style) for _ in range(width)] for _ in range(height)]
+        style_for = _style_pool(bg_hex)
+        # Gradient LUT: one cell per logo column, filled the first time the column is lit
+        column_cells = {}
 
+        lit = []
         cx = 0
         for ch in LOGO_WORD:
             pixels = logo_map.get(ch.upper(), [])
@@ -143,47 +198,30 @@ class LogoEngine:
                 continue
             char_w = len(pixels[0])
             for y in range(height):
+                row = pixels[y]
                 for x in range(char_w):
-                    if pixels[y][x] != " ":
+                    if row[x] != " ":
                         gx = cx + x
-                        ratio = gx / (total_w - 1) if total_w > 1 else 0.5
-                        color = get_color(ratio)
-                        style = Style(color=Color.parse(color), bgcolor=Color.parse(bg_hex))
                         gx2 = start_x + gx
                         if 0 <= gx2 < width:
-                            grid[y][gx2] = (logo_char, style)
+                            cell = column_cells.get(gx)
+                            if cell is None:
+                                ratio = gx / (total_w - 1) if total_w > 1 else 0.5
+                                cell = column_cells[gx] = (logo_char, style_for(get_color(ratio)))
+                            lit.append((y, gx2, cell))
             cx += char_w + CHAR_SPACING
 
-        shadow_off_x, shadow_off_y = 1, 1
-        buf_h = height + shadow_off_y
-        buf_w = width
-        final_grid = [[(" ", bg_style) for _ in range(buf_w)] for _ in range(buf_h)]
-
-        shadow_style = Style(color=Color.parse(shadow_hex), bgcolor=Color.parse(bg_hex))
-        for y in range(height):
-            for x in range(width):
-                ch, _ = grid[y][x]
-                if ch != " ":
-                    sx = x + shadow_off_x
-                    sy = y + shadow_off_y
-                    if 0 <= sx < buf_w and 0 <= sy < buf_h:
-                        final_grid[sy][sx] = (shadow_char, shadow_style)
-
-        for y in range(height):
-            for x in range(width):
-                ch, st = grid[y][x]
-                if ch != " ":
-                    if 0 <= x < buf_w:
-                        final_grid[y][x] = (ch, st)
-
-        result = Text()
-        for y in range(buf_h):
-            for x in range(buf_w):
-                ch, st = final_grid[y][x]
-                result.append(ch, style=st)
-            if y < buf_h - 1:
-                result.append("\n")
-        return result
+        buf_h = height + 1 if shadow else height
+        blank = (" ", style_for(None))
+        final_grid = [[blank] * width for _ in range(buf_h)]
+        if shadow:
+            shadow_cell = (shadow_char, style_for(shadow_hex))
+            for y, x, _ in lit:
+                if x + 1 < width:
+                    final_grid[y + 1][x + 1] = shadow_cell
+        for y, x, cell in lit:
+            final_grid[y][x] = cell
+        return _grid_to_text(final_grid)
 
     @staticmethod
     def _render_minimal(width: int, colors: dict, style_cfg: dict) -> Text:
@@ -195,9 +233,10 @@ class LogoEngine:
         total_w, height = LogoEngine._calc_geometry(LOGO_WORD, logo_map, CHAR_SPACING)
         start_x = max(0, (width - total_w) // 2)
 
-        bg_style = Style(bgcolor=Color.parse(bg_hex))
-        ch_style = Style(color=Color.parse(primary), bgcolor=Color.parse(bg_hex))
-        grid = [[(" ", bg_style) for _ in range(width)] for _ in range(height)]
+        style_for = _style_pool(bg_hex)
+        blank = (" ", style_for(None))
+        lit_cell = (logo_char, style_for(primary))
+        grid = [[blank] * width for _ in range(height)]
 
         cx = 0
         for ch in LOGO_WORD:
@@ -211,20 +250,13 @@ class LogoEngine:
                     if pixels[y][x] != " ":
                         gx = start_x + cx + x
                         if 0 <= gx < width:
-                            grid[y][gx] = (logo_char, ch_style)
+                            grid[y][gx] = lit_cell
             cx += char_w + CHAR_SPACING
 
-        result = Text()
-        for y in range(height):
-            for x in range(width):
-                ch, st = grid[y][x]
-                result.append(ch, style=st)
-            if y < height - 1:
-                result.append("\n")
-        return result
+        return _grid_to_text(grid)
 
     @staticmethod
-    def _render_dither(width: int, colors: dict, style_cfg: dict) -> Text:
+    def _render_dither(width: int, colors: dict, style_cfg: dict, shadow: bool = True) -> Text:
         logo_lines = style_cfg["logo_lines"]
         shadow_char = "▓"
         bg_hex = colors.get("background", "#2B2B2B")
@@ -235,48 +267,37 @@ class LogoEngine:
         logo_w = max(len(line) for line in logo_lines) if logo_lines else 0
         start_x = max(0, (width - logo_w) // 2)
 
-        bg_style = Style(bgcolor=Color.parse(bg_hex))
-        primary_style = Style(color=Color.parse(primary_hex), bgcolor=Color.parse(bg_hex))
-        dither_style = Style(color=Color.parse(shadow_hex), bgcolor=Color.parse(bg_hex))
+        style_for = _style_pool(bg_hex)
+        primary_style = style_for(primary_hex)
 
-        buf_h = height + 1
+        buf_h = height + 1 if shadow else height
         buf_w = width
-        final_grid = [[(" ", bg_style) for _ in range(buf_w)] for _ in range(buf_h)]
-
-        # 1. Create a mask of where the main logo will be
-        logo_mask = [[False for _ in range(buf_w)] for _ in range(buf_h)]
-        for y, line in enumerate(logo_lines):
-            for x, ch in enumerate(line):
-                if ch != " ":
-                    gx = start_x + x
-                    if 0 <= gx < buf_w:
-                        logo_mask[y][gx] = True
-
-        # 2. Draw dithered shadow (shifted down and right by 1) only where logo won't overlap
-        for y, line in enumerate(logo_lines):
-            for x, ch in enumerate(line):
-                if ch != " ":
-                    sx = start_x + x + 1
-                    sy = y + 1
-                    if 0 <= sx < buf_w and 0 <= sy < buf_h and not logo_mask[sy][sx]:
-                        final_grid[sy][sx] = (shadow_char, dither_style)
+        final_grid = [[(" ", style_for(None))] * buf_w for _ in range(buf_h)]
 
-        # 3. Draw main logo (block-text art using original characters)
+        # 1. Lit cells of the main logo (block-text art using original characters)
+        lit = []
         for y, line in enumerate(logo_lines):
             for x, ch in enumerate(line):
                 if ch != " ":
                     gx = start_x + x
                     if 0 <= gx < buf_w:
-                        final_grid[y][gx] = (ch, primary_style)
-
-        result = Text()
-        for y in range(buf_h):
-            for x in range(buf_w):
-                ch, st = final_grid[y][x]
-                result.append(ch, style=st)
-            if y < buf_h - 1:
-                result.append("\n")
-        return result
+                        lit.append((y, gx, ch))
+
+        # 2. Dithered shadow (shifted down and right by 1); the logo is drawn over it
+        if shadow:
+            shadow_cell = (shadow_char, style_for(shadow_hex))
+            for y, line in enumerate(logo_lines):
+                for x, ch in enumerate(line):
+                    if ch != " ":
+                        sx = start_x + x + 1
+                        if 0 <= sx < buf_w:
+                            final_grid[y + 1][sx] = shadow_cell
+
+        # 3. Main logo
+        for y, x, ch in lit:
+            final_grid[y][x] = (ch, primary_style)
+
+        return _grid_to_text(final_grid)
 
 
 def get_logo_renderable(width: int):
@@ -0,0 +1,101 @@
+"""Import-time and first-frame profiling for `app/myworld.py --profile-startup`.
+
+StartupProfiler sits first on sys.meta_path and wraps each module's loader,
+so every import executed after install() is timed (inclusive, and self time
+with nested imports subtracted), much like `python -X importtime` but usable
+from inside the app. mark() records milestones such as the first frame, all
+relative to the moment myworld.py started executing.
+"""
+import json
+import sys
+from importlib.abc import Loader, MetaPathFinder
+from time import perf_counter
+
+REPORT_TOP = 25
+
+
+class _TimedLoader(Loader):
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._timed(module.__name__, self._loader.exec_module, module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class StartupProfiler(MetaPathFinder):
+    def __init__(self, start=None):
+        self.start = perf_counter() if start is None else start
+        # name -> (inclusive seconds, self seconds)
+        self.modules = {}
+        self.marks = []
+        self._stack = []
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def _timed(self, name, exec_module, module):
+        frame = [0.0]  # time spent in nested imports
+        self._stack.append(frame)
+        started = perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            elapsed = perf_counter() - started
+            self._stack.pop()
+            self.modules[name] = (elapsed, elapsed - frame[0])
+            if self._stack:
+                self._stack[-1][0] += elapsed
+
+    def mark(self, label):
+        """Record a milestone, in seconds since start."""
+        self.marks.append((label, perf_counter() - self.start))
+
+    def to_dict(self):
+        return {
+            "marks": {label: seconds for label, seconds in self.marks},
+            "modules": {name: {"inclusive": inc, "self": own} for name, (inc, own) in self.modules.items()},
+        }
+
+    def report(self, stream=None, top=REPORT_TOP):
+        stream = stream or sys.stderr
+        print("Startup profile (ms since myworld.py started)", file=stream)
+        for label, seconds in self.marks:
+            print(f"  {label:<28} {seconds * 1e3:9.1f}", file=stream)
+        total_self = sum(own for _, own in self.modules.values())
+        print(f"\n{len(self.modules)} modules imported, {total_self * 1e3:.1f} ms executing them", file=stream)
+        print(f"\n  {'self ms':>9} {'incl ms':>9}  module (top {top} by self time)", file=stream)
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (inclusive, own) in ranked[:top]:
+            print(f"  {own * 1e3:9.2f} {inclusive * 1e3:9.2f}  {name}", file=stream)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
@@ -1,6 +1,8 @@
 import json
 import os
 import sys
+import threading
+from types import MappingProxyType
 
 from prompt_toolkit.styles import Style as PTStyle
 
@@ -122,6 +124,30 @@ _current_theme_name = DEFAULT_THEME
 _current_theme = THEMES.get(_current_theme_name, THEMES[DEFAULT_THEME])
 _config_manager = None
 
+# Resolved palettes per theme name; handed out read-only so callers can't corrupt them
+_palette_cache = {}
+_palette_lock = threading.Lock()
+# Bumped on every theme change; render caches include it in their keys
+_theme_version = 0
+# Compiled prompt_toolkit styles per theme name
+_style_cache = {}
+
+# Semantic roles for renderers that emit (style, text) fragments instead of Rich
+# markup; the class names are fixed and each theme's style supplies the colours.
+STYLE_ROLES = {
+    "header": "class:table.header",
+    "header.key": "class:table.header.key",
+    "header.metric": "class:table.header.metric",
+    "pid": "class:table.pid",
+    "name": "class:table.name",
+    "user": "class:table.user",
+    "count": "class:table.count",
+    "metric": "class:table.metric",
+    "memory": "class:table.memory",
+    "selected": "class:table.selected",
+    "dim": "class:table.dim",
+}
+
 
 def _get_project_root():
     if getattr(sys, "frozen", False):
@@ -165,17 +191,28 @@ def _ensure_loaded():
         _current_theme = THEMES[theme_from_config]
 
 
+def _switch_theme(theme_name):
+    global _current_theme_name, _current_theme, _theme_version
+    _current_theme_name = theme_name
+    _current_theme = THEMES[theme_name]
+    _theme_version += 1
+
+
+def get_theme_version():
+    """Counter that changes whenever the active theme does."""
+    _ensure_loaded()
+    return _theme_version
+
+
 def get_current_theme_name():
     _ensure_loaded()
     return _current_theme_name
 
 
 def set_theme(theme_name: str, save: bool = True) -> bool:
-    global _current_theme_name, _current_theme
     _ensure_loaded()
     if theme_name in THEMES:
-        _current_theme_name = theme_name
-        _current_theme = THEMES[theme_name]
+        _switch_theme(theme_name)
         if save:
             _save_theme_to_config(theme_name)
         return True
@@ -197,18 +234,34 @@ def get_current_theme():
 
 
 def apply_theme(theme_name: str) -> bool:
-    global _current_theme_name, _current_theme
     _ensure_loaded()
     if theme_name in THEMES:
-        _current_theme_name = theme_name
-        _current_theme = THEMES[theme_name]
+        _switch_theme(theme_name)
         return True
     return False
 
 
 def get_current_theme_colors():
+    """Resolved palette of the active theme, as a read-only mapping computed once per theme."""
     _ensure_loaded()
-    theme = _current_theme
+    return get_theme_colors(_current_theme_name)
+
+
+def get_theme_colors(name):
+    """Resolved palette of any theme in THEMES (unknown names fall back to the default)."""
+    if name not in THEMES:
+        name = DEFAULT_THEME
+    palette = _palette_cache.get(name)
+    if palette is None:
+        with _palette_lock:
+            palette = _palette_cache.get(name)
+            if palette is None:
+                palette = MappingProxyType(_resolve_colors(THEMES[name]))
+                _palette_cache[name] = palette
+    return palette
+
+
+def _resolve_colors(theme):
     primary_hex = get_pt_color_hex(theme.get("primary"))
     secondary_hex = get_pt_color_hex(theme.get("secondary"))
     return {
@@ -259,31 +312,65 @@ def get_pt_color_hex(rich_style) -> str:
     return "#c0c0c0"
 
 
+def get_role_rules(colors=None):
+    """Style rules for STYLE_ROLES under the given (default: current) palette."""
+    colors = colors or get_current_theme_colors()
+    accent = colors["accent"]
+    return {
+        "table.header": f"fg:{colors['table_text']} bold",
+        "table.header.key": f"fg:{colors['primary']} bold",
+        "table.header.metric": f"fg:{accent} bold",
+        "table.pid": f"fg:{colors['primary']}",
+        "table.name": f"fg:{colors['table_text']}",
+        "table.user": f"fg:{colors['primary']}",
+        "table.count": f"fg:{colors['secondary']}",
+        "table.metric": f"fg:{colors['secondary']}",
+        "table.memory": f"fg:{accent}",
+        "table.selected": f"bg:{colors['suggestion_bg']}",
+        "table.dim": f"fg:{colors['dim_text']}",
+    }
+
+
+def get_cached_style(key, build):
+    """Compile a style once per (key, theme); build() returns the rule dict."""
+    _ensure_loaded()
+    cache_key = (key, _current_theme_name)
+    style = _style_cache.get(cache_key)
+    if style is None:
+        rules = dict(get_role_rules())
+        rules.update(build())
+        style = PTStyle.from_dict(rules)
+        _style_cache[cache_key] = style
+    return style
+
+
 def get_app_style():
+    return get_cached_style("app", _app_style_rules)
+
+
+def _app_style_rules():
     _ensure_loaded()
     theme = _current_theme
     primary_hex = get_pt_color_hex(theme["primary"])
     suggestion_bg = theme.get("suggestion_bg", "#21262d")
-    return PTStyle.from_dict(
-        {
-            "app-background": f"bg:{theme['background']}",
-            "input-field": f"bg:{theme['background']} fg:{primary_hex}",
-            "input-field text": f"bg:{theme['background']} fg:{primary_hex}",
-            "input-border": f"fg:{primary_hex} bg:{theme['background']}",
-            "frame.border": f"fg:{primary_hex} bg:{theme['background']}",
-            "prompt-prefix": f"fg:{primary_hex} bold",
-            "placeholder": "fg:#666666 italic",
-            "path": f"bg:{theme['background']} fg:#666666 italic",
-            "sep": f"bg:{theme['background']} fg:#444444",
-            "pc": f"bg:{theme['background']} fg:#666666 italic",
-            "footer-pad": f"bg:{theme['background']}",
-            "footer-divider": "fg:#444444",
-            "completion-menu": f"bg:{suggestion_bg}",
-            "completion-menu.completion": f"bg:{suggestion_bg} fg:{primary_hex}",
-            "completion-menu.completion.current": f"bg:{primary_hex} fg:#000000",
-            "scrollbar": f"bg:{theme['background']}",
-            "popup-menu": f"bg:{suggestion_bg} fg:{primary_hex}",
-            "popup-item": "fg:#BBBBBB",
-            "popup-selected": f"bg:{primary_hex} fg:#000000 bold",
-        }
-    )
\ No newline at end of file
+    return {
+        "app-background": f"bg:{theme['background']}",
+        "input-field": f"bg:{theme['background']} fg:{primary_hex}",
+        "input-field text": f"bg:{theme['background']} fg:{primary_hex}",
+        "input-border": f"fg:{primary_hex} bg:{theme['background']}",
+        "frame.border": f"fg:{primary_hex} bg:{theme['background']}",
+        "prompt-prefix": f"fg:{primary_hex} bold",
+        "placeholder": "fg:#666666 italic",
+        "path": f"bg:{theme['background']} fg:#666666 italic",
+        "sep": f"bg:{theme['background']} fg:#444444",
+        "pc": f"bg:{theme['background']} fg:#666666 italic",
+        "footer-pad": f"bg:{theme['background']}",
+        "footer-divider": "fg:#444444",
+        "completion-menu": f"bg:{suggestion_bg}",
+        "completion-menu.completion": f"bg:{suggestion_bg} fg:{primary_hex}",
+        "completion-menu.completion.current": f"bg:{primary_hex} fg:#000000",
+        "scrollbar": f"bg:{theme['background']}",
+        "popup-menu": f"bg:{suggestion_bg} fg:{primary_hex}",
+        "popup-item": "fg:#BBBBBB",
+        "popup-selected": f"bg:{primary_hex} fg:#000000 bold",
+    }
@@ -0,0 +1,366 @@
+"""System data sources for the task manager.
+
+Collectors call get_source() instead of importing psutil directly. The default
+source is the psutil module itself; the synthetic source implements the same
+subset of its API (cpu_percent, virtual_memory, swap_memory, net_io_counters,
+process_iter, pids, boot_time) with generated load, so the task manager and the
+benchmarks can run at 5,000 processes or 10 Gbit/s on any machine. Synthetic
+processes raise psutil's own exception classes, so existing except clauses
+keep working.
+
+Selected by taskmgr.data_source, or the MYCOLOR_DATA_SOURCE environment
+variable: "psutil", "synthetic", or "trace:<path>" to replay an NDJSON trace
+recorded with app/taskmgr_headless.py.
+"""
+import json
+import math
+import os
+import random
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from time import monotonic, time
+
+from core.constants import config_manager
+
+VirtualMemory = namedtuple("VirtualMemory", "total available percent used free buffers cached")
+SwapMemory = namedtuple("SwapMemory", "total used free percent sin sout")
+NetIO = namedtuple("NetIO", "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout")
+
+PROCESS_NAMES = [
+    "chrome.exe", "code.exe", "python.exe", "node.exe", "svchost.exe", "explorer.exe",
+    "postgres.exe", "java.exe", "Teams.exe", "OneDrive.exe", "RuntimeBroker.exe", "dwm.exe",
+]
+PROCESS_USERS = ["user", "SYSTEM", "LOCAL SERVICE", "NETWORK SERVICE"]
+
+
+class SyntheticProcess:
+    def __init__(self, source, pid, name, username, exe, threads, handles, base_cpu, memory):
+        self._source = source
+        self.pid = pid
+        self._name = name
+        self._username = username
+        self._exe = exe
+        self._threads = threads
+        self._handles = handles
+        self._base_cpu = base_cpu
+        self._memory = memory
+        self.info = {}
+
+    def _check(self):
+        import psutil
+        if self.pid not in self._source._processes:
+            raise psutil.NoSuchProcess(self.pid, self._name)
+
+    @contextmanager
+    def oneshot(self):
+        yield
+
+    def name(self):
+        return self._name
+
+    def username(self):
+        return self._username
+
+    def exe(self):
+        return self._exe
+
+    def cpu_percent(self, interval=None):
+        self._check()
+        return min(100.0, self._base_cpu * self._source._load_factor)
+
+    def memory_percent(self):
+        self._check()
+        return self._memory
+
+    def num_threads(self):
+        self._check()
+        return self._threads
+
+    def num_handles(self):
+        self._check()
+        return self._handles
+
+    def as_dict(self, attrs=None, ad_value=None):
+        values = {
+            "pid": self.pid,
+            "name": self._name,
+            "username": self._username,
+            "exe": self._exe,
+            "num_threads": self._threads,
+            "num_handles": self._handles,
+            "cpu_percent": self._base_cpu * self._source._load_factor,
+            "memory_percent": self._memory,
+        }
+        if attrs is None:
+            return values
+        return {a: values.get(a, ad_value) for a in attrs}
+
+
+class SyntheticSource:
+    """Generated load: process churn, a CPU curve with bursts, and bursty network traffic.
+
+    State advances with the clock (monotonic by default, injectable for
+    deterministic tests); all randomness comes from one seeded RNG.
+    """
+
+    def __init__(self, process_count=500, churn_per_second=5.0, cpu_base=25.0, cpu_amplitude=20.0,
+                 cpu_period=60.0, cpu_burst_chance=0.05, memory_total=16 * 1024 ** 3, memory_percent=55.0,
+                 net_base_bps=2 * 1024 ** 2, net_burst_bps=1.25 * 1024 ** 3, net_burst_chance=0.1,
+                 seed=42, clock=None):
+        self.process_count = int(process_count)
+        self.churn_per_second = churn_per_second
+        self.cpu_base = cpu_base
+        self.cpu_amplitude = cpu_amplitude
+        self.cpu_period = cpu_period
+        self.cpu_burst_chance = cpu_burst_chance
+        self.memory_total = memory_total
+        self.memory_percent = memory_percent
+        self.net_base_bps = net_base_bps
+        self.net_burst_bps = net_burst_bps
+        self.net_burst_chance = net_burst_chance
+        self.clock = clock or monotonic
+
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._start = self.clock()
+        self._last_advance = self._start
+        self._boot_time = time() - 3600 * 5
+        self._next_pid = 4
+        self._processes = {}
+        self._churn_debt = 0.0
+        self._cpu = cpu_base
+        self._net_down = net_base_bps
+        self._net_up = net_base_bps / 4
+        self._bytes_recv = 0.0
+        self._bytes_sent = 0.0
+        self._swap_in = 0.0
+        self._swap_out = 0.0
+        self._load_factor = 1.0
+        for _ in range(self.process_count):
+            self._spawn()
+
+    def _spawn(self):
+        rnd = self._rng
+        pid = self._next_pid
+        self._next_pid += 4
+        name = rnd.choice(PROCESS_NAMES)
+        user = rnd.choice(PROCESS_USERS)
+        exe = ("C:\\Windows\\System32\\" if user != "user" else "C:\\Program Files\\App\\") + name
+        self._processes[pid] = SyntheticProcess(
+            self, pid, name, user, exe,
+            threads=rnd.randint(1, 120),
+            handles=rnd.randint(20, 4000),
+            base_cpu=rnd.expovariate(1.0 / 0.5),
+            memory=rnd.expovariate(1.0 / 0.3),
+        )
+
+    # Curves; the trace source overrides these
+    def _cpu_at(self, elapsed):
+        value = self.cpu_base + self.cpu_amplitude * math.sin(2 * math.pi * elapsed / self.cpu_period)
+        if self._rng.random() < self.cpu_burst_chance:
+            value = 85.0 + self._rng.uniform(0, 15)
+        return value + self._rng.uniform(-3, 3)
+
+    def _memory_at(self, elapsed):
+        return self.memory_percent + 5 * math.sin(2 * math.pi * elapsed / (self.cpu_period * 7))
+
+    def _net_at(self, elapsed):
+        if self._rng.random() < self.net_burst_chance:
+            down = self.net_burst_bps * self._rng.uniform(0.5, 1.0)
+        else:
+            down = self.net_base_bps * self._rng.uniform(0.2, 1.5)
+        return down, down * self._rng.uniform(0.05, 0.3)
+
+    def _target_process_count(self, elapsed):
+        return self.process_count
+
+    def advance(self):
+        with self._lock:
+            now = self.clock()
+            dt = now - self._last_advance
+            if dt <= 0:
+                return
+            self._last_advance = now
+            elapsed = now - self._start
+
+            self._cpu = max(0.0, min(100.0, self._cpu_at(elapsed)))
+            self._load_factor = max(0.05, self._cpu / max(1.0, self.cpu_base))
+            self._net_down, self._net_up = self._net_at(elapsed)
+            self._bytes_recv += self._net_down * dt
+            self._bytes_sent += self._net_up * dt
+            if self._memory_at(elapsed) > 90:
+                self._swap_in += 4 * 1024 ** 2 * dt
+                self._swap_out += 2 * 1024 ** 2 * dt
+
+            # Churn: replace processes at churn_per_second and drift toward the target count
+            self._churn_debt += self.churn_per_second * dt
+            churn = int(self._churn_debt)
+            self._churn_debt -= churn
+            pids = list(self._processes)
+            for pid in self._rng.sample(pids, min(churn, len(pids))):
+                del self._processes[pid]
+            target = self._target_process_count(elapsed)
+            while len(self._processes) < target:
+                self._spawn()
+            while len(self._processes) > target:
+                self._processes.pop(next(iter(self._processes)))
+
+    # psutil-compatible API
+    def cpu_percent(self, interval=None, percpu=False):
+        self.advance()
+        return round(self._cpu, 1)
+
+    def virtual_memory(self):
+        self.advance()
+        percent = max(1.0, min(99.0, self._memory_at(self._last_advance - self._start)))
+        used = self.memory_total * percent / 100
+        buffers = self.memory_total * 0.02
+        cached = self.memory_total * 0.15
+        available = max(0.0, self.memory_total - used)
+        return VirtualMemory(self.memory_total, available, round(percent, 1), used,
+                             max(0.0, available - cached), buffers, cached)
+
+    def swap_memory(self):
+        self.advance()
+        total = 4 * 1024 ** 3
+        used = total * 0.1
+        return SwapMemory(total, used, total - used, 10.0, int(self._swap_in), int(self._swap_out))
+
+    def net_io_counters(self, pernic=False):
+        self.advance()
+        return NetIO(int(self._bytes_sent), int(self._bytes_recv), 0, 0, 0, 0, 0, 0)
+
+    def process_iter(self, attrs=None, ad_value=None):
+        self.advance()
+        with self._lock:
+            procs = list(self._processes.values())
+        for proc in procs:
+            if attrs is not None:
+                proc.info = proc.as_dict(attrs, ad_value)
+            yield proc
+
+    def pids(self):
+        self.advance()
+        with self._lock:
+            return list(self._processes)
+
+    def boot_time(self):
+        return self._boot_time
+
+    def __getattr__(self, name):
+        # Exception classes and anything not simulated come from psutil itself
+        import psutil
+        return getattr(psutil, name)
+
+
+class TraceSource(SyntheticSource):
+    """Replays an NDJSON trace (cpu/ram percent, net rates, process count) recorded by the headless exporter."""
+
+    def __init__(self, path, loop=True, **kwargs):
+        self.samples = self.load(path)
+        self.loop = loop
+        first = self.samples[0] if self.samples else {}
+        kwargs.setdefault("process_count", first.get("process_count") or 300)
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def load(path):
+        samples = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    samples.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        samples = [s for s in samples if s.get("timestamp") is not None]
+        if samples:
+            t0 = samples[0]["timestamp"]
+            for s in samples:
+                s["_offset"] = s["timestamp"] - t0
+        return samples
+
+    def _sample_at(self, elapsed):
+        if not self.samples:
+            return {}
+        duration = self.samples[-1]["_offset"]
+        if self.loop and duration > 0:
+            elapsed %= duration
+        # Last sample at or before elapsed; traces are short enough for a linear scan per tick
+        current = self.samples[0]
+        for s in self.samples:
+            if s["_offset"] > elapsed:
+                break
+            current = s
+        return current
+
+    def _cpu_at(self, elapsed):
+        value = self._sample_at(elapsed).get("cpu_percent")
+        return self.cpu_base if value is None else value
+
+    def _memory_at(self, elapsed):
+        value = self._sample_at(elapsed).get("ram_percent")
+        return self.memory_percent if value is None else value
+
+    def _net_at(self, elapsed):
+        sample = self._sample_at(elapsed)
+        return sample.get("net_down_bps") or 0.0, sample.get("net_up_bps") or 0.0
+
+    def _target_process_count(self, elapsed):
+        return self._sample_at(elapsed).get("process_count") or self.process_count
+
+
+_source = None
+_source_lock = threading.Lock()
+
+
+def create_source(spec):
+    if not spec or spec == "psutil":
+        import psutil
+        return psutil
+    if spec == "synthetic":
+        options = config_manager.get().get("taskmgr", {}).get("synthetic", {}) or {}
+        return SyntheticSource(**options)
+    if spec.startswith("trace:"):
+        return TraceSource(spec[len("trace:"):])
+    raise ValueError(f"Unknown data source '{spec}'")
+
+
+def get_source():
+    """The process-wide data source (psutil unless configured otherwise)."""
+    global _source
+    if _source is None:
+        with _source_lock:
+            if _source is None:
+                spec = os.environ.get("MYCOLOR_DATA_SOURCE") or \
+                    config_manager.get().get("taskmgr", {}).get("data_source", "psutil")
+                try:
+                    _source = create_source(spec)
+                except (OSError, ValueError):
+                    import psutil
+                    _source = psutil
+    return _source
+
+
+def set_source(source):
+    """Install a source explicitly (headless runs, benchmarks)."""
+    global _source
+    with _source_lock:
+        _source = source
+
+
+def is_live_source(source=None):
+    """True for psutil itself. Synthetic and trace sources aren't this machine's history."""
+    import psutil
+    return (source or get_source()) is psutil
+
+
+def supports_handles(source=None):
+    """num_handles only exists on Windows psutil; synthetic sources always provide it."""
+    source = source or get_source()
+    if isinstance(source, SyntheticSource):
+        return True
+    return hasattr(source.Process, "num_handles")
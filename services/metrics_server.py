@@ -0,0 +1,162 @@
+"""Local OpenMetrics endpoint for the monitor values.
+
+Scrapes only format the latest published snapshot (see services/snapshot.py);
+they never trigger collection. SnapshotStore.latest() is a plain reference
+read, the formatted body is cached per snapshot, and each request is served on
+its own thread, so concurrent scrapes neither block each other nor the sampler.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.constants import config_manager
+from services.snapshot import get_snapshot_store
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PREFIX = "mycolor"
+
+# (snapshot key, metric name, help)
+GAUGES = [
+    ("cpu_percent", "cpu_usage_percent", "System CPU utilisation."),
+    ("ram_percent", "memory_usage_percent", "System memory utilisation."),
+    ("gpu_percent", "gpu_usage_percent", "GPU utilisation (absent when no backend)."),
+    ("net_down_bps", "network_receive_bytes_per_second", "Network receive rate."),
+    ("net_up_bps", "network_transmit_bytes_per_second", "Network transmit rate."),
+    ("process_count", "processes", "Number of running processes."),
+    ("timestamp", "snapshot_timestamp_seconds", "Unix time the snapshot was taken."),
+]
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _family(lines, name, metric_type, help_text, samples):
+    """samples: list of (suffix, labels dict, value); families without samples are left out."""
+    samples = [s for s in samples if s[2] is not None]
+    if not samples:
+        return
+    full = f"{PREFIX}_{name}"
+    lines.append(f"# TYPE {full} {metric_type}")
+    lines.append(f"# HELP {full} {help_text}")
+    for suffix, labels, value in samples:
+        label_text = ""
+        if labels:
+            label_text = "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in sorted(labels.items())) + "}"
+        lines.append(f"{full}{suffix}{label_text} {_format_value(value)}")
+
+
+def render_openmetrics(snapshot):
+    lines = []
+    _family(lines, "up", "gauge", "1 once a snapshot has been published.", [("", None, snapshot is not None)])
+    if snapshot is not None:
+        for key, name, help_text in GAUGES:
+            _family(lines, name, "gauge", help_text, [("", None, snapshot.get(key))])
+
+        self_metrics = snapshot.get("self") or {}
+        collectors = self_metrics.get("collectors") or {}
+        _family(lines, "collector_cost_seconds", "gauge", "Smoothed CPU time per collector run.",
+                [("", {"collector": name}, stats.get("avg_cost")) for name, stats in sorted(collectors.items())])
+        _family(lines, "collector_interval_seconds", "gauge", "Current sampling interval per collector.",
+                [("", {"collector": name}, stats.get("interval")) for name, stats in sorted(collectors.items())])
+        render_seconds = self_metrics.get("render_seconds") or {}
+        _family(lines, "render_seconds", "gauge", "Duration of the last render per panel.",
+                [("", {"panel": name}, value) for name, value in sorted(render_seconds.items())])
+        _family(lines, "process_resident_memory_bytes", "gauge", "Resident memory of this tool.",
+                [("", None, self_metrics.get("rss_bytes"))])
+        _family(lines, "process_cpu_seconds", "counter", "CPU time consumed by this tool.",
+                [("_total", None, self_metrics.get("cpu_seconds"))])
+    lines.append("# EOF")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server_version = "mycolor-metrics"
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.metrics.get_body()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer:
+    def __init__(self, host="127.0.0.1", port=9464, store=None):
+        self.host = host
+        self.port = port
+        self.store = store or get_snapshot_store()
+        self._httpd = None
+        self._thread = None
+        # (snapshot, body); replaced as a whole so readers never see a torn pair
+        self._cached = (None, render_openmetrics(None))
+
+    def get_body(self):
+        snapshot = self.store.latest()
+        cached_snapshot, body = self._cached
+        if snapshot is not cached_snapshot:
+            body = render_openmetrics(snapshot)
+            self._cached = (snapshot, body)
+        return body
+
+    def start(self):
+        if self._httpd is not None:
+            return self
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.metrics = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/metrics"
+
+
+_server = None
+
+
+def start_metrics_server(host=None, port=None):
+    """Start the shared endpoint (idempotent). Returns None if the port cannot be bound."""
+    global _server
+    if _server is not None:
+        return _server
+    taskmgr_config = config_manager.get().get("taskmgr", {})
+    host = host or taskmgr_config.get("metrics_host", "127.0.0.1")
+    port = taskmgr_config.get("metrics_port", 9464) if port is None else port
+    try:
+        _server = MetricsServer(host, port).start()
+    except OSError:
+        _server = None
+    return _server
+
+
+def stop_metrics_server():
+    global _server
+    if _server is not None:
+        _server.stop()
+        _server = None
@@ -1,7 +1,7 @@
 import io
 import os
 import threading
-from time import monotonic
+from time import monotonic, perf_counter, time
 
 from rich.align import Align
 from rich.console import Console
@@ -11,9 +11,20 @@ from rich.text import Text
 from core.theme_engine import get_current_theme_colors
 from core.constants import config_manager
 from prompt_toolkit.formatted_text import ANSI as PT_ANSI
+from services.datasource import is_live_source
+from services.profiler import get_profiler
+from services.rollups import RollupSeries, format_span
+from services.scheduler import get_scheduler
+from services.timeseries import get_store
+
+HISTORY_LIMIT = 200
+BACKFILL_SECONDS = 3600
+ROLLUP_BACKFILL_SECONDS = 86400
 
 
 class BaseMonitor:
+    collector_name = "monitor"
+
     def __init__(self, title="Monitor", color=None):
         self.title = title
         self._forced_color = color
@@ -25,6 +36,11 @@ class BaseMonitor:
 
         self.update_interval = config_manager.get().get("process_update_interval", 0.5)
         self.last_update_time = 0.0
+        get_scheduler().register(self.collector_name, self.update_interval)
+        self._backfilled = False
+        # metric -> RollupSeries; zoom_span None means the live raw history
+        self.rollups = {}
+        self.zoom_span = None
 
         self._buffer = io.StringIO()
         self._console = Console(file=self._buffer, force_terminal=True, width=80)
@@ -38,26 +54,90 @@ class BaseMonitor:
 
     def should_update(self):
         """Check if enough time has passed to perform an update."""
+        current_time = monotonic()
         # First render: update immediately without waiting
         if self.last_update_time == 0:
+            self.last_update_time = current_time
             return True
-        
-        current_time = monotonic()
-        if current_time - self.last_update_time >= self.update_interval:
+
+        interval = get_scheduler().get_interval(self.collector_name, self.update_interval)
+        if current_time - self.last_update_time >= interval:
             self.last_update_time = current_time
             return True
         return False
 
-    def update(self):
-        """Update monitor data. Returns True if data was refreshed, False otherwise."""
-        if self.should_update():
-            self._do_update()
+    def update(self, force=False):
+        """Update monitor data. Returns True if data was refreshed, False otherwise.
+
+        force samples now regardless of the scheduler interval (headless export
+        wants one fresh sample per tick of its own interval).
+        """
+        if force:
+            self.last_update_time = monotonic()
+        if force or self.should_update():
+            if not self._backfilled:
+                self._backfill()
+            with get_scheduler().measure(self.collector_name), get_profiler().timer("monitor.update", self.collector_name):
+                self._do_update()
+                self._record_sample()
             return True
         return False
 
     def _do_update(self):
         pass
 
+    def persisted_values(self):
+        """Latest sample per persisted metric name. Return {} to skip persisting this tick."""
+        return {self.collector_name: self.last_value}
+
+    def load_history(self, samples):
+        """Restore graphs from stored samples: {metric: [(timestamp, value), ...]}."""
+        values = [v for _, v in samples.get(self.collector_name, [])]
+        if values:
+            self.history = values[-HISTORY_LIMIT:]
+            self.last_value = values[-1]
+
+    def get_rollup(self, metric):
+        rollup = self.rollups.get(metric)
+        if rollup is None:
+            rollup = self.rollups[metric] = RollupSeries()
+        return rollup
+
+    def _record_sample(self):
+        now = time()
+        # Synthetic/trace samples go to the in-memory rollups only, never into data/timeseries
+        persist = is_live_source()
+        for metric, value in self.persisted_values().items():
+            self.get_rollup(metric).add(now, value)
+            store = get_store(metric) if persist else None
+            if store is not None:
+                store.append(value, now)
+
+    def _backfill(self):
+        self._backfilled = True
+        if not is_live_source():
+            return
+        now = time()
+        recent_since = now - BACKFILL_SECONDS
+        recent = {}
+        for metric in self.persisted_values():
+            store = get_store(metric)
+            if store is None:
+                continue
+            samples = store.read(since=now - ROLLUP_BACKFILL_SECONDS)
+            self.get_rollup(metric).extend(samples)
+            recent[metric] = [s for s in samples if s[0] >= recent_since]
+        if any(recent.values()):
+            with self._data_lock:
+                self.load_history(recent)
+
+    def get_zoom_columns(self, metric, width):
+        """(mins, maxs, avgs) for the current zoom span, one entry per column."""
+        return self.get_rollup(metric).columns(self.zoom_span, width)
+
+    def get_zoom_label(self):
+        return format_span(self.zoom_span) if self.zoom_span else ""
+
     def set_error_state(self):
         self.last_value = 0.0
 
@@ -110,6 +190,72 @@ class BaseMonitor:
             graph_text.append("".join(row) + "\n", style=color)
         return graph_text
 
+    def _get_stacked_graph_text(self, series, width, height):
+        """Stacked variant of _get_graph_text. series is a list of (data, color), bottom first."""
+        slices = []
+        for data, _ in series:
+            data_slice = data[-width:]
+            if len(data_slice) < width:
+                data_slice = [0.0] * (width - len(data_slice)) + data_slice
+            slices.append(data_slice)
+
+        # Each cell is (char, color); columns are built bottom-up from cumulative heights
+        graph_rows = [[(" ", None) for _ in range(width)] for _ in range(height)]
+
+        for x in range(width):
+            bounds = []
+            total = 0.0
+            for i, (_, color) in enumerate(series):
+                total += max(0.0, slices[i][x])
+                bounds.append(((min(100.0, total) / 100.0) * height, color))
+            if not bounds:
+                continue
+            top = bounds[-1][0]
+
+            for y in range(height):
+                row_idx = height - 1 - y
+                if top >= y + 1:
+                    mid = y + 0.5
+                    color = next((c for b, c in bounds if b >= mid), bounds[-1][1])
+                    graph_rows[row_idx][x] = ("█", color)
+                elif top > y:
+                    idx = min(7, int((top - y) * 8))
+                    if idx > 0:
+                        color = next((c for b, c in reversed(bounds) if b > y), bounds[-1][1])
+                        graph_rows[row_idx][x] = (self.blocks[idx], color)
+                    break
+                else:
+                    break
+
+        graph_text = Text()
+        for row in graph_rows:
+            run_chars = []
+            run_color = None
+            for ch, color in row:
+                if color != run_color and run_chars:
+                    graph_text.append("".join(run_chars), style=run_color)
+                    run_chars = []
+                run_color = color
+                run_chars.append(ch)
+            if run_chars:
+                graph_text.append("".join(run_chars), style=run_color)
+            graph_text.append("\n")
+        return graph_text
+
+    def _get_range_graph_text(self, avgs, maxs, width, height, color, band_color):
+        """Downsampled graph: column average solid, spread up to the column max in band_color."""
+        avgs = [a or 0.0 for a in avgs]
+        spread = [max(0.0, (m or 0.0) - a) for a, m in zip(avgs, maxs)]
+        return self._get_stacked_graph_text([(avgs, color), (spread, band_color)], width, height)
+
+    def render_frame(self, width, height):
+        """Timed entry point for render(); returns the seconds it took."""
+        start = perf_counter()
+        self.render(width, height)
+        elapsed = perf_counter() - start
+        get_profiler().record("monitor.render", self.collector_name, elapsed)
+        return elapsed
+
     def render(self, width, height, color=None, border_color=None, unit="%"):
         theme_colors = get_current_theme_colors()
         # Strict hierarchical lookup: specific key -> primary -> final safety (NO green)
@@ -127,13 +273,20 @@ class BaseMonitor:
         inner_width = max(1, width - 4)
         inner_height = max(1, height - 2)
 
-        graph_text = self._get_graph_text(
-            self.history, inner_width, inner_height, color
-        )
+        title = self.title
+        if self.zoom_span:
+            band_color = theme_colors.get("dim_text", theme_colors.get("inactive_tab", color))
+            _, maxs, avgs = self.get_zoom_columns(self.collector_name, inner_width)
+            graph_text = self._get_range_graph_text(avgs, maxs, inner_width, inner_height, color, band_color)
+            title = f"{title} ({self.get_zoom_label()})"
+        else:
+            graph_text = self._get_graph_text(
+                self.history, inner_width, inner_height, color
+            )
 
         panel = Panel(
             Align.center(graph_text),
-            title=f"[{color}]{self.title}: {self.last_value:.1f}{unit}[/]",
+            title=f"[{color}]{title}: {self.last_value:.1f}{unit}[/]",
             border_style=border_color,
             width=width,
             height=height,
@@ -1,14 +1,17 @@
 from .base_monitor import BaseMonitor
+from services.datasource import get_source
 
 
 class CPUMonitor(BaseMonitor):
+    collector_name = "cpu"
+
     def __init__(self):
         super().__init__(title="CPU Usage", color=None)
 
     def _do_update(self):
         import psutil
         try:
-            val = psutil.cpu_percent(interval=None)
+            val = get_source().cpu_percent(interval=None)
             self.last_value = val
             self.history.append(val)
             if len(self.history) > 200:
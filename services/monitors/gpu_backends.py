@@ -0,0 +1,387 @@
+"""GPU utilisation backends.
+
+Backends are only ever probed inside a helper process started by GPUProbe, so a
+hung driver call can be killed without blocking the UI. This module must stay
+stdlib-only at import time: it is also the entry point of that helper process.
+"""
+import glob
+import json
+import os
+import platform
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class GPUBackend:
+    name = "base"
+
+    def is_available(self):
+        """Cheap check run in the UI process; must not touch the driver."""
+        return False
+
+    def probe(self):
+        """Return utilisation 0-100, or None when no reading is available. Runs in the helper process."""
+        raise NotImplementedError
+
+    def to_spec(self):
+        return {"name": self.name}
+
+    def close(self):
+        pass
+
+
+class SysfsGPUBackend(GPUBackend):
+    """Linux DRM backend (amdgpu and other drivers exposing gpu_busy_percent)."""
+    name = "sysfs"
+    PATTERN = "/sys/class/drm/card*/device/gpu_busy_percent"
+
+    def is_available(self):
+        return platform.system() == "Linux" and bool(glob.glob(self.PATTERN))
+
+    def probe(self):
+        max_util = None
+        for path in glob.glob(self.PATTERN):
+            try:
+                with open(path, "r") as f:
+                    u = float(f.read().strip())
+            except (OSError, ValueError):
+                continue
+            if max_util is None or u > max_util:
+                max_util = u
+        return max_util
+
+
+class NvidiaGPUBackend(GPUBackend):
+    """NVML through pynvml when installed, otherwise nvidia-smi."""
+    name = "nvidia"
+
+    def __init__(self):
+        self._nvml = None
+        self._handles = None
+
+    def is_available(self):
+        if shutil.which("nvidia-smi"):
+            return True
+        try:
+            import importlib.util
+            return importlib.util.find_spec("pynvml") is not None
+        except (ImportError, ValueError):
+            return False
+
+    def _init_nvml(self):
+        if self._handles is not None:
+            return bool(self._handles)
+        self._handles = []
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            self._nvml = pynvml
+            self._handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+        except Exception:
+            self._nvml = None
+            self._handles = []
+        return bool(self._handles)
+
+    def probe(self):
+        if self._init_nvml():
+            try:
+                return float(max(self._nvml.nvmlDeviceGetUtilizationRates(h).gpu for h in self._handles))
+            except Exception:
+                pass
+
+        try:
+            result = subprocess.run(
+                ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        values = []
+        for line in result.stdout.splitlines():
+            try:
+                values.append(float(line.strip()))
+            except ValueError:
+                continue
+        return max(values) if values else None
+
+    def close(self):
+        if self._nvml:
+            try:
+                self._nvml.nvmlShutdown()
+            except Exception:
+                pass
+
+
+class WMIGPUBackend(GPUBackend):
+    """Windows GPU performance counters via WMI (formerly WindowsGPULoader)."""
+    name = "wmi"
+    QUERY = (
+        "SELECT UtilizationPercentage FROM Win32_PerfFormattedData_GPUPerformanceCounters_GPUEngine "
+        "WHERE Name LIKE '%3D' OR Name LIKE '%Video Decode'"
+    )
+
+    def __init__(self):
+        self._wmi = None
+        self._pythoncom = None
+        self._conn = None
+
+    def is_available(self):
+        if platform.system() != "Windows":
+            return False
+        try:
+            import importlib.util
+            return importlib.util.find_spec("wmi") is not None and importlib.util.find_spec("pythoncom") is not None
+        except (ImportError, ValueError):
+            return False
+
+    def _connect(self):
+        if self._conn is None:
+            import pythoncom
+            import wmi
+            self._pythoncom = pythoncom
+            self._wmi = wmi
+            pythoncom.CoInitialize()
+            self._conn = wmi.WMI(namespace="root/CIMV2")
+        return self._conn
+
+    def probe(self):
+        try:
+            results = self._connect().query(self.QUERY)
+        except Exception:
+            self._conn = None
+            return None
+        max_util = 0.0
+        for item in results or []:
+            try:
+                u = float(item.UtilizationPercentage)
+                if u > max_util:
+                    max_util = u
+            except (ValueError, TypeError, AttributeError):
+                continue
+        return max_util
+
+    def close(self):
+        if self._pythoncom:
+            try:
+                self._pythoncom.CoUninitialize()
+            except Exception:
+                pass
+
+
+class FakeGPUBackend(GPUBackend):
+    """Replays recorded samples; lets the whole probe path run on machines without a GPU."""
+    name = "fake"
+
+    def __init__(self, samples=None, loop=True):
+        self.samples = [float(s) for s in (samples or [0.0])]
+        self.loop = loop
+        self._index = 0
+
+    @classmethod
+    def from_file(cls, path, loop=True):
+        """Load samples from a JSON list or a file with one number per line."""
+        with open(path, "r", encoding="utf-8") as f:
+            raw = f.read()
+        try:
+            samples = json.loads(raw)
+        except json.JSONDecodeError:
+            samples = [line for line in raw.split() if line]
+        return cls(samples, loop=loop)
+
+    def is_available(self):
+        return True
+
+    def probe(self):
+        if self._index >= len(self.samples):
+            if not self.loop:
+                return None
+            self._index = 0
+        value = self.samples[self._index]
+        self._index += 1
+        return value
+
+    def to_spec(self):
+        return {"name": self.name, "samples": self.samples, "loop": self.loop}
+
+
+BACKENDS = {
+    SysfsGPUBackend.name: SysfsGPUBackend,
+    NvidiaGPUBackend.name: NvidiaGPUBackend,
+    WMIGPUBackend.name: WMIGPUBackend,
+    FakeGPUBackend.name: FakeGPUBackend,
+}
+
+AUTO_ORDER = [NvidiaGPUBackend.name, SysfsGPUBackend.name, WMIGPUBackend.name]
+
+
+def create_backend(spec):
+    name = spec.get("name")
+    if name == FakeGPUBackend.name:
+        return FakeGPUBackend(spec.get("samples"), loop=spec.get("loop", True))
+    cls = BACKENDS.get(name)
+    return cls() if cls else None
+
+
+def select_backend(name="auto", fake_samples=None):
+    """Resolve a backend from settings. Returns None when GPU monitoring is off or nothing is available."""
+    if not name or name == "off":
+        return None
+    if name == FakeGPUBackend.name:
+        if isinstance(fake_samples, str) and fake_samples:
+            try:
+                return FakeGPUBackend.from_file(fake_samples)
+            except (OSError, ValueError):
+                return FakeGPUBackend()
+        return FakeGPUBackend(fake_samples)
+    candidates = AUTO_ORDER if name == "auto" else [name]
+    for candidate in candidates:
+        backend = BACKENDS.get(candidate)
+        if backend is None:
+            continue
+        backend = backend()
+        if backend.is_available():
+            return backend
+    return None
+
+
+class GPUProbe:
+    """Owns the helper process and enforces a hard timeout on each probe."""
+
+    def __init__(self, backend, timeout=2.0):
+        self.backend = backend
+        self.timeout = timeout
+        self._proc = None
+        self._lines = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", "services.monitors.gpu_backends", "--serve", json.dumps(self.backend.to_spec())],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=_PROJECT_ROOT,
+            text=True,
+            bufsize=1,
+        )
+
+        def reader(stream, lines):
+            for line in stream:
+                lines.put(line)
+            lines.put(None)
+
+        threading.Thread(target=reader, args=(self._proc.stdout, self._lines), daemon=True).start()
+
+    def sample(self):
+        """Return a reading, or None on error/timeout. A timed-out helper is killed and restarted next call."""
+        with self._lock:
+            try:
+                if self._proc is None or self._proc.poll() is not None:
+                    self._start()
+                self._proc.stdin.write("probe\n")
+                self._proc.stdin.flush()
+                line = self._lines.get(timeout=self.timeout)
+            except queue.Empty:
+                self._kill()
+                return None
+            except (OSError, ValueError):
+                self._kill()
+                return None
+
+            if not line or not line.startswith("ok "):
+                if line is None:
+                    self._kill()
+                return None
+            try:
+                return float(line[3:])
+            except ValueError:
+                return None
+
+    def _kill(self):
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except OSError:
+                pass
+            self._proc = None
+
+    def stop(self):
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                try:
+                    self._proc.stdin.write("quit\n")
+                    self._proc.stdin.flush()
+                    self._proc.wait(timeout=0.5)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    pass
+            self._kill()
+
+
+def _serve(spec_json):
+    backend = create_backend(json.loads(spec_json))
+    if backend is None:
+        return
+    try:
+        for line in sys.stdin:
+            cmd = line.strip()
+            if cmd == "quit":
+                break
+            if cmd != "probe":
+                continue
+            try:
+                value = backend.probe()
+                reply = "none" if value is None else f"ok {value}"
+            except Exception as e:
+                reply = f"err {type(e).__name__}"
+            sys.stdout.write(reply + "\n")
+            sys.stdout.flush()
+    finally:
+        backend.close()
+
+
+def _record(path, name, count, interval):
+    import time
+    backend = select_backend(name)
+    if backend is None:
+        print(f"No GPU backend available for '{name}'.", file=sys.stderr)
+        return 1
+    probe = GPUProbe(backend)
+    samples = []
+    try:
+        for _ in range(count):
+            value = probe.sample()
+            samples.append(0.0 if value is None else value)
+            time.sleep(interval)
+    finally:
+        probe.stop()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(samples, f)
+    print(f"Recorded {len(samples)} samples from '{backend.name}' to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="GPU backend helper")
+    parser.add_argument("--serve", metavar="SPEC", help="serve probes for a backend spec (internal)")
+    parser.add_argument("--record", metavar="PATH", help="record samples for FakeGPUBackend replay")
+    parser.add_argument("--backend", default="auto")
+    parser.add_argument("--count", type=int, default=60)
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve)
+    elif args.record:
+        sys.exit(_record(args.record, args.backend, args.count, args.interval))
+    else:
+        parser.print_help()
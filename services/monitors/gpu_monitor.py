@@ -1,111 +1,61 @@
-import platform
-import threading
-from time import sleep, time
-
 from .base_monitor import BaseMonitor
-
-try:
-    import GPUtil
-except ImportError:
-    GPUtil = None
-
-try:
-    import pythoncom
-    import wmi
-except ImportError:
-    wmi = None
-    pythoncom = None
+from .gpu_backends import GPUProbe, select_backend
+from core.constants import config_manager
 
 
 GPU_FAILURE_LIMIT = 3
 
 
-class WindowsGPULoader(threading.Thread):
-    def __init__(self):
-        super().__init__()
-        self.daemon = True
-        self.running = True
-        self.latest_usage = 0.0
-        self.paused = False
-        self.start_time = time()
-
-    def run(self):
-        if not wmi or not pythoncom:
-            return
-
-        try:
-            pythoncom.CoInitialize()
-            w = wmi.WMI(namespace="root/CIMV2")
-        except (wmi.x_wmi, pythoncom.com_error):
-            self.running = False
-            return
-
-        while self.running:
-            try:
-                if self.paused:
-                    sleep(0.5)
-                    continue
-
-                results = w.query(
-                    "SELECT UtilizationPercentage FROM Win32_PerfFormattedData_GPUPerformanceCounters_GPUEngine WHERE Name LIKE '%3D' OR Name LIKE '%Video Decode'"
-                )
-                max_util = 0.0
-                if results:
-                    for item in results:
-                        try:
-                            u = float(item.UtilizationPercentage)
-                            if u > max_util:
-                                max_util = u
-                        except (ValueError, TypeError, AttributeError):
-                            continue
-                self.latest_usage = max_util
-            except (wmi.x_wmi, pythoncom.com_error):
-                pass
-
-            elapsed = time() - self.start_time
-            sleep_duration = 1.0 if elapsed < 10 else 5.0
-
-            chunks = int(sleep_duration / 0.1)
-            for _ in range(chunks):
-                if not self.running:
-                    break
-                if self.paused:
-                    break
-                sleep(0.1)
-
-        try:
-            pythoncom.CoUninitialize()
-        except pythoncom.com_error:
-            pass
-
-    def stop(self):
-        self.running = False
-
-
 class GPUMonitor(BaseMonitor):
-    def __init__(self):
+    collector_name = "gpu"
+
+    def __init__(self, backend=None):
         super().__init__(title="GPU Usage", color=None)
-        self.use_wmi = False
-        self.loader = None
-        self._initialized = False
+        taskmgr_config = config_manager.get().get("taskmgr", {})
+        if backend is None:
+            backend = select_backend(
+                taskmgr_config.get("gpu_backend", "auto"),
+                taskmgr_config.get("gpu_fake_samples"),
+            )
+        self.backend = backend
+        self.loader = GPUProbe(backend, timeout=taskmgr_config.get("gpu_probe_timeout", 2.0)) if backend else None
         self._failure_count = 0
-        self._disabled = True  # Disabled by default - causes freezes
+        self._disabled = backend is None
+        self.paused = False
+        if self._disabled:
+            self.title = "GPU Usage (n/a)"
 
     def _do_update(self):
-        # GPU monitoring disabled for stability
-        self.last_value = 0.0
-        self.history.append(0.0)
+        val = 0.0
+        if not self._disabled and not self.paused:
+            result = self.loader.sample()
+            if result is None:
+                self._failure_count += 1
+                if self._failure_count >= GPU_FAILURE_LIMIT:
+                    # Backend keeps hanging or erroring: stop probing instead of paying the timeout every tick
+                    self._disabled = True
+                    self.title = "GPU Usage (n/a)"
+                    self.loader.stop()
+            else:
+                self._failure_count = 0
+                val = max(0.0, min(100.0, result))
+
+        self.last_value = val
+        self.history.append(val)
         if len(self.history) > 200:
             self.history.pop(0)
 
+    def persisted_values(self):
+        if self._disabled:
+            return {}
+        return super().persisted_values()
+
     def stop(self):
         if self.loader:
             self.loader.stop()
 
     def pause(self):
-        if self.loader:
-            self.loader.paused = True
+        self.paused = True
 
     def resume(self):
-        if self.loader:
-            self.loader.paused = False
\ No newline at end of file
+        self.paused = False
@@ -6,6 +6,7 @@ from rich.console import Console, Group
 from rich.panel import Panel
 
 from .base_monitor import BaseMonitor
+from services.datasource import get_source
 from core.theme_engine import get_current_theme_colors
 
 
@@ -78,10 +79,11 @@ class DynamicSpeedScaler:
 
 
 class NetMonitor(BaseMonitor):
+    collector_name = "net"
+
     def __init__(self):
-        import psutil
         super().__init__(title="Network", color=None)
-        self.last_io = psutil.net_io_counters()
+        self.last_io = get_source().net_io_counters()
         self.last_time = time()
         self.scaler = DynamicSpeedScaler()
         self.down_history = [0.0] * 100
@@ -103,7 +105,7 @@ class NetMonitor(BaseMonitor):
     def _do_update(self):
         import psutil
         try:
-            current_io = psutil.net_io_counters()
+            current_io = get_source().net_io_counters()
             current_time = time()
 
             elapsed = current_time - self.last_time
@@ -140,6 +142,44 @@ class NetMonitor(BaseMonitor):
         except psutil.Error:
             pass
 
+    def persisted_values(self):
+        # Raw rates are stored; graph percentages depend on the current scale
+        return {"net_down": self.last_down, "net_up": self.last_up}
+
+    def load_history(self, samples):
+        down = [v for _, v in samples.get("net_down", [])][-200:]
+        up = [v for _, v in samples.get("net_up", [])][-200:]
+        if not down and not up:
+            return
+        peak = max(down + up)
+        if peak > self.scaler.current_max:
+            self.scaler._bump_ceiling(peak)
+            self.scaler._last_max_speed = self.scaler.current_max
+        current_max = self.scaler.current_max
+        self.down_history = [min(100.0, (v / current_max) * 100.0) for v in down] or [0.0] * 100
+        self.up_history = [min(100.0, (v / current_max) * 100.0) for v in up] or [0.0] * 100
+        self.last_down = down[-1] if down else 0.0
+        self.last_up = up[-1] if up else 0.0
+        self._data_changed = True
+
+    def _get_zoomed_graphs(self, width, h_down, h_up, color, colors):
+        band_color = colors.get("dim_text", colors.get("inactive_tab", color))
+        _, down_max, down_avg = self.get_zoom_columns("net_down", width)
+        _, up_max, up_avg = self.get_zoom_columns("net_up", width)
+        # The live scaler tracks recent traffic; a zoomed view scales to its own peak
+        scaler = DynamicSpeedScaler()
+        peak = max([m for m in down_max + up_max if m is not None] or [0.0])
+        if peak > scaler.current_max:
+            scaler._bump_ceiling(peak)
+        ceiling = scaler.current_max
+
+        def to_percent(values):
+            return [min(100.0, (v / ceiling) * 100.0) if v is not None else None for v in values]
+
+        graph_down = self._get_range_graph_text(to_percent(down_avg), to_percent(down_max), width, h_down, color, band_color)
+        graph_up = self._get_range_graph_text(to_percent(up_avg), to_percent(up_max), width, h_up, color, band_color)
+        return graph_down, graph_up, self._format_speed(ceiling)
+
     def _format_speed_fixed(self, bytes_per_sec):
         if bytes_per_sec < 1024:
             return f"{bytes_per_sec:7.1f} B/s"
@@ -173,10 +213,16 @@ class NetMonitor(BaseMonitor):
 
         inner_w = max(1, width - 4)
         inner_h1 = max(1, h1 - 2)
-        graph_down = self._get_graph_text(self.down_history, inner_w, inner_h1, color)
+        inner_h2 = max(1, h2 - 2)
+        zoom = f" ({self.get_zoom_label()})" if self.zoom_span else ""
+        if self.zoom_span:
+            graph_down, graph_up, ceiling_label = self._get_zoomed_graphs(inner_w, inner_h1, inner_h2, color, colors)
+        else:
+            graph_down = self._get_graph_text(self.down_history, inner_w, inner_h1, color)
+            graph_up = self._get_graph_text(self.up_history, inner_w, inner_h2, color)
         panel_down = Panel(
             Align.center(graph_down),
-            title=f"[{color}]Download: {self._format_speed(self.last_down)}[/]",
+            title=f"[{color}]Download{zoom}: {self._format_speed(self.last_down)}[/]",
             subtitle=f"[{border_color}]Max: {ceiling_label}[/]",
             border_style=border_color,
             width=width,
@@ -184,11 +230,9 @@ class NetMonitor(BaseMonitor):
             padding=(0, 1),
         )
 
-        inner_h2 = max(1, h2 - 2)
-        graph_up = self._get_graph_text(self.up_history, inner_w, inner_h2, color)
         panel_up = Panel(
             Align.center(graph_up),
-            title=f"[{color}]Upload: {self._format_speed(self.last_up)}[/]",
+            title=f"[{color}]Upload{zoom}: {self._format_speed(self.last_up)}[/]",
             subtitle=f"[{border_color}]Max: {ceiling_label}[/]",
             border_style=border_color,
             width=width,
@@ -1,17 +1,164 @@
+from time import monotonic
+
+from rich.align import Align
+from rich.panel import Panel
+
 from .base_monitor import BaseMonitor
+from services.datasource import get_source
+from core.constants import config_manager
+from core.theme_engine import get_current_theme_colors
+
+HISTORY_LIMIT = 200
 
 
 class RAMMonitor(BaseMonitor):
-    def __init__(self):
+    collector_name = "ram"
+
+    def __init__(self, extended=None):
         super().__init__(title="RAM Usage", color=None)
+        if extended is None:
+            extended = config_manager.get().get("taskmgr", {}).get("ram_extended", False)
+        self.extended = bool(extended)
+
+        # Extended mode: memory composition (percent of total) and swap rates (bytes/s)
+        self.used_history = []
+        self.buffers_history = []
+        self.cached_history = []
+        self.available_history = []
+        self.swap_in_history = []
+        self.swap_out_history = []
+        self.last_used = 0.0
+        self.last_buffers = 0.0
+        self.last_cached = 0.0
+        self.last_available = 0.0
+        self.last_swap_percent = 0.0
+        self.last_swap_in = 0.0
+        self.last_swap_out = 0.0
+        self._last_swap_io = None
+        self._last_swap_time = 0.0
 
     def _do_update(self):
         import psutil
         try:
-            val = psutil.virtual_memory().percent
+            source = get_source()
+            vm = source.virtual_memory()
+            val = vm.percent
             self.last_value = val
             self.history.append(val)
-            if len(self.history) > 200:
+            if len(self.history) > HISTORY_LIMIT:
                 self.history.pop(0)
+            if self.extended:
+                self._update_composition(vm, source.swap_memory())
         except psutil.Error:
-            pass
\ No newline at end of file
+            pass
+
+    def _update_composition(self, vm, swap):
+        total = float(vm.total) or 1.0
+        # buffers/cached are only reported on Linux/BSD; treat them as 0 elsewhere
+        buffers = getattr(vm, "buffers", 0) or 0
+        cached = getattr(vm, "cached", 0) or 0
+
+        self.last_used = (vm.used / total) * 100.0
+        self.last_buffers = (buffers / total) * 100.0
+        self.last_cached = (cached / total) * 100.0
+        self.last_available = (vm.available / total) * 100.0
+        self.last_swap_percent = swap.percent
+
+        now = monotonic()
+        if self._last_swap_io is not None:
+            elapsed = now - self._last_swap_time
+            if elapsed > 0:
+                self.last_swap_in = max(0, swap.sin - self._last_swap_io[0]) / elapsed
+                self.last_swap_out = max(0, swap.sout - self._last_swap_io[1]) / elapsed
+        self._last_swap_io = (swap.sin, swap.sout)
+        self._last_swap_time = now
+
+        for hist, value in (
+            (self.used_history, self.last_used),
+            (self.buffers_history, self.last_buffers),
+            (self.cached_history, self.last_cached),
+            (self.available_history, self.last_available),
+            (self.swap_in_history, self.last_swap_in),
+            (self.swap_out_history, self.last_swap_out),
+        ):
+            hist.append(value)
+            if len(hist) > HISTORY_LIMIT:
+                hist.pop(0)
+
+    def is_swapping(self):
+        return self.last_swap_in > 0 or self.last_swap_out > 0
+
+    def clear_data(self):
+        super().clear_data()
+        self.used_history = []
+        self.buffers_history = []
+        self.cached_history = []
+        self.available_history = []
+        self.swap_in_history = []
+        self.swap_out_history = []
+        self.last_swap_in = 0.0
+        self.last_swap_out = 0.0
+        self._last_swap_io = None
+
+    def _format_rate(self, bytes_per_sec):
+        if bytes_per_sec < 1024:
+            return f"{bytes_per_sec:.0f} B/s"
+        elif bytes_per_sec < 1024 * 1024:
+            return f"{bytes_per_sec / 1024:.1f} KB/s"
+        return f"{bytes_per_sec / (1024 * 1024):.1f} MB/s"
+
+    def render(self, width, height, color=None, border_color=None, unit="%"):
+        # Zoomed views use the rolled-up percent series from BaseMonitor
+        if not self.extended or self.zoom_span:
+            return super().render(width, height, color=color, border_color=border_color, unit=unit)
+
+        colors = get_current_theme_colors()
+        used_color = color or colors.get("monitor_graph", colors.get("primary", "#FFFFFF"))
+        buffers_color = colors.get("secondary", used_color)
+        cached_color = colors.get("dim_text", colors.get("inactive_tab", used_color))
+        warning_color = colors.get("warning", "#FFFF00")
+        if border_color is None:
+            border_color = colors.get("table_border", used_color)
+
+        inner_width = max(1, width - 4)
+        inner_height = max(1, height - 2)
+
+        graph_text = self._get_stacked_graph_text(
+            [
+                (self.used_history, used_color),
+                (self.buffers_history, buffers_color),
+                (self.cached_history, cached_color),
+            ],
+            inner_width,
+            inner_height,
+        )
+
+        title = (
+            f"[{used_color}]Used {self.last_used:.1f}%[/] "
+            f"[{buffers_color}]Buf {self.last_buffers:.1f}%[/] "
+            f"[{cached_color}]Cache {self.last_cached:.1f}%[/]"
+        )
+        swap_label = (
+            f"Swap {self.last_swap_percent:.0f}% "
+            f"in {self._format_rate(self.last_swap_in)} out {self._format_rate(self.last_swap_out)}"
+        )
+        if self.is_swapping():
+            subtitle = f"[bold {warning_color}]! {swap_label}[/]"
+        else:
+            subtitle = f"[{border_color}]Avail {self.last_available:.1f}% | {swap_label}[/]"
+
+        panel = Panel(
+            Align.center(graph_text),
+            title=title,
+            subtitle=subtitle,
+            border_style=warning_color if self.is_swapping() else border_color,
+            width=width,
+            height=height,
+            padding=(0, 1),
+        )
+
+        self._buffer.seek(0)
+        self._buffer.truncate(0)
+        self._console.width = width
+        self._console.print(panel)
+        self.cached_frame = self._buffer.getvalue()
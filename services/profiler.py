@@ -0,0 +1,143 @@
+"""Self-profiling for the task manager: how much the tool itself costs.
+
+Timings are wall-clock perf_counter deltas kept in small rolling windows, so
+recording is a deque append and percentiles are only computed when the
+overlay asks for them.
+"""
+import threading
+from collections import deque
+from contextlib import contextmanager
+from time import monotonic, perf_counter
+from typing import Dict, Optional, Tuple
+
+WINDOW_SIZE = 256
+
+
+class TimingWindow:
+    def __init__(self, size=WINDOW_SIZE):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+        self.last = 0.0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.last = seconds
+
+    def percentile(self, p):
+        data = sorted(self.samples)
+        if not data:
+            return 0.0
+        return data[min(len(data) - 1, int(round(p / 100.0 * (len(data) - 1))))]
+
+
+class Profiler:
+    # update_loop asks for a frame every 0.1 s; a longer gap means frames were dropped
+    FRAME_TARGET = 0.1
+    # Gaps this long are pauses (screen hidden, app suspended), not dropped frames
+    FRAME_PAUSE = 5.0
+    OWN_USAGE_INTERVAL = 1.0
+
+    def __init__(self, window=WINDOW_SIZE):
+        self.window = window
+        self._timings: Dict[Tuple[str, str], TimingWindow] = {}
+        self._lock = threading.Lock()
+        self._frame_times = deque(maxlen=64)
+        self.frames = 0
+        self.skipped_frames = 0
+        self._own_process = None
+        self._own_checked = 0.0
+        self.own_cpu_percent = 0.0
+        self.own_rss = 0
+
+    def record(self, category, name, seconds):
+        key = (category, name)
+        timing = self._timings.get(key)
+        if timing is None:
+            with self._lock:
+                timing = self._timings.setdefault(key, TimingWindow(self.window))
+        timing.add(seconds)
+
+    @contextmanager
+    def timer(self, category, name):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, perf_counter() - start)
+
+    def frame_drawn(self, now=None):
+        now = monotonic() if now is None else now
+        if self._frame_times:
+            gap = now - self._frame_times[-1]
+            if gap < self.FRAME_PAUSE:
+                missed = int(gap / self.FRAME_TARGET) - 1
+                if missed > 0:
+                    self.skipped_frames += missed
+        self._frame_times.append(now)
+        self.frames += 1
+
+    def get_fps(self, now=None):
+        now = monotonic() if now is None else now
+        recent = [t for t in self._frame_times if t >= now - 2.0]
+        if len(recent) < 2:
+            return 0.0
+        return (len(recent) - 1) / max(1e-6, recent[-1] - recent[0])
+
+    def summary(self, category) -> Dict[str, Tuple[float, float]]:
+        """{name: (p50, p99)} in seconds for one category."""
+        with self._lock:
+            items = [(name, timing) for (cat, name), timing in self._timings.items() if cat == category]
+        return {name: (timing.percentile(50), timing.percentile(99)) for name, timing in sorted(items)}
+
+    def sample_own_usage(self):
+        """Refresh own RSS/CPU% at most once per OWN_USAGE_INTERVAL."""
+        now = monotonic()
+        if now - self._own_checked < self.OWN_USAGE_INTERVAL:
+            return
+        self._own_checked = now
+        import psutil
+        try:
+            if self._own_process is None:
+                self._own_process = psutil.Process()
+                self._own_process.cpu_percent(None)
+            self.own_cpu_percent = self._own_process.cpu_percent(None)
+            self.own_rss = self._own_process.memory_info().rss
+        except psutil.Error:
+            pass
+
+    def get_status_text(self):
+        self.sample_own_usage()
+
+        def fmt(category):
+            return " ".join(
+                f"{name} {p50 * 1000:.1f}/{p99 * 1000:.1f}" for name, (p50, p99) in self.summary(category).items()
+            )
+
+        parts = [
+            f"fps {self.get_fps():.1f} skip {self.skipped_frames}",
+            f"rss {self.own_rss / (1024 * 1024):.0f}MB cpu {self.own_cpu_percent:.1f}%",
+        ]
+        for label, category in (
+            ("sample", "monitor.update"),
+            ("draw", "monitor.render"),
+            ("fetch", "tab.update"),
+            ("tab", "tab.render"),
+        ):
+            text = fmt(category)
+            if text:
+                parts.append(f"{label} {text}")
+        return " | ".join(parts) + " ms p50/p99"
+
+
+_profiler: Optional[Profiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = Profiler()
+    return _profiler
@@ -0,0 +1,140 @@
+"""Multi-resolution rollups for monitor timelines.
+
+Every sample goes into a short raw ring plus one ring of fixed-width buckets
+per tier (10 s, 1 min, 10 min). Buckets keep min/max/sum/count and are updated
+in place as samples arrive, so a 24-hour view walks about as many entries as a
+2-minute one and spikes survive as bucket maxima.
+
+Samplers add from their worker threads while the UI thread renders columns,
+so both go through the series' lock.
+"""
+import threading
+from collections import deque
+from time import time
+
+TIER_SECONDS = (10, 60, 600)
+# 10 s for a bit over 1 h, 1 min for a bit over 24 h, 10 min for a week
+TIER_CAPACITY = {10: 400, 60: 1500, 600: 1008}
+RAW_CAPACITY = 1200
+
+
+class Bucket:
+    __slots__ = ("start", "count", "total", "min", "max")
+
+    def __init__(self, start, value):
+        self.start = start
+        self.count = 1
+        self.total = value
+        self.min = value
+        self.max = value
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def avg(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class RollupSeries:
+    def __init__(self, raw_capacity=RAW_CAPACITY, tiers=TIER_SECONDS, capacities=None):
+        capacities = capacities or TIER_CAPACITY
+        self.raw = deque(maxlen=raw_capacity)
+        self.tiers = [(seconds, deque(maxlen=capacities.get(seconds, 1000))) for seconds in sorted(tiers)]
+        self._lock = threading.Lock()
+
+    def add(self, ts, value):
+        with self._lock:
+            self._add(ts, float(value))
+
+    def extend(self, samples):
+        with self._lock:
+            for ts, value in samples:
+                self._add(ts, float(value))
+
+    def _add(self, ts, value):
+        self.raw.append((ts, value))
+        for seconds, buckets in self.tiers:
+            start = ts - (ts % seconds)
+            # A clock step backwards lands in the newest bucket rather than reordering the ring
+            if buckets and start <= buckets[-1].start:
+                buckets[-1].add(value)
+            else:
+                buckets.append(Bucket(start, value))
+
+    def pick_tier(self, span, width, now=None):
+        """Coarsest tier no wider than one column that covers the span (0 means raw)."""
+        with self._lock:
+            return self._pick_tier(span, width, now)
+
+    def _pick_tier(self, span, width, now=None):
+        resolution = span / max(1, width)
+        now = time() if now is None else now
+        best = 0 if self._covers(self.raw, span, now) else None
+        for seconds, buckets in self.tiers:
+            if seconds <= resolution:
+                if self._covers(buckets, span, now):
+                    best = seconds
+                continue
+            # Nothing fine enough reaches back that far: settle for the first coarser tier that does
+            if best is None and self._covers(buckets, span, now):
+                best = seconds
+            break
+        return best if best is not None else self.tiers[-1][0]
+
+    def _covers(self, ring, span, now):
+        # A ring that never filled up holds everything there is, so it covers any span
+        if not ring or len(ring) < ring.maxlen:
+            return True
+        oldest = ring[0][0] if ring is self.raw else ring[0].start
+        return oldest <= now - span
+
+    def columns(self, span, width, now=None):
+        """Downsample the last `span` seconds to `width` columns.
+
+        Returns (mins, maxs, avgs); columns without samples are None.
+        """
+        width = max(1, int(width))
+        now = time() if now is None else now
+        start = now - span
+        col_width = span / width
+        mins = [None] * width
+        maxs = [None] * width
+        totals = [0.0] * width
+        counts = [0] * width
+
+        # Held for the walk: rings are appended and buckets updated in place by the samplers
+        with self._lock:
+            tier = self._pick_tier(span, width, now)
+            if tier == 0:
+                entries = ((ts, v, v, v, 1) for ts, v in reversed(self.raw))
+            else:
+                buckets = dict(self.tiers)[tier]
+                entries = ((b.start, b.min, b.max, b.total, b.count) for b in reversed(buckets))
+
+            for ts, lo, hi, total, count in entries:
+                if ts < start:
+                    break
+                col = min(width - 1, int((ts - start) / col_width))
+                if mins[col] is None or lo < mins[col]:
+                    mins[col] = lo
+                if maxs[col] is None or hi > maxs[col]:
+                    maxs[col] = hi
+                totals[col] += total
+                counts[col] += count
+
+        avgs = [totals[i] / counts[i] if counts[i] else None for i in range(width)]
+        return mins, maxs, avgs
+
+
+def format_span(seconds):
+    if seconds >= 3600 and seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    if seconds >= 60 and seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
@@ -0,0 +1,136 @@
+import threading
+from contextlib import contextmanager
+from time import monotonic, thread_time
+from typing import Dict, Optional
+
+from core.constants import config_manager
+
+
+class CollectorStats:
+    def __init__(self, name: str, base_interval: float):
+        self.name = name
+        self.base_interval = base_interval
+        self.interval = base_interval
+        self.avg_cost = 0.0
+        self.samples = 0
+        self.last_cost = 0.0
+
+
+class AdaptiveScheduler:
+    """Keeps the combined CPU cost of all collectors under a budget (fraction of one core).
+
+    Each collector reports the CPU time of its last run; intervals are then
+    assigned by water-filling the budget: cheap collectors keep their base
+    interval and expensive ones are backed off until they fit their share.
+    """
+
+    EWMA_ALPHA = 0.3
+
+    def __init__(self, cpu_budget: float = 0.02, max_interval: float = 30.0, enabled: bool = True):
+        self.cpu_budget = cpu_budget
+        self.max_interval = max_interval
+        self.enabled = enabled
+        self._collectors: Dict[str, CollectorStats] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, base_interval: float):
+        with self._lock:
+            stats = self._collectors.get(name)
+            if stats is None:
+                self._collectors[name] = CollectorStats(name, base_interval)
+            else:
+                stats.base_interval = base_interval
+                self._rebalance()
+
+    def get_interval(self, name: str, default: Optional[float] = None) -> float:
+        with self._lock:
+            stats = self._collectors.get(name)
+            if stats is None:
+                return default if default is not None else 0.0
+            return stats.interval
+
+    def record(self, name: str, cost: float):
+        with self._lock:
+            stats = self._collectors.get(name)
+            if stats is None:
+                return
+            stats.last_cost = cost
+            if stats.samples == 0:
+                stats.avg_cost = cost
+            else:
+                stats.avg_cost += self.EWMA_ALPHA * (cost - stats.avg_cost)
+            stats.samples += 1
+            self._rebalance()
+
+    @contextmanager
+    def measure(self, name: str):
+        start = thread_time()
+        try:
+            yield
+        finally:
+            self.record(name, thread_time() - start)
+
+    def _rebalance(self):
+        collectors = list(self._collectors.values())
+        if not self.enabled or self.cpu_budget <= 0:
+            for stats in collectors:
+                stats.interval = stats.base_interval
+            return
+
+        # Cheapest demand first, so leftover budget flows to the expensive collectors
+        collectors.sort(key=lambda s: s.avg_cost / s.base_interval if s.base_interval > 0 else 0.0)
+        remaining = self.cpu_budget
+        left = len(collectors)
+        for stats in collectors:
+            share = remaining / left if left else 0.0
+            demand = stats.avg_cost / stats.base_interval if stats.base_interval > 0 else 0.0
+            if demand <= share or stats.avg_cost <= 0:
+                stats.interval = stats.base_interval
+                remaining -= demand
+            else:
+                stats.interval = min(self.max_interval, stats.avg_cost / share) if share > 0 else self.max_interval
+                remaining -= stats.avg_cost / stats.interval
+            left -= 1
+
+    def get_overhead(self) -> float:
+        """Estimated CPU fraction of one core spent on sampling at the current intervals."""
+        with self._lock:
+            return sum(s.avg_cost / s.interval for s in self._collectors.values() if s.interval > 0)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {"interval": s.interval, "base_interval": s.base_interval, "avg_cost": s.avg_cost}
+                for name, s in self._collectors.items()
+            }
+
+    def get_status_text(self, names=None) -> str:
+        snap = self.snapshot()
+        parts = []
+        for name in names or snap.keys():
+            stats = snap.get(name)
+            if stats is None:
+                continue
+            marker = "*" if stats["interval"] > stats["base_interval"] + 1e-6 else ""
+            parts.append(f"{name} {stats['interval']:.1f}s{marker}")
+        if not parts:
+            return ""
+        return f"{' '.join(parts)} ({self.get_overhead() * 100:.1f}% cpu)"
+
+
+_scheduler: Optional[AdaptiveScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> AdaptiveScheduler:
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                taskmgr_config = config_manager.get().get("taskmgr", {})
+                _scheduler = AdaptiveScheduler(
+                    cpu_budget=taskmgr_config.get("sampling_cpu_budget", 0.02),
+                    max_interval=taskmgr_config.get("max_sample_interval", 30.0),
+                    enabled=taskmgr_config.get("adaptive_sampling", True),
+                )
+    return _scheduler
@@ -0,0 +1,79 @@
+"""Latest metrics snapshot shared between the sampler and its readers.
+
+The sampler (performance tab or headless export) builds a fresh dict each
+tick and publishes it by swapping a single reference. Published snapshots are
+never mutated, so readers such as the HTTP endpoint take latest() without a
+lock and always see a complete snapshot.
+"""
+from time import time
+
+from services.scheduler import get_scheduler
+
+SNAPSHOT_FIELDS = [
+    "timestamp",
+    "cpu_percent",
+    "ram_percent",
+    "gpu_percent",
+    "net_down_bps",
+    "net_up_bps",
+    "process_count",
+]
+
+
+_own_process = None
+
+
+def build_self_metrics(render_seconds=None):
+    """What the tool itself costs: collector cost/interval, render times, own RSS and CPU time."""
+    global _own_process
+    import psutil
+    metrics = {
+        "collectors": get_scheduler().snapshot(),
+        "render_seconds": dict(render_seconds or {}),
+        "rss_bytes": None,
+        "cpu_seconds": None,
+    }
+    try:
+        if _own_process is None:
+            _own_process = psutil.Process()
+        metrics["rss_bytes"] = _own_process.memory_info().rss
+        cpu_times = _own_process.cpu_times()
+        metrics["cpu_seconds"] = cpu_times.user + cpu_times.system
+    except psutil.Error:
+        pass
+    return metrics
+
+
+def build_snapshot(cpu=None, ram=None, gpu=None, net=None, process_count=None, self_metrics=None):
+    """Snapshot dict from monitor instances; missing monitors are reported as None."""
+    gpu_value = None
+    if gpu is not None and not getattr(gpu, "_disabled", False):
+        gpu_value = gpu.last_value
+    return {
+        "timestamp": round(time(), 3),
+        "cpu_percent": cpu.last_value if cpu is not None else None,
+        "ram_percent": ram.last_value if ram is not None else None,
+        "gpu_percent": gpu_value,
+        "net_down_bps": net.last_down if net is not None else None,
+        "net_up_bps": net.last_up if net is not None else None,
+        "process_count": process_count,
+        "self": self_metrics,
+    }
+
+
+class SnapshotStore:
+    def __init__(self):
+        self._snapshot = None
+
+    def publish(self, snapshot):
+        self._snapshot = snapshot
+
+    def latest(self):
+        return self._snapshot
+
+
+_store = SnapshotStore()
+
+
+def get_snapshot_store():
+    return _store
@@ -0,0 +1,232 @@
+"""Append-only on-disk time series for monitor history.
+
+Each metric gets its own directory of segment files named by their start time
+(ms). A segment is a small header followed by fixed-width (timestamp, value)
+float64 records, so a crash leaves at most one partial trailing record, which
+readers ignore. Segments are rotated by size or age and pruned by retention.
+"""
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from core.constants import ROOT_DIR, config_manager
+
+MAGIC = b"MWTS"
+VERSION = 1
+HEADER = struct.Struct("<4sB3xd")
+RECORD = struct.Struct("<dd")
+SEGMENT_SUFFIX = ".seg"
+
+
+def _list_segments(directory) -> List[Tuple[int, str]]:
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    segments = []
+    for name in names:
+        if not name.endswith(SEGMENT_SUFFIX):
+            continue
+        try:
+            start_ms = int(name[:-len(SEGMENT_SUFFIX)])
+        except ValueError:
+            continue
+        segments.append((start_ms, os.path.join(directory, name)))
+    segments.sort()
+    return segments
+
+
+def _read_segment(path, since=None, until=None) -> List[Tuple[float, float]]:
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return []
+    count = (size - HEADER.size) // RECORD.size
+    if count <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _ = HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != VERSION:
+                return []
+
+            def ts_at(i):
+                return RECORD.unpack_from(mm, HEADER.size + i * RECORD.size)[0]
+
+            # Records are appended in time order: binary search the window
+            lo, hi = 0, count
+            if since is not None:
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if ts_at(mid) < since:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+            start = lo
+            end = count
+            if until is not None:
+                lo, hi = start, count
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if ts_at(mid) <= until:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                end = lo
+            if start >= end:
+                return []
+            view = memoryview(mm)[HEADER.size + start * RECORD.size:HEADER.size + end * RECORD.size]
+            try:
+                return list(RECORD.iter_unpack(view))
+            finally:
+                view.release()
+        finally:
+            mm.close()
+
+
+class TimeSeriesStore:
+    """Writer and reader for one metric. Each process session appends to a fresh segment."""
+
+    def __init__(self, directory, metric, segment_bytes=1 << 20, segment_age=3600.0,
+                 retention=86400.0, max_bytes=32 << 20):
+        self.metric = metric
+        self.directory = os.path.join(directory, metric)
+        self.segment_bytes = max(HEADER.size + RECORD.size, int(segment_bytes))
+        self.segment_age = segment_age
+        self.retention = retention
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self._file = None
+        self._segment_path = None
+        self._segment_start = 0.0
+        self._segment_size = 0
+        self._lock = threading.Lock()
+
+    def append(self, value, ts=None):
+        if not self.enabled:
+            return
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            try:
+                if self._file is None or self._needs_rotation(ts):
+                    self._rotate(ts)
+                self._file.write(RECORD.pack(ts, float(value)))
+                self._segment_size += RECORD.size
+            except (OSError, ValueError):
+                # Read-only or full disk: keep the monitor running, stop persisting
+                self.enabled = False
+                self._close_file()
+
+    def _needs_rotation(self, ts):
+        if self._segment_size + RECORD.size > self.segment_bytes:
+            return True
+        return self.segment_age > 0 and ts - self._segment_start >= self.segment_age
+
+    def _rotate(self, ts):
+        self._close_file()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{int(ts * 1000)}{SEGMENT_SUFFIX}")
+        if os.path.exists(path):
+            path = os.path.join(self.directory, f"{int(ts * 1000) + 1}{SEGMENT_SUFFIX}")
+        # Unbuffered: every record reaches the OS as soon as it is sampled
+        self._file = open(path, "ab", buffering=0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, ts))
+        self._segment_path = path
+        self._segment_start = ts
+        self._segment_size = HEADER.size
+        self._prune(ts)
+
+    def _prune(self, now):
+        segments = _list_segments(self.directory)
+        sizes = {}
+        for _, path in segments:
+            try:
+                sizes[path] = os.path.getsize(path)
+            except OSError:
+                sizes[path] = 0
+        total = sum(sizes.values())
+        cutoff_ms = (now - self.retention) * 1000 if self.retention > 0 else None
+
+        for i, (_, path) in enumerate(segments):
+            if path == self._segment_path:
+                break
+            # A segment ends where the next one starts
+            next_start = segments[i + 1][0] if i + 1 < len(segments) else None
+            expired = cutoff_ms is not None and next_start is not None and next_start < cutoff_ms
+            over_budget = self.max_bytes > 0 and total > self.max_bytes
+            if not (expired or over_budget):
+                break
+            try:
+                os.remove(path)
+                total -= sizes[path]
+            except OSError:
+                pass
+
+    def read(self, since=None, until=None, limit=None) -> List[Tuple[float, float]]:
+        """Return (timestamp, value) pairs in time order, optionally limited to the newest `limit`."""
+        segments = _list_segments(self.directory)
+        since_ms = since * 1000 if since is not None else None
+        until_ms = until * 1000 if until is not None else None
+        samples = []
+        for i, (start_ms, path) in enumerate(segments):
+            next_start = segments[i + 1][0] if i + 1 < len(segments) else None
+            if since_ms is not None and next_start is not None and next_start < since_ms:
+                continue
+            if until_ms is not None and start_ms > until_ms:
+                break
+            samples.extend(_read_segment(path, since, until))
+        if limit is not None and len(samples) > limit:
+            samples = samples[-limit:]
+        return samples
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        self._file = None
+
+    def close(self):
+        with self._lock:
+            self._close_file()
+
+
+_stores: Dict[str, Optional[TimeSeriesStore]] = {}
+_stores_lock = threading.Lock()
+
+
+def get_history_dir():
+    taskmgr_config = config_manager.get().get("taskmgr", {})
+    return taskmgr_config.get("history_dir") or os.path.join(ROOT_DIR, "data", "timeseries")
+
+
+def get_store(metric) -> Optional[TimeSeriesStore]:
+    """Shared store for a metric, or None when history persistence is disabled."""
+    with _stores_lock:
+        if metric not in _stores:
+            taskmgr_config = config_manager.get().get("taskmgr", {})
+            if not taskmgr_config.get("history_persist", True):
+                _stores[metric] = None
+            else:
+                _stores[metric] = TimeSeriesStore(
+                    get_history_dir(),
+                    metric,
+                    segment_bytes=taskmgr_config.get("history_segment_bytes", 1 << 20),
+                    segment_age=taskmgr_config.get("history_segment_age", 3600.0),
+                    retention=taskmgr_config.get("history_retention", 86400.0),
+                    max_bytes=taskmgr_config.get("history_max_bytes", 32 << 20),
+                )
+        return _stores[metric]
+
+
+def close_stores():
+    with _stores_lock:
+        for store in _stores.values():
+            if store is not None:
+                store.close()
@@ -1,3 +1,5 @@
+from rich.markup import escape
+
 from core.theme_engine import get_current_theme_colors, get_current_theme
 
 
@@ -19,7 +21,8 @@ def BaseResponseTemplate(title, usage, flags_dict):
     output = f"[{primary_hex} bold]{title}[/{primary_hex} bold]\n\n"
 
     # Usage
-    output += f"[bold white]Usage:[/bold white] [{secondary_hex} bold]{usage}[/{secondary_hex} bold]\n\n"
+    # Usage and flag labels are literal text ("[flags]", "<path>[optional]"), not markup
+    output += f"[bold white]Usage:[/bold white] [{secondary_hex} bold]{escape(usage)}[/{secondary_hex} bold]\n\n"
 
     # Flags/Options
     if flags_dict:
@@ -34,6 +37,6 @@ def BaseResponseTemplate(title, usage, flags_dict):
 
         for flag, desc in flags_dict.items():
             padding = " " * (max_flag_width - len(flag) + gap)
-            output += f"  [{secondary_hex}]{flag}[/{secondary_hex}]{padding}[white]{desc}[/white]\n"
+            output += f"  [{secondary_hex}]{escape(flag)}[/{secondary_hex}]{padding}[white]{desc}[/white]\n"
 
     return output.strip()
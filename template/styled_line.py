@@ -0,0 +1,20 @@
+class StyledLine:
+    """
+    Text shown in a single Rich style, without markup parsing.
+
+    log_to_buffer writes it straight to the output as escape codes, so brackets
+    in command output, paths or error messages are displayed literally.
+    """
+
+    __slots__ = ("text", "style")
+
+    def __init__(self, text, style=""):
+        self.text = str(text)
+        self.style = style
+
+    def __rich__(self):
+        from rich.text import Text
+        return Text(self.text, style=self.style)
+
+    def __str__(self):
+        return self.text
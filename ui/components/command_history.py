@@ -0,0 +1,233 @@
+"""Persistent command history for the input line.
+
+Commands are appended to a JSON-lines file as they are entered and read back
+lazily: prompt_toolkit asks for the history strings only when the input is
+first drawn, and input_area wraps the store in a ThreadedHistory so the file
+is read and indexed off the UI thread.
+
+Suggestions come from an index instead of a scan of every string: unique
+commands are kept sorted, so the commands sharing a prefix are one bisect
+range, and a sparse table over their recency answers "newest command in that
+range" in constant time. Commands entered since the index was built are
+checked first, newest first; once there are many of them the index is rebuilt
+on a worker thread.
+"""
+import bisect
+import json
+import os
+import re
+import threading
+
+from prompt_toolkit.auto_suggest import AutoSuggest, Suggestion
+from prompt_toolkit.history import History
+
+from core.config_manager import ConfigManager
+from core.constants import ROOT_DIR
+
+HISTORY_PATH = os.path.join(ROOT_DIR, "data", "history", "commands.jsonl")
+MAX_ENTRIES = 100_000
+# Rewrite the file once it holds this much more than MAX_ENTRIES lines
+COMPACT_RATIO = 1.25
+# Commands entered after the index was built before it is rebuilt
+SESSION_REBUILD = 256
+_PREFIX_END = "\U0010ffff"
+
+
+class HistoryIndex:
+    """Immutable prefix/recency index over a list of commands (oldest first)."""
+
+    def __init__(self, commands=()):
+        last_seen = {}
+        for seq, command in enumerate(commands):
+            last_seen[command] = seq
+        self.commands = sorted(last_seen)
+        self.recency = [last_seen[command] for command in self.commands]
+        # By recency, newest first, for fuzzy search
+        self.newest_first = sorted(last_seen, key=last_seen.__getitem__, reverse=True)
+        self._table = self._build_table()
+
+    def _build_table(self):
+        # _table[k][i] is the index of the newest command in commands[i:i + 2**k]
+        recency = self.recency
+        level = list(range(len(recency)))
+        table = [level]
+        span = 1
+        while span * 2 <= len(level):
+            prev = level
+            level = [
+                a if recency[a] >= recency[b] else b
+                for a, b in zip(prev, prev[span:])
+            ]
+            table.append(level)
+            span *= 2
+        return table
+
+    def _newest_in(self, lo, hi):
+        k = (hi - lo).bit_length() - 1
+        level = self._table[k]
+        a, b = level[lo], level[hi - (1 << k)]
+        return a if self.recency[a] >= self.recency[b] else b
+
+    def newest_with_prefix(self, prefix):
+        commands = self.commands
+        lo = bisect.bisect_left(commands, prefix)
+        hi = bisect.bisect_left(commands, prefix + _PREFIX_END, lo)
+        if lo >= hi:
+            return None
+        return commands[self._newest_in(lo, hi)]
+
+
+def fuzzy_pattern(query):
+    """Regex matching query as a case-insensitive subsequence."""
+    return re.compile(".*?".join(map(re.escape, query)), re.IGNORECASE)
+
+
+class CommandHistory(History):
+    """prompt_toolkit History backed by an append-only file, with indexed lookups."""
+
+    def __init__(self, path=None, max_entries=None, persist=None):
+        super().__init__()
+        config = ConfigManager().get_nested("command_history") or {}
+        self.path = path or config.get("path") or HISTORY_PATH
+        self.max_entries = int(max_entries or config.get("max_entries", MAX_ENTRIES))
+        self.persist = config.get("persist", True) if persist is None else persist
+        self._index = HistoryIndex()
+        self._session = []
+        self._lock = threading.Lock()
+        self._rebuilding = False
+
+    # -- prompt_toolkit History ---------------------------------------------
+
+    def load_history_strings(self):
+        """Newest first, as prompt_toolkit expects; also builds the index."""
+        commands = self._read_file() if self.persist else []
+        index = HistoryIndex(commands)
+        with self._lock:
+            self._index = index
+            # Anything entered while the file was loading stays in the session list
+        return reversed(commands)
+
+    def store_string(self, string):
+        with self._lock:
+            self._session.append(string)
+            rebuild = len(self._session) >= SESSION_REBUILD and not self._rebuilding
+            if rebuild:
+                self._rebuilding = True
+        if self.persist:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(string) + "\n")
+            except OSError:
+                pass
+        if rebuild:
+            threading.Thread(target=self._rebuild, name="history-index", daemon=True).start()
+
+    # -- file ----------------------------------------------------------------
+
+    def _read_file(self):
+        try:
+            with open(self.path, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return []
+        commands = []
+        for line in lines[-self.max_entries:]:
+            try:
+                command = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(command, str) and command:
+                commands.append(command)
+        if len(lines) > self.max_entries * COMPACT_RATIO:
+            self._compact(commands)
+        return commands
+
+    def _compact(self, commands):
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(command) + "\n" for command in commands)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    # -- index -----------------------------------------------------------------
+
+    def _rebuild(self):
+        with self._lock:
+            index, session = self._index, list(self._session)
+        # Rebuilding only needs one occurrence per command, in recency order
+        merged = HistoryIndex(index.newest_first[::-1] + session)
+        with self._lock:
+            self._index = merged
+            del self._session[:len(session)]
+            self._rebuilding = False
+
+    def suggest(self, prefix):
+        """Most recent command starting with prefix, or None."""
+        if not prefix:
+            return None
+        with self._lock:
+            index, session = self._index, self._session
+            for command in reversed(session):
+                if command.startswith(prefix):
+                    return command
+        return index.newest_with_prefix(prefix)
+
+    def fuzzy_search(self, query, limit=20):
+        """Commands matching query, newest first: substring matches, then subsequence matches."""
+        if not query:
+            return []
+        with self._lock:
+            index, session = self._index, list(self._session)
+        seen = set()
+        candidates = []
+        for command in reversed(session):
+            if command not in seen:
+                seen.add(command)
+                candidates.append(command)
+        candidates.extend(command for command in index.newest_first if command not in seen)
+
+        needle = query.lower()
+        matches = [command for command in candidates if needle in command.lower()][:limit]
+        if len(matches) >= limit:
+            return matches
+        matcher = fuzzy_pattern(query).search
+        taken = set(matches)
+        for command in candidates:
+            if command not in taken and matcher(command):
+                matches.append(command)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+
+class IndexedAutoSuggest(AutoSuggest):
+    """Like AutoSuggestFromHistory, but asks the CommandHistory index instead of scanning."""
+
+    def __init__(self, history):
+        self.history = history
+
+    def get_suggestion(self, buffer, document):
+        text = document.text.rsplit("\n", 1)[-1]
+        if not text.strip():
+            return None
+        command = self.history.suggest(text)
+        if command is None:
+            return None
+        return Suggestion(command[len(text):])
+
+
+_command_history = None
+_history_lock = threading.Lock()
+
+
+def get_command_history():
+    """Return the global CommandHistory instance."""
+    global _command_history
+    if _command_history is None:
+        with _history_lock:
+            if _command_history is None:
+                _command_history = CommandHistory()
+    return _command_history
@@ -1,57 +1,115 @@
-import os
+import bisect
+from collections import OrderedDict
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
-from core.theme_engine import THEMES
+from commands import registry
+from core.config_manager import ConfigManager
+
+QUERY_CACHE_SIZE = 256
+# More than a completion menu can show; fuzzy matching is skipped once prefix matches fill it
+MAX_COMPLETIONS = 50
+_PREFIX_END = "\U0010ffff"
+
+
+def fuzzy_score(query, word):
+    """Rank of word as a subsequence match for query (lower is better), or None.
+    Fewer gaps between matched characters, then an earlier first match, then shorter words win.
+    """
+    pos = word.find(query[0]) if query else 0
+    if pos < 0:
+        return None
+    start = pos
+    gaps = 0
+    for char in query[1:]:
+        found = word.find(char, pos + 1)
+        if found < 0:
+            return None
+        gaps += found - pos - 1
+        pos = found
+    return gaps, start, len(word)
+
+
+class CompletionIndex:
+    """Sorted words with bisect prefix lookup and cached fuzzy ranking.
+
+    Prefix matches come first (alphabetical), then subsequence matches by
+    fuzzy_score, up to MAX_COMPLETIONS. Prefix lookup is a bisect; the fuzzy
+    pass only runs when prefixes leave room, and a query that extends a cached
+    one only re-ranks that query's fuzzy matches, so typing a word stays cheap
+    however many words are indexed.
+    """
+
+    def __init__(self, words, meta=None):
+        self.words = sorted(set(words))
+        self.meta = meta or {}
+        self._cache = OrderedDict()
+
+    def match(self, query, fuzzy=True, limit=MAX_COMPLETIONS):
+        key = (query, fuzzy)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached[0][:limit]
+
+        words = self.words
+        lo = bisect.bisect_left(words, query)
+        hi = bisect.bisect_left(words, query + _PREFIX_END, lo)
+        result = words[lo:min(hi, lo + limit)]
+        # All fuzzy matches of the query, kept so longer queries can narrow them
+        ranked = None
+        if fuzzy and query and len(result) < limit:
+            parent = self._cache.get((query[:-1], True))
+            pool = parent[1] if parent is not None and parent[1] is not None else words
+            ranked = []
+            for word in pool:
+                score = fuzzy_score(query, word)
+                if score is not None:
+                    ranked.append((score, word))
+            ranked.sort()
+            ranked = [word for _, word in ranked]
+            prefixed = set(result)
+            result = result + [word for word in ranked if word not in prefixed][:limit - len(result)]
+
+        self._cache[key] = (result, ranked)
+        if len(self._cache) > QUERY_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
 
 
 class DynamicCommandCompleter(Completer):
-    def __init__(self):
-        self.commands = {
-            "/theme": ["--style", "--list", "--help", "-h"],
-            "/sysinfo": [
-                "--g",
-                "--cpu",
-                "--ram",
-                "--disk",
-                "--display",
-                "--input",
-                "--help",
-                "-h",
-            ],
-            "/system": [
-                "--taskmgr",
-                "--end-task",
-                "--kill",
-                "--run-new",
-                "--d",
-                "--e",
-                "--help",
-                "-h",
-            ],
-            "/settings": ["--help", "-h"],
-            "/copy": ["--last", "--export", "--help", "-h"],
-            "/help": [],
-            "/quit": [],
-            "/clear": [],
-        }
-        self.themes = list(THEMES.keys())
-
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(current_dir)
-            functions_dir = os.path.join(project_root, "functions")
-
-            if os.path.exists(functions_dir):
-                for item in os.listdir(functions_dir):
-                    item_path = os.path.join(functions_dir, item)
-                    if os.path.isdir(item_path) and not item.startswith("__"):
-                        cmd = f"/{item}"
-                        if cmd not in self.commands:
-                            self.commands[cmd] = ["--help", "-h"]
-        except OSError:
-            pass
+    def __init__(self, command_flags=None, flag_choices=None, summaries=None):
+        """Defaults to the command table in commands/registry.py."""
+        if command_flags is None:
+            command_flags = registry.command_flags()
+            summaries = registry.command_summaries() if summaries is None else summaries
+        if flag_choices is None:
+            flag_choices = registry.flag_choices()
+        self.commands = {cmd: list(flags) for cmd, flags in command_flags.items()}
+        self._command_index = CompletionIndex(self.commands, meta=summaries)
+        self._flag_indexes = {cmd: CompletionIndex(flags) for cmd, flags in self.commands.items()}
+        self._choice_indexes = {key: CompletionIndex(values) for key, values in flag_choices.items()}
+        self._aliases = {}
+        self._alias_index = CompletionIndex(())
+        self._alias_source = None
+
+    def _get_aliases(self):
+        # Rebuilt only when settings.json is reloaded (the commands dict is replaced)
+        aliases = ConfigManager().get_commands()
+        if aliases is not self._alias_source:
+            self._alias_source = aliases
+            self._aliases = {str(name): str(target) for name, target in aliases.items()}
+            self._alias_index = CompletionIndex(self._aliases, meta=self._aliases)
+        return self._aliases
+
+    def _yield(self, index, query, fuzzy=True, show_meta=False):
+        for word in index.match(query, fuzzy):
+            yield Completion(
+                word,
+                start_position=-len(query),
+                display_meta=index.meta.get(word, "") if show_meta else "",
+            )
 
     def get_completions(self, document: Document, complete_event):
         text = document.text_before_cursor
@@ -60,43 +118,38 @@ class DynamicCommandCompleter(Completer):
         if not text_stripped:
             return
 
+        aliases = self._get_aliases()
+
         if " " not in text_stripped:
             word = text_stripped
             if word.startswith("/"):
-                word_lower = word.lower()
-                for cmd in sorted(self.commands.keys()):
-                    if cmd.startswith(word_lower):
-                        yield Completion(cmd, start_position=-len(word))
+                yield from self._yield(self._command_index, word.lower(), show_meta=True)
+            elif aliases:
+                # Shell input is free-form: only offer aliases that start with what was typed
+                yield from self._yield(self._alias_index, word, fuzzy=False, show_meta=True)
             return
 
         parts = text_stripped.split()
         if not parts:
             return
 
-        cmd = parts[0]
+        if parts[0] in aliases:
+            parts = aliases[parts[0]].split() + parts[1:]
+            if not parts:
+                return
+
+        cmd = parts[0].lower()
         if cmd not in self.commands:
             return
 
-        current_word = parts[-1] if not text_stripped.endswith(" ") else ""
-
-        if cmd == "/theme" and current_word in ["--style", "-s"]:
-            prev_word = parts[-2] if len(parts) > 1 and not text_stripped.endswith(" ") else ""
-            if prev_word == "--style" or prev_word == "-s":
-                for theme in self.themes:
-                    if current_word.lower() in theme.lower():
-                        yield Completion(theme, start_position=-len(current_word))
-                return
-
-            if not current_word.startswith("-"):
-                return
+        ends_with_space = text_stripped.endswith(" ")
+        current_word = "" if ends_with_space else parts[-1]
+        prev_word = parts[-1] if ends_with_space else (parts[-2] if len(parts) > 1 else "")
 
-            for flag in self.commands[cmd]:
-                if current_word in flag:
-                    yield Completion(flag, start_position=-len(current_word))
+        choices = self._choice_indexes.get((cmd, prev_word))
+        if choices is not None:
+            yield from self._yield(choices, current_word.lower())
             return
 
         if current_word.startswith("-"):
-            flags = self.commands[cmd]
-            for flag in flags:
-                if current_word in flag:
-                    yield Completion(flag, start_position=-len(current_word))
+            yield from self._yield(self._flag_indexes[cmd], current_word)
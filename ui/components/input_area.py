@@ -1,15 +1,12 @@
 import io
 import asyncio
 import os
+import re
 from functools import partial
 import hashlib
 
-from rich.console import Console, Group
-from rich.text import Text
-
 from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.history import InMemoryHistory
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+from prompt_toolkit.history import ThreadedHistory
 from prompt_toolkit.widgets import TextArea, Frame, Label
 from prompt_toolkit.layout.containers import (
     Window,
@@ -22,21 +19,32 @@ from prompt_toolkit.filters import Condition, Never, Always
 from prompt_toolkit.formatted_text import Template
 
 from commands.registry import dispatch, check_pending_confirmation, is_help_request
+from ui.components.command_history import IndexedAutoSuggest, get_command_history
 from ui.components.completer import DynamicCommandCompleter
+from ui.components.output_stream import OutputBatcher, pump_stream, style_to_ansi
 from ui.modules.tracker.history_tracker import get_history_tracker
 from core.theme_engine import get_current_theme_colors
+from template.styled_line import StyledLine
 
 _ANSI_BUFFER = io.StringIO()
-_ANSI_CONSOLE = Console(file=_ANSI_BUFFER, force_terminal=True, width=80, color_system="truecolor")
-_PLAIN_BUFFER = io.StringIO()
-_PLAIN_CONSOLE = Console(file=_PLAIN_BUFFER, force_terminal=True, width=80, color_system=None)
+_ANSI_CONSOLE = None
+_ESCAPE_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+
+def _get_ansi_console():
+    # Rich is only needed once something is rendered through it, not for the first frame
+    global _ANSI_CONSOLE
+    if _ANSI_CONSOLE is None:
+        from rich.console import Console
+        _ANSI_CONSOLE = Console(file=_ANSI_BUFFER, force_terminal=True, width=80, color_system="truecolor")
+    return _ANSI_CONSOLE
 
 
 def rich_to_ansi(text):
     """Convert Rich markup string to ANSI escape codes."""
     _ANSI_BUFFER.seek(0)
     _ANSI_BUFFER.truncate(0)
-    _ANSI_CONSOLE.print(text, end="")
+    _get_ansi_console().print(text, end="")
     return _ANSI_BUFFER.getvalue()
 
 
@@ -140,92 +148,71 @@ def get_input_text_area(application_ref, output_buffer, on_accept=None):
     command_completer = DynamicCommandCompleter()
 
     def log_to_buffer(renderable, save_to_history=True):
-        """Renders a Rich object to ANSI string and appends to output buffer."""
-        global _ANSI_BUFFER, _ANSI_CONSOLE, _PLAIN_BUFFER, _PLAIN_CONSOLE
-        
-        _ANSI_BUFFER.seek(0)
-        _ANSI_BUFFER.truncate(0)
-        
-        is_rich_renderable = (
-            hasattr(renderable, "__rich_console__") 
-            or hasattr(renderable, "__rich__")
-            or isinstance(renderable, Group)
-        )
-        
-        if is_rich_renderable:
-            _ANSI_CONSOLE.print(renderable)
-            ansi_output = _ANSI_BUFFER.getvalue()
-            
-            if save_to_history:
-                _PLAIN_BUFFER.seek(0)
-                _PLAIN_BUFFER.truncate(0)
-                _PLAIN_CONSOLE.print(renderable)
-                plain_text = _PLAIN_BUFFER.getvalue()
-                get_history_tracker().append_result(plain_text)
+        """Appends a line to the output buffer: StyledLine and plain strings directly, Rich objects via ANSI."""
+        if isinstance(renderable, StyledLine):
+            # Fast path: escape codes resolved once per style, text taken literally
+            prefix, suffix = style_to_ansi(renderable.style)
+            plain_text = renderable.text
+            if prefix:
+                ansi_output = "\n".join(prefix + line + suffix if line else line for line in plain_text.split("\n"))
+            else:
+                ansi_output = plain_text
+        elif isinstance(renderable, str) and "[" not in renderable:
+            # No markup possible: nothing for Rich to do
+            plain_text = ansi_output = renderable
         else:
-            _ANSI_CONSOLE.print(str(renderable))
+            _ANSI_BUFFER.seek(0)
+            _ANSI_BUFFER.truncate(0)
+            _get_ansi_console().print(renderable)
             ansi_output = _ANSI_BUFFER.getvalue()
-            
-            if save_to_history:
-                plain_text = str(renderable)
-                get_history_tracker().append_result(plain_text)
-
-        was_read_only = output_buffer.read_only
-        output_buffer.read_only = False
-        try:
-            output_buffer.buffer.cursor_position = len(output_buffer.buffer.text)
-            if output_buffer.buffer.text:
-                output_buffer.buffer.insert_text("\n")
-            output_buffer.buffer.insert_text(ansi_output.rstrip("\n"))
-            
-            output_buffer.buffer.cursor_position = len(output_buffer.buffer.text)
-            
-            try:
-                from prompt_toolkit.application import get_app
-                app = get_app()
-                app.layout.focus(output_buffer)
-                app.invalidate()
-            except Exception:
-                pass
-        finally:
-            output_buffer.read_only = was_read_only
+            # History gets the same text minus escape codes; no second render
+            plain_text = _ESCAPE_RE.sub("", ansi_output) if save_to_history else ""
+
+        if save_to_history:
+            if not plain_text.endswith("\n"):
+                plain_text += "\n"
+            get_history_tracker().append_result(plain_text)
+
+        output_buffer.append_text(ansi_output.rstrip("\n"))
+        application_ref.invalidate()
+
+    def append_output_groups(groups, color_hex):
+        """Append batched command output in one buffer operation (see OutputBatcher)."""
+        error_color = get_current_theme_colors().get("error", "red")
+        out_prefix, out_suffix = style_to_ansi(color_hex)
+        err_prefix, err_suffix = style_to_ansi(f"bold {error_color}")
+        ansi_lines = []
+        plain_lines = []
+        for lines, is_stderr in groups:
+            prefix, suffix = (err_prefix, err_suffix) if is_stderr else (out_prefix, out_suffix)
+            ansi_lines.extend(prefix + line + suffix for line in lines)
+            plain_lines.extend(lines)
+        output_buffer.append_lines(ansi_lines)
+        get_history_tracker().append_result("\n".join(plain_lines) + "\n")
+        application_ref.invalidate()
 
     async def run_system_command(command, log_func, color_hex, app_ref):
         """Executes a system shell command asynchronously and streams output."""
         theme_colors = get_current_theme_colors()
-        
-        # Start tracking this command in history
-        get_history_tracker().start_new_entry(command)
 
+        batcher = OutputBatcher(lambda groups: append_output_groups(groups, color_hex))
+        error = None
         try:
             process = await asyncio.create_subprocess_shell(
                 command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
             )
-
-            async def read_stream(stream, is_stderr):
-                while True:
-                    line = await stream.readline()
-                    if not line:
-                        break
-                    try:
-                        decoded = line.decode("utf-8").rstrip()
-                    except UnicodeDecodeError:
-                        decoded = line.decode("cp437", errors="replace").rstrip()
-
-                    if decoded:
-                        error_color = theme_colors.get("error", "red")
-                        style = f"bold {error_color}" if is_stderr else color_hex
-                        # Log to buffer and let it handle history capture
-                        log_func(f"[{style}]{decoded}[/{style}]", save_to_history=True)
-                        app_ref.invalidate()  # Refresh UI instantly for every line
-
             await asyncio.gather(
-                read_stream(process.stdout, False), read_stream(process.stderr, True)
+                pump_stream(process.stdout, batcher, False), pump_stream(process.stderr, batcher, True)
             )
             await process.wait()
         except Exception as e:
+            error = e
+        finally:
+            batcher.close()
+        # After the close, so the error follows whatever output was flushed
+        if error is not None:
             error_color = theme_colors.get("error", "red")
-            log_func(f"[bold {error_color}]Error executing command: {e}[/bold {error_color}]")
+            log_func(StyledLine(f"Error executing command: {error}", f"bold {error_color}"))
 
     def accept_input(buff):
         command_text = buff.text.strip()
@@ -248,6 +235,9 @@ def get_input_text_area(application_ref, output_buffer, on_accept=None):
         table_text = theme_colors.get("table_text", "white")
 
         if command_text:
+            from rich.console import Group
+            from rich.text import Text
+
             is_help_requested = is_help_request(command_text)
             if not command_text.startswith("/copy") and not is_help_requested:
                 get_history_tracker().start_new_entry(command_text)
@@ -284,7 +274,7 @@ def get_input_text_area(application_ref, output_buffer, on_accept=None):
         if not dispatched and command_text:
             if command_text.lower() == "pwd":
                 cwd = os.getcwd()
-                log_to_buffer(f"[{primary_hex}]{cwd}[/{primary_hex}]")
+                log_to_buffer(StyledLine(cwd, primary_hex))
             elif command_text.lower() == "ls":
                 application_ref.create_background_task(
                     run_system_command("dir", log_to_buffer, primary_hex, application_ref)
@@ -322,7 +312,7 @@ def get_input_text_area(application_ref, output_buffer, on_accept=None):
                 target_dir = command_text[3:].strip()
             else:
                 if command_text.lower() == "cd":
-                    log_to_buffer(f"[{primary_hex}]{os.getcwd()}[/{primary_hex}]")
+                    log_to_buffer(StyledLine(os.getcwd(), primary_hex))
                     target_dir = None
                 else:
                     app_ref.create_background_task(
@@ -341,11 +331,13 @@ def get_input_text_area(application_ref, output_buffer, on_accept=None):
 
                 os.chdir(target_dir)
                 new_cwd = os.getcwd()
-                log_to_buffer(f"[{primary_hex}Changed directory to: {new_cwd}[/{primary_hex}]")
+                log_to_buffer(StyledLine(f"Changed directory to: {new_cwd}", primary_hex))
         except Exception as e:
-            log_to_buffer(f"[bold red]Error changing directory: {e}[/bold red]")
+            log_to_buffer(StyledLine(f"Error changing directory: {e}", "bold red"))
 
-    history = InMemoryHistory()
+    # Read from disk on a worker thread the first time the input is drawn
+    command_history = get_command_history()
+    history = ThreadedHistory(command_history)
 
     text_area = TextArea(
         multiline=False,
@@ -353,7 +345,7 @@ def get_input_text_area(application_ref, output_buffer, on_accept=None):
         complete_while_typing=True,
         accept_handler=accept_input,
         history=history,
-        auto_suggest=AutoSuggestFromHistory(),
+        auto_suggest=IndexedAutoSuggest(command_history),
         prompt=[("class:prompt-prefix", " > ")],
         style="class:input-field",
     )
@@ -418,4 +410,22 @@ def get_input_key_bindings(application_ref, output_buffer=None):
         event.current_buffer.cursor_position = len(event.current_buffer.text)
         event.app.invalidate()
 
+    fuzzy_state = {"query": "", "matches": [], "index": -1, "shown": None}
+
+    @kb.add("c-r", eager=True)
+    def ctrl_r_fuzzy_history(event):
+        """Ctrl+R - fuzzy-search command history for the typed text; press again for older matches."""
+        buff = event.current_buffer
+        if buff.text != fuzzy_state["shown"]:
+            fuzzy_state["query"] = buff.text.strip()
+            fuzzy_state["matches"] = get_command_history().fuzzy_search(fuzzy_state["query"])
+            fuzzy_state["index"] = -1
+        matches = fuzzy_state["matches"]
+        if not matches:
+            return
+        fuzzy_state["index"] = (fuzzy_state["index"] + 1) % len(matches)
+        buff.text = fuzzy_state["shown"] = matches[fuzzy_state["index"]]
+        buff.cursor_position = len(buff.text)
+        event.app.invalidate()
+
     return kb
@@ -0,0 +1,156 @@
+"""Pre-rendered intro screen assets.
+
+The logo and tips for every (theme, logo style, width) are rendered through
+Rich once and kept as ANSI strings in a compressed cache file, so a launch
+only reads and inflates one file instead of rendering before the first frame.
+The file is keyed by a hash of LOGO_STYLES_RAW, THEMES and the tips text and
+is rebuilt whenever any of them change.
+
+    python ui/components/intro_assets.py   # build ahead of time (e.g. when packaging)
+
+Without a prebuilt file the first launch renders the combination it needs
+and fills in the rest on a background thread.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import hashlib
+import io
+import json
+import threading
+import zlib
+
+from core.constants import ROOT_DIR
+
+ASSET_FORMAT = 1
+INTRO_WIDTHS = (100,)
+CACHE_PATH = os.path.join(ROOT_DIR, "data", "cache", "intro_assets.json.z")
+# Let the first frame go out before rendering the remaining combinations
+BACKGROUND_BUILD_DELAY = 2.0
+
+_bundle = None
+_lock = threading.Lock()
+_build_timer = None
+
+
+def rich_to_ansi(renderable, width):
+    """Renders a Rich object to an ANSI string."""
+    from rich.console import Console
+    buffer = io.StringIO()
+    console = Console(file=buffer, force_terminal=True, width=width)
+    console.print(renderable)
+    return buffer.getvalue()
+
+
+def assets_hash():
+    from core.theme_engine import THEMES
+    from ui.components.tips import TIPS_TEXT
+    from ui.styles.logo_styles import LOGO_STYLES_RAW
+    payload = json.dumps([ASSET_FORMAT, INTRO_WIDTHS, LOGO_STYLES_RAW, THEMES, TIPS_TEXT], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _key(theme_name, style_name, width):
+    return f"{theme_name}|{style_name}|{width}"
+
+
+def render_entry(theme_name, style_name, width):
+    """[logo_ansi, tips_ansi] for one combination, rendered without touching the active theme."""
+    from rich.align import Align
+    from core.logo_engine import LogoEngine
+    from core.theme_engine import THEMES
+    from ui.components.tips import get_tips_renderable
+
+    logo = Align.center(LogoEngine.render_logo(width, style_name=style_name, theme_name=theme_name))
+    tips = Align.center(get_tips_renderable(THEMES[theme_name]))
+    return [rich_to_ansi(logo, width), rich_to_ansi(tips, width)]
+
+
+def _load():
+    global _bundle
+    if _bundle is not None:
+        return _bundle
+    with _lock:
+        if _bundle is None:
+            digest = assets_hash()
+            bundle = {"hash": digest, "entries": {}}
+            try:
+                with open(CACHE_PATH, "rb") as f:
+                    stored = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+                if stored.get("hash") == digest:
+                    bundle = stored
+            except (OSError, ValueError, zlib.error):
+                pass
+            _bundle = bundle
+    return _bundle
+
+
+def save(bundle=None):
+    bundle = bundle or _load()
+    with _lock:
+        data = zlib.compress(json.dumps(bundle, separators=(",", ":")).encode("utf-8"), 9)
+    tmp_path = CACHE_PATH + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, CACHE_PATH)
+        return True
+    except OSError:
+        return False
+
+
+def build_all(widths=INTRO_WIDTHS):
+    """Render every missing combination and write the cache file; returns how many were rendered."""
+    from core.theme_engine import THEMES
+    from ui.styles.logo_styles import LOGO_STYLES_RAW
+
+    entries = _load()["entries"]
+    rendered = 0
+    for theme_name in THEMES:
+        for style_name in LOGO_STYLES_RAW:
+            for width in widths:
+                key = _key(theme_name, style_name, width)
+                if key in entries:
+                    continue
+                entry = render_entry(theme_name, style_name, width)
+                with _lock:
+                    entries[key] = entry
+                rendered += 1
+    if rendered:
+        save()
+    return rendered
+
+
+def _schedule_build():
+    global _build_timer
+    with _lock:
+        if _build_timer is not None:
+            return
+        _build_timer = threading.Timer(BACKGROUND_BUILD_DELAY, build_all)
+        _build_timer.daemon = True
+    _build_timer.start()
+
+
+def get_intro_ansi(width, theme_name=None, style_name=None):
+    """(logo_ansi, tips_ansi) for the active theme and logo style."""
+    from core.theme_engine import get_current_theme_name
+    from ui.styles.logo_styles import get_configured_logo_style
+
+    theme_name = theme_name or get_current_theme_name()
+    style_name = style_name or get_configured_logo_style()
+    entries = _load()["entries"]
+    key = _key(theme_name, style_name, width)
+    entry = entries.get(key)
+    if entry is None:
+        entry = render_entry(theme_name, style_name, width)
+        with _lock:
+            entries[key] = entry
+        _schedule_build()
+    return entry[0], entry[1]
+
+
+if __name__ == "__main__":
+    count = build_all()
+    print(f"Rendered {count} intro asset(s) into {CACHE_PATH}")
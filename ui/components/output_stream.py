@@ -0,0 +1,121 @@
+"""Streaming of shell command output into the command screen.
+
+stdout/stderr are read in large blocks and split into lines in bulk; lines
+are collected by an OutputBatcher and handed to the screen at most
+FLUSH_HZ times per second, so one flush is one buffer append and one redraw
+no matter how many lines arrived in between.
+"""
+import asyncio
+from functools import lru_cache
+from time import monotonic
+
+FLUSH_HZ = 30
+READ_CHUNK = 64 * 1024
+# A "line" longer than this without a newline is flushed anyway
+MAX_PENDING_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=64)
+def style_to_ansi(style):
+    """(prefix, suffix) escape codes for a Rich style string, resolved once per style."""
+    if not style:
+        return "", ""
+    from rich.color import ColorSystem
+    from rich.errors import StyleSyntaxError
+    from rich.style import Style
+    try:
+        rendered = Style.parse(style).render("\0", color_system=ColorSystem.TRUECOLOR)
+    except StyleSyntaxError:
+        return "", ""
+    prefix, _, suffix = rendered.partition("\0")
+    return prefix, suffix
+
+
+def _decode_line(line):
+    try:
+        return line.decode("utf-8")
+    except UnicodeDecodeError:
+        return line.decode("cp437", errors="replace")
+
+
+def split_output(data):
+    """Decode a block of complete output lines; blank lines are dropped, as the line reader did.
+
+    The block is decoded in one go; if it isn't valid UTF-8 the cp437 fallback
+    is applied per line, so one bad line doesn't garble the rest of the block.
+    """
+    try:
+        raw_lines = data.decode("utf-8").split("\n")
+    except UnicodeDecodeError:
+        raw_lines = [_decode_line(line) for line in data.split(b"\n")]
+    lines = []
+    for line in raw_lines:
+        line = line.rstrip()
+        if "\r" in line:
+            # Progress-style redraws: keep what the terminal would show
+            line = line.rsplit("\r", 1)[-1]
+        if line:
+            lines.append(line.expandtabs())
+    return lines
+
+
+class OutputBatcher:
+    """Coalesces streamed lines and calls sink(groups) at most FLUSH_HZ times per second.
+
+    groups is a list of (lines, is_stderr) in arrival order.
+    """
+
+    def __init__(self, sink, rate=FLUSH_HZ, loop=None):
+        self.sink = sink
+        self.interval = 1.0 / rate
+        self.loop = loop or asyncio.get_event_loop()
+        self._pending = []
+        self._handle = None
+        self._last_flush = 0.0
+
+    def add(self, lines, is_stderr=False):
+        if not lines:
+            return
+        if self._pending and self._pending[-1][1] == is_stderr:
+            self._pending[-1][0].extend(lines)
+        else:
+            self._pending.append((list(lines), is_stderr))
+        if self._handle is None:
+            delay = self._last_flush + self.interval - monotonic()
+            if delay <= 0:
+                self.flush()
+            else:
+                self._handle = self.loop.call_later(delay, self.flush)
+
+    def flush(self):
+        self._handle = None
+        if not self._pending:
+            return
+        groups, self._pending = self._pending, []
+        self._last_flush = monotonic()
+        self.sink(groups)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.cancel()
+        self.flush()
+
+
+async def pump_stream(stream, batcher, is_stderr=False):
+    """Read a subprocess pipe in blocks and feed complete lines to batcher."""
+    pending = b""
+    while True:
+        data = await stream.read(READ_CHUNK)
+        if not data:
+            break
+        data = pending + data
+        cut = data.rfind(b"\n")
+        if cut < 0:
+            pending = data
+            if len(pending) < MAX_PENDING_BYTES:
+                continue
+            cut = len(data)
+        pending = data[cut + 1:]
+        batcher.add(split_output(data[:cut]), is_stderr)
+    if pending:
+        batcher.add(split_output(pending), is_stderr)
@@ -0,0 +1,171 @@
+"""Chunked scrollback for the command screen.
+
+Lines are kept in fixed-size chunks; only the last chunk ever grows, and each
+line's ANSI is parsed into fragments at most once, the first time it is drawn.
+Trimming drops whole chunks from the front, and the window only asks for the
+lines it actually shows, so streaming a long build log stays linear instead
+of re-parsing and re-splitting the whole buffer on every append.
+"""
+import re
+import threading
+from collections import deque
+
+from prompt_toolkit.data_structures import Point
+from prompt_toolkit.formatted_text import ANSI, to_formatted_text
+from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.layout.controls import UIContent, UIControl
+from prompt_toolkit.layout.dimension import Dimension
+
+MAX_LINES = 2500
+CHUNK_LINES = 256
+
+_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[mK]")
+
+
+def parse_line(line):
+    """Fragments for one line of (possibly ANSI-styled) text."""
+    if "\x1b" not in line:
+        return [("", line)]
+    try:
+        return to_formatted_text(ANSI(line))
+    except Exception:
+        return [("", _ESCAPE_RE.sub("", line))]
+
+
+class Chunk:
+    __slots__ = ("lines", "fragments")
+
+    def __init__(self):
+        self.lines = []
+        # Parsed fragments per line, filled on first draw
+        self.fragments = []
+
+
+class ScrollbackStore:
+    """Append-only line store with chunk-granular trimming and a scroll cursor."""
+
+    def __init__(self, max_lines=MAX_LINES, chunk_lines=CHUNK_LINES):
+        self.max_lines = max_lines
+        self.chunk_lines = chunk_lines
+        self.cursor_row = 0
+        self._chunks = deque()
+        self._line_count = 0
+        self._lock = threading.RLock()
+
+    @property
+    def line_count(self):
+        return self._line_count
+
+    def append_lines(self, lines):
+        with self._lock:
+            chunks = self._chunks
+            size = self.chunk_lines
+            for line in lines:
+                if not chunks or len(chunks[-1].lines) >= size:
+                    chunks.append(Chunk())
+                tail = chunks[-1]
+                tail.lines.append(line)
+                tail.fragments.append(None)
+            self._line_count += len(lines)
+            # Drop whole chunks while what remains still covers max_lines
+            while len(chunks) > 1 and self._line_count - len(chunks[0].lines) >= self.max_lines:
+                self._line_count -= len(chunks.popleft().lines)
+            self.cursor_row = max(0, self._line_count - 1)
+
+    def append_text(self, text):
+        """Append text as new line(s), like a print: each call starts on a new line."""
+        if not text and not self._line_count:
+            return
+        self.append_lines(text.split("\n"))
+
+    def clear(self):
+        with self._lock:
+            self._chunks.clear()
+            self._line_count = 0
+            self.cursor_row = 0
+
+    def _locate(self, index):
+        # All chunks but the tail are full, so the position is plain arithmetic
+        return self._chunks[index // self.chunk_lines], index % self.chunk_lines
+
+    def get_line(self, index):
+        with self._lock:
+            if not 0 <= index < self._line_count:
+                return ""
+            chunk, offset = self._locate(index)
+            return chunk.lines[offset]
+
+    def get_fragments(self, index):
+        with self._lock:
+            if not 0 <= index < self._line_count:
+                return []
+            chunk, offset = self._locate(index)
+            fragments = chunk.fragments[offset]
+            if fragments is None:
+                fragments = chunk.fragments[offset] = parse_line(chunk.lines[offset])
+            return fragments
+
+    def iter_lines(self):
+        with self._lock:
+            chunks = [list(chunk.lines) for chunk in self._chunks]
+        for lines in chunks:
+            yield from lines
+
+    @property
+    def text(self):
+        return "\n".join(self.iter_lines())
+
+    @text.setter
+    def text(self, value):
+        self.clear()
+        if value:
+            self.append_text(value)
+
+    def cursor_up(self, count=1):
+        self.cursor_row = max(0, self.cursor_row - count)
+
+    def cursor_down(self, count=1):
+        self.cursor_row = min(max(0, self._line_count - 1), self.cursor_row + count)
+
+
+class ScrollbackControl(UIControl):
+    def __init__(self, store, mouse_handler=None):
+        self.store = store
+        self._mouse_handler = mouse_handler
+
+    def is_focusable(self):
+        return True
+
+    def create_content(self, width, height):
+        store = self.store
+        return UIContent(
+            get_line=store.get_fragments,
+            line_count=store.line_count,
+            cursor_position=Point(x=0, y=store.cursor_row),
+            show_cursor=False,
+        )
+
+    def mouse_handler(self, mouse_event):
+        if self._mouse_handler is not None:
+            return self._mouse_handler(mouse_event)
+        return NotImplemented
+
+
+class ScrollbackArea(ScrollbackStore):
+    """The command screen's output widget: a ScrollbackStore that can be placed in a layout."""
+
+    def __init__(self, max_lines=MAX_LINES, chunk_lines=CHUNK_LINES, style="class:output-field"):
+        super().__init__(max_lines, chunk_lines)
+        self.control = ScrollbackControl(self)
+        self.window = Window(
+            content=self.control,
+            height=Dimension(weight=1),
+            style=style,
+            wrap_lines=True,
+        )
+
+    def set_mouse_handler(self, handler):
+        self.control._mouse_handler = handler
+
+    def __pt_container__(self):
+        return self.window
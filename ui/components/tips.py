@@ -1,9 +1,11 @@
-from rich.style import Style
-from rich.text import Text
+TIPS_TEXT = "Type '/' to get the suggestion command list.\nType '--' to get the suggestion flag list of command."
 
 
 def get_tips_renderable(theme: dict):
     """Generates the Tips renderable."""
+    from rich.style import Style
+    from rich.text import Text
+
     primary = theme.get("primary")
     background = theme.get("background", "#2B2B2B")
     
@@ -22,9 +24,6 @@ def get_tips_renderable(theme: dict):
     tips_style = primary_style + background_style
 
     tips_text_content = Text.assemble(
-        (
-            "Type '/' to get the suggestion command list.\nType '--' to get the suggestion flag list of command.",
-            tips_style,
-        )
+        (TIPS_TEXT, tips_style)
     )
     return tips_text_content
@@ -6,7 +6,6 @@ from prompt_toolkit.layout.containers import ConditionalContainer, Float, Window
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout.dimension import Dimension
 from prompt_toolkit.formatted_text import ANSI
-from rich.console import Console
 from core.theme_engine import get_current_theme_colors
 from prompt_toolkit.application.current import get_app
 
@@ -49,6 +48,7 @@ def trigger_notification(message, is_success=True):
 
     box_markup = f"[{color}]{empty_line}\n{content_line}\n{empty_line}[/{color}]"
 
+    from rich.console import Console
     buffer = io.StringIO()
     console = Console(file=buffer, force_terminal=True, width=200)
     console.print(box_markup, end="")
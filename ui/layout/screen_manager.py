@@ -0,0 +1,171 @@
+"""Task manager and settings as screens of the running Application.
+
+myworld's root DynamicContainer shows whatever app_state["current_screen"]
+names. open_screen() switches it to an embedded screen and moves the focus
+there, close_screen() goes back to where the user came from. While a screen
+is shown its key bindings replace the command line's.
+
+The task manager is built once and kept: its monitors keep sampling while it
+is hidden, so reopening it is a focus change. Settings are rebuilt on every
+open so they reflect settings.json. The separate-window launchers in
+commands/functions/system/system_logic.py remain for --window and
+"screens": {"open_in": "window"}.
+"""
+import importlib
+import threading
+
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.key_binding import DynamicKeyBindings
+
+from core.config_manager import get_manager
+
+EMBEDDED_SCREENS = ("taskmgr", "settings")
+# Imported on a worker thread after the first frame so the first open doesn't pay for them
+PRELOAD_MODULES = (
+    "ui.layout.taskmgr_layout",
+    "ui.layout.settings_layout",
+    "ui.screens.settings_screen",
+)
+
+_screens = {}
+_active = None
+
+
+class EmbeddedScreen:
+    __slots__ = ("container", "focus", "interface", "key_bindings", "keep")
+
+    def __init__(self, container, focus, interface, key_bindings, keep):
+        self.container = container
+        self.focus = focus
+        self.interface = interface
+        self.key_bindings = key_bindings
+        # Kept (and its interface hidden) when closed, instead of rebuilt on the next open
+        self.keep = keep
+
+
+def _build_taskmgr(app):
+    from ui.layout.taskmgr_layout import (
+        get_current_taskmgr_interface,
+        get_taskmgr_key_bindings,
+        get_taskmgr_layout,
+    )
+    container, focus = get_taskmgr_layout(app)
+    interface = get_current_taskmgr_interface()
+    app.app_state["taskmgr_instance"] = interface
+    app.create_background_task(interface.update_loop())
+    kb = get_taskmgr_key_bindings(interface, lambda event: close_screen(event.app))
+    return EmbeddedScreen(container, focus, interface, kb, keep=True)
+
+
+def _build_settings(app):
+    from ui.layout.notification_layout import trigger_notification
+    from ui.layout.settings_layout import (
+        get_current_settings_interface,
+        get_settings_key_bindings,
+        get_settings_layout,
+    )
+    from ui.styles.theme_styles import get_theme_style
+    container, focus = get_settings_layout(app)
+    interface = get_current_settings_interface()
+    app.app_state["settings_instance"] = interface
+    kb = get_settings_key_bindings(
+        interface,
+        lambda event: close_screen(event.app),
+        lambda message, is_success: trigger_notification(message, is_success=is_success),
+        get_theme_style,
+    )
+    return EmbeddedScreen(container, focus, interface, kb, keep=False)
+
+
+_BUILDERS = {
+    "taskmgr": _build_taskmgr,
+    "settings": _build_settings,
+}
+
+
+def prefers_window():
+    """True when settings.json asks for the task manager and settings in their own window."""
+    return get_manager().get_nested("screens", "open_in", default="app") == "window"
+
+
+def open_screen(app, name):
+    """Show an embedded screen in app. False when app can't host it (not running, no app_state)."""
+    global _active
+    app_state = getattr(app, "app_state", None)
+    if app_state is None or name not in _BUILDERS:
+        return False
+    if _active == name:
+        return True
+    if _active is not None:
+        close_screen(app)
+
+    screen = _screens.get(name)
+    if screen is None:
+        screen = _screens[name] = _BUILDERS[name](app)
+
+    app_state["return_screen"] = app_state["current_screen"]
+    app_state["return_focus"] = app.layout.current_window
+    app_state["current_screen"] = name
+    _active = name
+    app.layout.focus(screen.focus)
+    if hasattr(screen.interface, "show"):
+        screen.interface.show()
+    app.renderer.erase()
+    app.invalidate()
+    return True
+
+
+def close_screen(app):
+    """Leave the shown embedded screen for the screen and focus it was opened from."""
+    global _active
+    if _active is None:
+        return
+    screen = _screens[_active]
+    if screen.keep:
+        if hasattr(screen.interface, "hide"):
+            screen.interface.hide()
+    else:
+        del _screens[_active]
+    _active = None
+
+    app_state = app.app_state
+    app_state["current_screen"] = app_state.pop("return_screen", "cmd")
+    focus = app_state.pop("return_focus", None)
+    if focus is not None:
+        try:
+            app.layout.focus(focus)
+        except ValueError:
+            pass
+    app.renderer.erase()
+    app.invalidate()
+
+
+def get_screen_container(name):
+    """The container of an open embedded screen, or None."""
+    screen = _screens.get(name)
+    return screen.container if screen is not None else None
+
+
+screen_shown = Condition(lambda: _active is not None)
+
+
+def get_screen_key_bindings():
+    """Key bindings of the shown embedded screen (none while no screen is shown)."""
+    def current():
+        return _screens[_active].key_bindings if _active is not None else None
+    return DynamicKeyBindings(current)
+
+
+def preload():
+    """Import the embedded screens' modules on a worker thread."""
+    if not get_manager().get_nested("screens", "preload", default=True):
+        return
+
+    def run():
+        for name in PRELOAD_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass
+
+    threading.Thread(target=run, name="screen-preload", daemon=True).start()
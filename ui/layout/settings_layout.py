@@ -37,6 +37,113 @@ def get_current_settings_interface():
     return _current_interface
 
 
+def get_settings_key_bindings(interface, on_quit, notify, get_style):
+    """Settings keys.
+
+    on_quit(event) leaves the screen, notify(message, is_success) reports a
+    save, and get_style() gives the Application style to re-apply after a
+    theme change.
+    """
+    kb = KeyBindings()
+
+    def busy():
+        return interface.popup_mode or interface.edit_mode or interface.listening_mode
+
+    def quit_settings(event):
+        interface.running = False
+        on_quit(event)
+
+    @kb.add("escape", eager=True)
+    def handle_escape(event):
+        if interface.popup_mode:
+            interface.popup_mode = False
+            interface.edit_key = None
+            event.app.invalidate()
+        elif interface.edit_mode:
+            interface.cancel_edit()
+            event.app.invalidate()
+        elif interface.listening_mode:
+            interface.listening_mode = False
+            event.app.invalidate()
+        else:
+            quit_settings(event)
+
+    @kb.add("q", eager=True)
+    def quit_only(event):
+        if not busy():
+            quit_settings(event)
+
+    @kb.add("left")
+    def prev_tab(event):
+        if busy():
+            interface.cancel_popup()
+        else:
+            interface.switch_tab(-1)
+            event.app.invalidate()
+
+    @kb.add("right")
+    def next_tab(event):
+        if busy():
+            interface.cancel_popup()
+        else:
+            interface.switch_tab(1)
+            event.app.invalidate()
+
+    @kb.add("up")
+    def move_up(event):
+        if interface.popup_mode or not busy():
+            interface.move_selection(-1)
+            event.app.invalidate()
+
+    @kb.add("down")
+    def move_down(event):
+        if interface.popup_mode or not busy():
+            interface.move_selection(1)
+            event.app.invalidate()
+
+    @kb.add("enter")
+    def handle_enter(event):
+        if interface.popup_mode:
+            if interface.confirm_popup():
+                event.app.style = get_style()
+            event.app.invalidate()
+        elif interface.edit_mode:
+            interface.confirm_edit()
+            event.app.invalidate()
+        elif not interface.listening_mode:
+            interface.handle_enter()
+            event.app.invalidate()
+
+    @kb.add("backspace")
+    def handle_backspace(event):
+        if interface.edit_mode:
+            interface.backspace_edit_value()
+            event.app.invalidate()
+
+    @kb.add("delete")
+    def handle_delete(event):
+        if not interface.popup_mode and not interface.listening_mode:
+            interface.handle_delete()
+            event.app.invalidate()
+
+    @kb.add("c-s")
+    @kb.add("escape", "s")
+    def save_settings(event):
+        if interface.save_all():
+            notify("Settings saved successfully!", True)
+        else:
+            notify("Failed to save settings.", False)
+
+    @kb.add("c-q")
+    @kb.add("escape", "q")
+    def quit_no_save(event):
+        if interface.has_changes():
+            notify("Exiting without saving changes.", False)
+        quit_settings(event)
+
+    return kb
+
+
 def build_settings_layout(interface):
     colors = get_current_theme_colors()
     primary_hex = colors.get("primary")
@@ -36,6 +36,40 @@ def get_current_taskmgr_interface():
     return _current_interface
 
 
+def get_taskmgr_key_bindings(interface, on_quit):
+    """Task manager keys; on_quit(event) leaves the screen (exits the app when standalone)."""
+    kb = KeyBindings()
+
+    @kb.add("q", eager=True)
+    @kb.add("escape", eager=True)
+    def quit_taskmgr(event):
+        on_quit(event)
+
+    @kb.add("left")
+    def prev_tab(event):
+        interface.switch_tab(-1)
+
+    @kb.add("right")
+    def next_tab(event):
+        interface.switch_tab(1)
+
+    # PerformanceTab.ZOOM_SPANS runs live, 10m ... 24h: + narrows the span, - widens it
+    @kb.add("+")
+    @kb.add("=")
+    def zoom_in(event):
+        interface.zoom(-1)
+
+    @kb.add("-")
+    def zoom_out(event):
+        interface.zoom(1)
+
+    @kb.add("p")
+    def toggle_profiler(event):
+        interface.toggle_profiler()
+
+    return kb
+
+
 def build_taskmgr_layout(interface):
     # Fetch theme colors
     colors = get_current_theme_colors()
@@ -47,8 +81,8 @@ def build_taskmgr_layout(interface):
 
     kb = KeyBindings()
 
-    # NOTE: q handler moved to Application-level in myworld.py
-    # to ensure it works regardless of focus state
+    # NOTE: q and the other screen keys live in get_taskmgr_key_bindings and are
+    # installed at Application level so they work regardless of focus state
 
     # --- Layout Components ---
 
@@ -77,8 +111,7 @@ def build_taskmgr_layout(interface):
     # 2. Isolate Footer Keybindings
     tabs_kb = KeyBindings()
     
-    # NOTE: left/right handlers moved to Application-level in myworld.py
-    # to ensure they work regardless of focus state
+    # NOTE: left/right handlers are in get_taskmgr_key_bindings (Application level)
 
     tabs_window = Window(
         content=FormattedTextControl(interface.get_tabs_control, key_bindings=tabs_kb),
@@ -10,6 +10,8 @@ from rich.console import Console
 from rich.panel import Panel
 
 from core.constants import get_theme_primary
+from services.datasource import get_source, supports_handles
+from services.scheduler import get_scheduler
 
 
 
@@ -23,6 +25,7 @@ class DetailPanel:
         self.lock = threading.Lock()
         self.last_update_time = 0.0
         self.update_interval = 5.0
+        get_scheduler().register("details", self.update_interval)
 
         # Start background thread for expensive stats (Threads/Handles)
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
@@ -36,11 +39,12 @@ class DetailPanel:
                 handles = 0
                 # Efficiently iterate processes. ad_value=0 handles AccessDenied gracefully.
                 # 'num_handles' is available on Windows.
-                for p in psutil.process_iter(
-                    attrs=["num_threads", "num_handles"], ad_value=0
-                ):
-                    threads += p.info.get("num_threads") or 0
-                    handles += p.info.get("num_handles") or 0
+                source = get_source()
+                attrs = ["num_threads", "num_handles"] if supports_handles(source) else ["num_threads"]
+                with get_scheduler().measure("details"):
+                    for p in source.process_iter(attrs=attrs, ad_value=0):
+                        threads += p.info.get("num_threads") or 0
+                        handles += p.info.get("num_handles") or 0
 
                 with self.lock:
                     self.sys_threads = threads
@@ -48,8 +52,8 @@ class DetailPanel:
             except psutil.Error:
                 pass
 
-            # Sleep in chunks to allow responsive stopping (update every 5s to save CPU)
-            for _ in range(50):
+            # Sleep in chunks to allow responsive stopping (5s base, backed off by the scheduler)
+            for _ in range(int(get_scheduler().get_interval("details", 5.0) / 0.1)):
                 if not self.running:
                     break
                 sleep(0.1)
@@ -62,12 +66,13 @@ class DetailPanel:
         self.last_update_time = current_time
 
         try:
-            boot_time = psutil.boot_time()
+            source = get_source()
+            boot_time = source.boot_time()
             uptime_seconds = time() - boot_time
 
             with self.lock:
                 self.sys_uptime = str(datetime.timedelta(seconds=int(uptime_seconds)))
-                self.sys_procs = len(psutil.pids())
+                self.sys_procs = len(source.pids())
         except psutil.Error:
             pass
 
@@ -1,9 +1,20 @@
 from typing import Any
 
+from services.profiler import get_profiler
+
 
 class BaseTab:
     def __init__(self, parent):
         self.parent = parent
+        self.profile_name = type(self).__name__.replace("Tab", "").lower()
+
+    def timed_update(self, current_time: float) -> bool:
+        with get_profiler().timer("tab.update", self.profile_name):
+            return self.update(current_time)
+
+    def timed_render(self) -> Any:
+        with get_profiler().timer("tab.render", self.profile_name):
+            return self.render()
 
     def update(self, current_time: float) -> bool:
         raise NotImplementedError
@@ -10,6 +10,9 @@ from services.monitors.cpu_monitor import CPUMonitor
 from services.monitors.gpu_monitor import GPUMonitor
 from services.monitors.net_monitor import NetMonitor
 from services.monitors.ram_monitor import RAMMonitor
+from services.datasource import get_source
+from services.rollups import format_span
+from services.snapshot import build_self_metrics, build_snapshot, get_snapshot_store
 from core.logger import get_worker_logger
 from core.theme_engine import get_current_theme_colors
 from core.constants import config_manager
@@ -30,6 +33,9 @@ def _log_debug(module_name, message):
 
 
 class PerformanceTab(BaseTab):
+    # Graph time spans in seconds; None is the live raw view
+    ZOOM_SPANS = [None, 600, 3600, 6 * 3600, 24 * 3600]
+
     def __init__(self, parent):
         super().__init__(parent)
         self.cpu_monitor = CPUMonitor()
@@ -46,6 +52,58 @@ class PerformanceTab(BaseTab):
         self._invalidate_lock = threading.Lock()
         self._monitors = [self.cpu_monitor, self.ram_monitor, self.gpu_monitor, self.net_monitor]
         self._has_update = False
+        # Monitors sampled while hidden; their frames are re-rendered on activation
+        self._stale_monitors = set()
+        self._stale_lock = threading.Lock()
+        self.zoom_index = 0
+        # Last render duration per panel, reported as a self-metric
+        self.render_seconds = {}
+
+    def _is_visible(self):
+        try:
+            return self.parent.is_tab_visible(self.parent.TAB_PERFORMANCE)
+        except Exception:
+            return False
+
+    def _render_or_defer(self, monitor, width, height):
+        """Render only while visible; hidden tabs keep sampling into history and render on activation."""
+        if self._is_visible():
+            self._timed_render(monitor, width, height)
+        else:
+            with self._stale_lock:
+                self._stale_monitors.add(monitor)
+
+    def _render_stale(self):
+        with self._stale_lock:
+            stale = list(self._stale_monitors)
+            self._stale_monitors.clear()
+        if not stale:
+            return
+        width, height = self._calculate_graph_dimensions()
+        for monitor in stale:
+            try:
+                self._timed_render(monitor, width, height)
+            except Exception:
+                _worker_logger.log_error("render_stale", traceback.format_exc())
+
+    def _timed_render(self, monitor, width, height):
+        with monitor._data_lock:
+            self.render_seconds[monitor.collector_name] = monitor.render_frame(width, height)
+
+    def _publish_snapshot(self):
+        import psutil
+        try:
+            process_count = len(get_source().pids())
+        except psutil.Error:
+            process_count = None
+        get_snapshot_store().publish(build_snapshot(
+            cpu=self.cpu_monitor,
+            ram=self.ram_monitor,
+            gpu=self.gpu_monitor,
+            net=self.net_monitor,
+            process_count=process_count,
+            self_metrics=build_self_metrics(self.render_seconds),
+        ))
 
     def _try_invalidate(self):
         try:
@@ -108,13 +166,12 @@ class PerformanceTab(BaseTab):
                     if self.cpu_monitor.update():
                         cpu_val = self.cpu_monitor.last_value
                         _log_lifecycle("CPU_RAM", f"FETCHED: CPU={cpu_val} | hist_len={len(self.cpu_monitor.history)}")
-                        with self.cpu_monitor._data_lock:
-                            self.cpu_monitor.render(width, height)
+                        self._render_or_defer(self.cpu_monitor, width, height)
                     if self.ram_monitor.update():
                         ram_val = self.ram_monitor.last_value
                         _log_lifecycle("CPU_RAM", f"FETCHED: RAM={ram_val} | hist_len={len(self.ram_monitor.history)}")
-                        with self.ram_monitor._data_lock:
-                            self.ram_monitor.render(width, height)
+                        self._render_or_defer(self.ram_monitor, width, height)
+                        self._publish_snapshot()
                     self._try_invalidate()
                 except Exception:
                     _worker_logger.log_error("worker_cpu_ram", traceback.format_exc())
@@ -128,8 +185,7 @@ class PerformanceTab(BaseTab):
                 try:
                     width, height = self._calculate_graph_dimensions()
                     if self.gpu_monitor.update():
-                        with self.gpu_monitor._data_lock:
-                            self.gpu_monitor.render(width, height)
+                        self._render_or_defer(self.gpu_monitor, width, height)
                     self._try_invalidate()
                 except Exception:
                     _worker_logger.log_error("worker_gpu", traceback.format_exc())
@@ -143,8 +199,7 @@ class PerformanceTab(BaseTab):
                 try:
                     width, height = self._calculate_graph_dimensions()
                     if self.net_monitor.update():
-                        with self.net_monitor._data_lock:
-                            self.net_monitor.render(width, height)
+                        self._render_or_defer(self.net_monitor, width, height)
                     self._try_invalidate()
                 except Exception:
                     _worker_logger.log_error("worker_net", traceback.format_exc())
@@ -174,6 +229,24 @@ class PerformanceTab(BaseTab):
         self._stop_event_net.clear()
         _log_debug("PERF", "workers_stopped")
 
+    def set_zoom(self, direction):
+        index = max(0, min(len(self.ZOOM_SPANS) - 1, self.zoom_index + direction))
+        if index == self.zoom_index:
+            return False
+        self.zoom_index = index
+        for monitor in self._monitors:
+            monitor.zoom_span = self.ZOOM_SPANS[index]
+        # Redraw every graph at the new span now instead of waiting for the next sample
+        with self._stale_lock:
+            self._stale_monitors.update(self._monitors)
+        self._render_stale()
+        self._has_update = True
+        return True
+
+    def get_zoom_label(self):
+        span = self.ZOOM_SPANS[self.zoom_index]
+        return format_span(span) if span else "live"
+
     def update(self, current_time: float) -> bool:
         if self._has_update:
             self._has_update = False
@@ -256,6 +329,8 @@ class PerformanceTab(BaseTab):
 
     def on_activate(self):
         _log_debug("PERF", f"on_activate CALLED: existing_threads={len(self._worker_threads)}")
+        # Catch up immediately from the history sampled while hidden
+        self._render_stale()
         self._has_update = True
         if not self._worker_threads:
             interval = config_manager.get().get("process_update_interval", 0.5)
@@ -264,5 +339,5 @@ class PerformanceTab(BaseTab):
             _log_debug("PERF", "SKIP_start_workers: threads already running")
 
     def on_deactivate(self):
-        _log_debug("PERF", "on_deactivate CALLED")
-        self.stop_workers()
\ No newline at end of file
+        # Workers keep sampling into history while hidden; only rendering is paused
+        _log_debug("PERF", "on_deactivate CALLED")
\ No newline at end of file
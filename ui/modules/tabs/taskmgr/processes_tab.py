@@ -1,24 +1,20 @@
-import io
 import os
 import json
 import shutil
 import re
 import threading
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 import psutil
-from prompt_toolkit.formatted_text import ANSI
-from rich.console import Console
 
-from commands.functions.theme.theme_logic import get_current_theme_colors
+from core.theme_engine import STYLE_ROLES as ROLES
 from ..base_tab import BaseTab
 from core.constants import config_manager
+from services.datasource import get_source, supports_handles
+from services.scheduler import get_scheduler
 
 UI_OFFSET = 5
 
-_ANSI_BUFFER = io.StringIO()
-_ANSI_CONSOLE = Console(file=_ANSI_BUFFER, force_terminal=True, width=120, color_system="truecolor")
-
 SYSTEM_USERS = {"system", "local service", "network service", "localservice", "networkservice"}
 SYSTEM_EXES = {"svchost.exe", "lsass.exe", "lsm.exe", "services.exe", "wininit.exe", 
                "csrss.exe", "smss.exe", "winlogon.exe", "dwm.exe", "explorer.exe"}
@@ -51,7 +47,6 @@ class ProcessesTab(BaseTab):
     def __init__(self, parent):
         super().__init__(parent)
         self.processes: List[Dict[str, Any]] = []
-        self.procs: Dict[int, Any] = {}
         self.last_fetch_time = 0
         self.selected_index = 0
         self.scroll_offset = 0
@@ -60,16 +55,17 @@ class ProcessesTab(BaseTab):
         self._last_config_hash = 0
         self._data_lock = threading.Lock()
 
-        psutil.cpu_percent(interval=None)
+        get_source().cpu_percent(interval=None)
+        get_scheduler().register("processes", config_manager.get().get("process_update_interval", 0.5))
 
-        self._cached_content: Optional[ANSI] = None
+        self._cached_content: Optional[List[Tuple[str, str]]] = None
         self._cached_process_hash: Optional[int] = None
 
     def update(self, current_time: float) -> bool:
         config = config_manager.get()
         taskmgr_config = config.get("taskmgr", {})
         show_system = taskmgr_config.get("exclude_system_apps", True)
-        interval = config.get("process_update_interval", 0.5)
+        interval = get_scheduler().get_interval("processes", config.get("process_update_interval", 0.5))
         
         config_hash = hash(str(show_system))
         
@@ -78,7 +74,7 @@ class ProcessesTab(BaseTab):
             or (current_time - self.last_fetch_time) >= interval
             or config_hash != self._last_config_hash
         ):
-            with self._data_lock:
+            with self._data_lock, get_scheduler().measure("processes"):
                 self._fetch_processes(config)
             self.last_fetch_time = current_time
             self._data_changed = True
@@ -95,8 +91,10 @@ class ProcessesTab(BaseTab):
         
         collected = 0
         skip_system = show_system
+        source = get_source()
+        has_handles = supports_handles(source)
 
-        for p in psutil.process_iter(["pid", "name", "username", "exe"]):
+        for p in source.process_iter(["pid", "name", "username", "exe"]):
             if collected >= process_limit:
                 break
             try:
@@ -123,7 +121,8 @@ class ProcessesTab(BaseTab):
                         info["cpu_percent"] = min(100.0, max(0.0, p.cpu_percent(interval=None)))
                         info["memory_percent"] = p.memory_percent()
                         info["num_threads"] = p.num_threads()
-                        info["num_handles"] = p.num_handles()
+                        if has_handles:
+                            info["num_handles"] = p.num_handles()
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass
 
@@ -133,30 +132,36 @@ class ProcessesTab(BaseTab):
                 pass
 
         self.processes = sorted(process_list, key=lambda x: x["pid"])
-        self.procs = {}
 
-    def _format_row(self, pid_str: str, name_str: str, user_str: str, 
+    def _header_fragments(self):
+        w = COL_WIDTHS
+        return [
+            (ROLES["header.key"], f"{'PID':<{w['pid']}}"),
+            (ROLES["header"], f"{'Process Name':<{w['name']}}"),
+            (ROLES["header"], f"{'User':<{w['user']}}"),
+            (ROLES["header.metric"], f"{'Threads':>{w['threads']}}"),
+            (ROLES["header.metric"], f"{'Handles':>{w['handles']}}"),
+            (ROLES["header.metric"], f"{'CPU %':>{w['cpu']}}"),
+            (ROLES["header.metric"], f"{'Memory %':>{w['mem']}}"),
+            ("", "\n"),
+        ]
+
+    def _format_row(self, pid_str: str, name_str: str, user_str: str,
                     threads: int, handles: int, cpu_pct: float, mem_pct: float,
-                    is_selected: bool, colors: Dict[str, str]) -> str:
+                    is_selected: bool) -> List[Tuple[str, str]]:
         w = COL_WIDTHS
-        pid_color = colors.get("primary", colors.get("secondary", ""))
-        mem_color = colors.get("accent", colors.get("tab_accent", colors.get("secondary", "")))
-        primary_hex = colors.get("primary")
-        secondary_hex = colors.get("secondary")
-        suggestion_bg = colors.get("suggestion_bg", colors.get("primary", ""))
-        table_text = colors.get("table_text", "white")
-
-        pid_col = f"[{pid_color}]{pid_str:<{w['pid']}}[/]"
-        name_col = f"[{table_text}]{name_str:<{w['name']}}[/]"
-        user_col = f"[{primary_hex}]{user_str:<{w['user']}}[/]"
-        th_col = f"[{secondary_hex}]{threads:>{w['threads']}}[/]"
-        hd_col = f"[{secondary_hex}]{handles:>{w['handles']}}[/]"
-        cpu_col = f"[{secondary_hex}]{cpu_pct:>{w['cpu']}.1f}[/]"
-        mem_col = f"[{mem_color}]{mem_pct:>{w['mem']}.1f}[/]"
-
-        if is_selected:
-            return f"[on {suggestion_bg}]{pid_col}{name_col}{user_col}{th_col}{hd_col}{cpu_col}{mem_col}[/on {suggestion_bg}]"
-        return f"{pid_col}{name_col}{user_col}{th_col}{hd_col}{cpu_col}{mem_col}"
+        # Styles are precompiled per theme (core.theme_engine.STYLE_ROLES); no markup to parse
+        sel = " " + ROLES["selected"] if is_selected else ""
+        return [
+            (ROLES["pid"] + sel, f"{pid_str:<{w['pid']}}"),
+            (ROLES["name"] + sel, f"{name_str:<{w['name']}}"),
+            (ROLES["user"] + sel, f"{user_str:<{w['user']}}"),
+            (ROLES["count"] + sel, f"{threads:>{w['threads']}}"),
+            (ROLES["count"] + sel, f"{handles:>{w['handles']}}"),
+            (ROLES["metric"] + sel, f"{cpu_pct:>{w['cpu']}.1f}"),
+            (ROLES["memory"] + sel, f"{mem_pct:>{w['mem']}.1f}"),
+            ("", "\n"),
+        ]
 
     def render(self):
         term_height = shutil.get_terminal_size().lines
@@ -168,31 +173,11 @@ class ProcessesTab(BaseTab):
         visible_rows = self.visible_rows
         total_count = len(current_processes)
 
-        colors = get_current_theme_colors()
-        w = COL_WIDTHS
-        
-        primary_hex = colors.get("primary", colors.get("secondary", ""))
-        table_text = colors.get("table_text", "white")
-        secondary_hex = colors.get("secondary", colors.get("primary", ""))
-        accent = colors.get("accent", colors.get("tab_accent", colors.get("secondary", "")))
-
-        _ANSI_BUFFER.seek(0)
-        _ANSI_BUFFER.truncate(0)
-
         if total_count == 0:
-            header_parts = [
-                f"[bold {primary_hex}]{'PID':<{w['pid']}}[/]",
-                f"[bold {table_text}]{'Process Name':<{w['name']}}[/]",
-                f"[bold {table_text}]{'User':<{w['user']}}[/]",
-                f"[bold {accent}]{'Threads':>{w['threads']}}[/]",
-                f"[bold {accent}]{'Handles':>{w['handles']}}[/]",
-                f"[bold {accent}]{'CPU %':>{w['cpu']}}[/]",
-                f"[bold {accent}]{'Memory %':>{w['mem']}}[/]",
+            self._cached_content = self._header_fragments() + [
+                (ROLES["dim"], "Loading processes...\n"),
+                (ROLES["dim"], "Press Left/Right to switch tabs\n"),
             ]
-            _ANSI_CONSOLE.print(" ".join(header_parts))
-            _ANSI_CONSOLE.print("[dim]Loading processes...[/dim]")
-            _ANSI_CONSOLE.print("[dim]Press Left/Right to switch tabs[/dim]")
-            self._cached_content = ANSI(_ANSI_BUFFER.getvalue())
             return self._cached_content
 
         max_idx = total_count - 1
@@ -212,30 +197,15 @@ class ProcessesTab(BaseTab):
             self.scroll_offset = self.selected_index - visible_rows + 1
 
         top_50_pids = frozenset(p["pid"] for p in current_processes[:50])
-        process_hash = hash((total_count, top_50_pids, self.visible_rows, self.scroll_offset))
+        process_hash = hash((total_count, top_50_pids, self.visible_rows, self.scroll_offset, self.selected_index))
 
         if process_hash == self._cached_process_hash and self._cached_content is not None:
             return self._cached_content
 
         w = COL_WIDTHS
-
-        _ANSI_BUFFER.seek(0)
-        _ANSI_BUFFER.truncate(0)
-
-        header_parts = [
-            f"[bold {primary_hex}]{'PID':<{w['pid']}}[/]",
-            f"[bold {table_text}]{'Process Name':<{w['name']}}[/]",
-            f"[bold {table_text}]{'User':<{w['user']}}[/]",
-            f"[bold {accent}]{'Threads':>{w['threads']}}[/]",
-            f"[bold {accent}]{'Handles':>{w['handles']}}[/]",
-            f"[bold {accent}]{'CPU %':>{w['cpu']}}[/]",
-            f"[bold {accent}]{'Memory %':>{w['mem']}}[/]",
-        ]
-        header = "".join(header_parts)
-        _ANSI_CONSOLE.print(header)
-
+        fragments = self._header_fragments()
         sep = " " + "-" * (w['pid'] + w['name'] + w['user'] + w['threads'] + w['handles'] + w['cpu'] + w['mem'] + 6)
-        _ANSI_CONSOLE.print(f"[dim]{sep}[/dim]")
+        fragments.append((ROLES["dim"], sep + "\n"))
 
         start_idx = max(0, min(self.scroll_offset, total_count - 1))
         end_idx = min(total_count, start_idx + visible_rows)
@@ -256,12 +226,11 @@ class ProcessesTab(BaseTab):
             except (KeyError, TypeError, ValueError, AttributeError):
                 continue
 
-            row = self._format_row(
-                pid_str, name_str, user_short, threads, handles, cpu_pct, mem_pct, is_selected, colors
-            )
-            _ANSI_CONSOLE.print(row)
+            fragments.extend(self._format_row(
+                pid_str, name_str, user_short, threads, handles, cpu_pct, mem_pct, is_selected
+            ))
 
-        self._cached_content = ANSI(_ANSI_BUFFER.getvalue())
+        self._cached_content = fragments
         self._cached_process_hash = process_hash
         return self._cached_content
 
@@ -269,13 +238,11 @@ class ProcessesTab(BaseTab):
         self._data_changed = True
 
     def on_deactivate(self):
-        self.processes = []
-        self.procs = {}
-        self._cached_content = None
-        self._cached_process_hash = None
+        # Keep the last snapshot so re-activation renders it at once; it is only marked
+        # stale, so the first tick after activation fetches a fresh one
+        self.last_fetch_time = 0
 
     def clear_data(self):
         self.processes = []
-        self.procs = {}
         self._cached_content = None
         self._cached_process_hash = None
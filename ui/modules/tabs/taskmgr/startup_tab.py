@@ -10,6 +10,7 @@ from rich.table import Table
 from commands.functions.system.system_logic import get_startup_apps
 from ..base_tab import BaseTab
 from core.constants import config_manager, get_theme_primary, get_theme_color
+from core.theme_engine import get_theme_version
 
 UI_OFFSET = 5
 
@@ -53,6 +54,7 @@ class StartupTab(BaseTab):
             len(self.startup_apps),
             term_height,
             self.selected_index,
+            get_theme_version(),
         )
 
         if self._cached_content and self._cached_content_hash == data_hash:
@@ -101,9 +103,7 @@ class StartupTab(BaseTab):
         self._data_changed = True
 
     def on_deactivate(self):
-        self.startup_apps = []
-        self._cached_content = None
-        self._cached_content_hash = None
+        pass
 
     def clear_data(self):
         self.startup_apps = []
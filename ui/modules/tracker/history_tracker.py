@@ -1,10 +1,125 @@
+"""Command-result history for /copy.
+
+Each entry keeps its result as a list of chunks rather than one growing
+string, and once an entry's output passes the spill threshold it is moved to
+an anonymous temp file. The tracker keeps at most `max_entries` entries and
+drops the oldest while the total exceeds `max_bytes` (text kept in memory is
+counted in characters, spilled text in UTF-8 bytes). Readers stream results
+with iter_chunks() instead of building the whole session as one string.
+"""
+import codecs
+import os
+import tempfile
+import threading
+
+from core.config_manager import ConfigManager
+
+MAX_ENTRIES = 10
+MAX_BYTES = 64 * 1024 * 1024
+SPILL_BYTES = 1024 * 1024
+READ_BLOCK = 64 * 1024
+
+
+class HistoryEntry:
+    """One command and its captured output."""
+
+    __slots__ = (
+        "command", "_chunks", "_memory_size", "_spill", "_spill_size",
+        "_spill_dir", "_spill_threshold", "_lock",
+    )
+
+    def __init__(self, command, spill_threshold=SPILL_BYTES, spill_dir=None):
+        self.command = command
+        self._chunks = []
+        self._memory_size = 0
+        self._spill = None
+        self._spill_size = 0
+        self._spill_dir = spill_dir
+        self._spill_threshold = spill_threshold
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        return self._memory_size + self._spill_size
+
+    @property
+    def spilled(self):
+        return self._spill is not None
+
+    def append(self, text):
+        if not text:
+            return
+        with self._lock:
+            self._chunks.append(text)
+            self._memory_size += len(text)
+            if self._memory_size >= self._spill_threshold:
+                self._spill_chunks()
+
+    def _spill_chunks(self):
+        try:
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile(prefix="mycolor-history-", dir=self._spill_dir or None)
+            data = "".join(self._chunks).encode("utf-8")
+            self._spill.seek(0, os.SEEK_END)
+            self._spill.write(data)
+        except OSError:
+            # No usable temp dir: keep the output in memory
+            return
+        self._spill_size += len(data)
+        self._chunks = []
+        self._memory_size = 0
+
+    def iter_chunks(self, block_size=READ_BLOCK):
+        """Yield the result text in pieces: spilled part from disk first, then what is still in memory."""
+        offset = 0
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            with self._lock:
+                if self._spill is None or offset >= self._spill_size:
+                    # Spilling moves chunks to the file, so take the memory part under the same lock
+                    tail = list(self._chunks)
+                    break
+                self._spill.seek(offset)
+                data = self._spill.read(min(block_size, self._spill_size - offset))
+            offset += len(data)
+            text = decoder.decode(data)
+            if text:
+                yield text
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+        yield from tail
+
+    @property
+    def result(self):
+        """The whole result as one string; prefer iter_chunks() for large output."""
+        return "".join(self.iter_chunks())
+
+    def close(self):
+        with self._lock:
+            if self._spill is not None:
+                try:
+                    self._spill.close()
+                except OSError:
+                    pass
+                self._spill = None
+            self._chunks = []
+            self._memory_size = self._spill_size = 0
+
+
 class HistoryTracker:
     """Stores command-result pairs in structured format, separate from UI rendering."""
-    
-    def __init__(self):
-        self.history = []  # List of dicts: [{"command": str, "result": str}]
+
+    def __init__(self, max_entries=None, max_bytes=None, spill_bytes=None, spill_dir=None):
+        config = ConfigManager().get_nested("session_history") or {}
+        self.max_entries = max(1, int(max_entries or config.get("max_entries", MAX_ENTRIES)))
+        self.max_bytes = int(max_bytes or config.get("max_bytes", MAX_BYTES))
+        self.spill_bytes = int(spill_bytes or config.get("spill_bytes", SPILL_BYTES))
+        self.spill_dir = spill_dir or config.get("spill_dir") or None
+        self.history = []  # HistoryEntry objects, oldest first
         self.is_capturing = False
-    
+        self._lock = threading.Lock()
+
     def start_new_entry(self, command_text):
         """
         Called when a user presses Enter in the input area.
@@ -14,28 +129,64 @@ class HistoryTracker:
         if clean_cmd.startswith('/copy'):
             self.is_capturing = False
             return
-        
+
         self.is_capturing = True
-        # Ensure we always have a clean string to append to
-        self.history.append({"command": clean_cmd, "result": ""})
-        # Limit history to 10 entries for memory efficiency
-        if len(self.history) > 10:
-            self.history.pop(0)
-    
+        with self._lock:
+            self.history.append(HistoryEntry(clean_cmd, self.spill_bytes, self.spill_dir))
+            while len(self.history) > self.max_entries:
+                self.history.pop(0).close()
+            self._enforce_budget()
+
     def append_result(self, text):
         """Crucial: Ensure text is appended with its original newlines."""
         if self.is_capturing and self.history:
-            # Append raw text exactly as received from the system stream
-            self.history[-1]["result"] += text
+            self.history[-1].append(text)
+            with self._lock:
+                self._enforce_budget()
+
+    def _enforce_budget(self):
+        # The entry being captured is always kept, however large
+        total = sum(entry.size for entry in self.history)
+        while len(self.history) > 1 and total > self.max_bytes:
+            oldest = self.history.pop(0)
+            total -= oldest.size
+            oldest.close()
 
     def get_entries(self):
-        return self.history
+        """Snapshot of the current entries, oldest first."""
+        with self._lock:
+            return list(self.history)
+
+    def iter_entries(self, last=None):
+        """Iterate (command, chunk_iterator) pairs, optionally only the last N."""
+        entries = self.get_entries()
+        if last is not None:
+            entries = entries[-last:] if last > 0 else []
+        for entry in entries:
+            yield entry.command, entry.iter_chunks()
+
+    def total_size(self):
+        with self._lock:
+            return sum(entry.size for entry in self.history)
+
+    def clear(self):
+        with self._lock:
+            for entry in self.history:
+                entry.close()
+            self.history = []
+        self.is_capturing = False
 
 
 # Global instance
-_history_tracker = HistoryTracker()
+_history_tracker = None
+_tracker_lock = threading.Lock()
 
 
 def get_history_tracker():
     """Return the global HistoryTracker instance."""
+    global _history_tracker
+    if _history_tracker is None:
+        with _tracker_lock:
+            if _history_tracker is None:
+                _history_tracker = HistoryTracker()
     return _history_tracker
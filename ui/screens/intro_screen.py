@@ -1,5 +1,3 @@
-import io
-
 from prompt_toolkit.formatted_text import ANSI
 from prompt_toolkit.layout.containers import (
     Float,
@@ -11,22 +9,12 @@ from prompt_toolkit.layout.containers import (
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout.dimension import Dimension
 from prompt_toolkit.layout.menus import CompletionsMenu
-from rich.align import Align
-from rich.console import Console
 
-from core.theme_engine import get_current_theme
+from core.theme_engine import get_current_theme_name, get_theme_version
 from ui.components.footer import get_footer_container
 from ui.components.input_area import RoundedFrame
-from ui.components.logo import get_logo_renderable
-from ui.components.tips import get_tips_renderable
-
-
-def rich_to_ansi(renderable, width):
-    """Renders a Rich object to an ANSI string."""
-    buffer = io.StringIO()
-    console = Console(file=buffer, force_terminal=True, width=width)
-    console.print(renderable)
-    return buffer.getvalue()
+from ui.components.intro_assets import get_intro_ansi
+from ui.styles.logo_styles import get_configured_logo_style
 
 
 def get_intro_screen_container(input_area):
@@ -36,17 +24,22 @@ def get_intro_screen_container(input_area):
     """
     content_width = 100  # Fixed width for content
 
+    # Pre-rendered ANSI from the asset cache, parsed once per theme/logo style
+    cached = {"key": None, "logo": None, "tips": None}
+
+    def _refresh():
+        key = (get_current_theme_name(), get_theme_version(), get_configured_logo_style())
+        if cached["key"] != key:
+            logo, tips = get_intro_ansi(content_width, key[0], key[2])
+            cached.update(key=key, logo=ANSI(logo), tips=ANSI(tips))
+
     def get_logo_text():
-        logo_renderable = get_logo_renderable(
-            content_width, get_current_theme()
-        )
-        return ANSI(rich_to_ansi(logo_renderable, content_width))
+        _refresh()
+        return cached["logo"]
 
     def get_tips_text():
-        tips_renderable = Align.center(
-            get_tips_renderable(get_current_theme())
-        )
-        return ANSI(rich_to_ansi(tips_renderable, content_width))
+        _refresh()
+        return cached["tips"]
 
     # Content Cluster
     content = HSplit(
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import platform
 import shutil
 import socket
 import threading
@@ -14,12 +15,28 @@ from core.theme_engine import get_current_theme_colors, get_current_theme
 from core.logger import write_log, get_log_path, CrashLogger, get_worker_logger
 from ui.modules.panels.detail_panel import DetailPanel
 from ui.modules.tabs import ProcessesTab, PerformanceTab, StartupTab
+from services.scheduler import get_scheduler
+from services.metrics_server import start_metrics_server, stop_metrics_server
+from services.profiler import get_profiler
+from services.timeseries import close_stores
 
 
 _taskmgr_logger = CrashLogger("taskmgr", "ui")
 worker_logger = get_worker_logger()
 
 
+def is_console_minimized():
+    """Best-effort check whether the hosting console window is minimised (Windows only)."""
+    if platform.system() != "Windows":
+        return False
+    try:
+        import ctypes
+        hwnd = ctypes.windll.kernel32.GetConsoleWindow()
+        return bool(hwnd) and bool(ctypes.windll.user32.IsIconic(hwnd))
+    except (AttributeError, OSError):
+        return False
+
+
 class TaskManagerInterface:
     TAB_PROCESSES = 0
     TAB_PERFORMANCE = 1
@@ -38,6 +55,9 @@ class TaskManagerInterface:
         self._stop_event = threading.Event()
         self._data_lock = threading.Lock()
         self._first_pulse = True
+        # Cleared while an embedded task manager is hidden; update_loop waits on it
+        self._shown = asyncio.Event()
+        self._shown.set()
 
         self.blueprints = {
             "mini": {
@@ -74,12 +94,40 @@ class TaskManagerInterface:
         if hasattr(perf_tab, 'start_workers'):
             perf_tab.start_workers(self._process_update_interval)
 
+        if config_manager.get().get("taskmgr", {}).get("metrics_server", False):
+            start_metrics_server()
+
+        self.show_profiler = config_manager.get().get("taskmgr", {}).get("show_profiler", False)
+        if hasattr(self.app, "after_render"):
+            self.app.after_render.add_handler(self._on_frame_drawn)
+
         self._data_changed = True
 
     def _load_initial_visibility(self):
         current_width = shutil.get_terminal_size().columns
         self.show_sidebar = current_width >= self.FULL_THRESHOLD
 
+    def _on_frame_drawn(self, _app=None):
+        if self.app.app_state.get("current_screen") == "taskmgr":
+            get_profiler().frame_drawn()
+
+    def toggle_profiler(self):
+        self.show_profiler = not self.show_profiler
+        self.app.invalidate()
+
+    def zoom(self, direction):
+        if self.active_tab != self.TAB_PERFORMANCE:
+            return
+        if self.tabs[self.TAB_PERFORMANCE].set_zoom(direction):
+            with self._data_lock:
+                self._data_changed = True
+            self.app.invalidate()
+
+    def is_tab_visible(self, tab):
+        if self.app.app_state.get("current_screen") != "taskmgr":
+            return False
+        return self.active_tab == tab and not is_console_minimized()
+
     def _apply_blueprint(self, mode):
         bp = self.blueprints.get(mode, self.blueprints["mini"])
         self.SIDEBAR_WIDTH = bp["blocks"].get("details", {}).get("w", 0)
@@ -108,8 +156,11 @@ class TaskManagerInterface:
                         f.write(f"[{monotonic():.3f}] UI PULSE | tab:{self.active_tab} | screen:{self.app.app_state.get('current_screen')}\n")
                     current_time = time()
                     current_tab = self.tabs[self.active_tab]
-                    
-                    if current_tab.update(current_time):
+
+                    # Minimised: skip the process/startup walks; performance workers keep sampling history
+                    if self.active_tab != self.TAB_PERFORMANCE and is_console_minimized():
+                        pass
+                    elif current_tab.timed_update(current_time):
                         with self._data_lock:
                             self._data_changed = True
 
@@ -127,6 +178,10 @@ class TaskManagerInterface:
             perf_tab = self.tabs[self.TAB_PERFORMANCE]
             if hasattr(perf_tab, 'stop_workers'):
                 perf_tab.stop_workers()
+            if hasattr(perf_tab, 'gpu_monitor'):
+                perf_tab.gpu_monitor.stop()
+            close_stores()
+            stop_metrics_server()
         except Exception:
             pass
         try:
@@ -164,9 +219,28 @@ class TaskManagerInterface:
         self._stop_event.set()
         self.running = False
 
+    def show(self):
+        """Screen shown again (embedded): catch up on what was sampled while hidden."""
+        self.first_render = True
+        tab = self.tabs[self.active_tab]
+        tab.on_activate()
+        with self._data_lock:
+            self._data_changed = True
+            if hasattr(tab, 'last_fetch_time'):
+                tab.last_fetch_time = 0
+        self._shown.set()
+
+    def hide(self):
+        """Screen left (embedded): monitors keep sampling, nothing is redrawn."""
+        self._shown.clear()
+
     async def update_loop(self):
         try:
             while self.running:
+                if not self._shown.is_set():
+                    await self._shown.wait()
+                    continue
+
                 current_width = shutil.get_terminal_size().columns
                 new_mode = "full" if current_width >= self.FULL_THRESHOLD else "mini"
 
@@ -205,7 +279,7 @@ class TaskManagerInterface:
         return self.detail_panel.render(self.SIDEBAR_WIDTH)
 
     def get_content(self):
-        return self.tabs[self.active_tab].render()
+        return self.tabs[self.active_tab].timed_render()
 
     def get_cpu(self):
         perf_tab = self.tabs[self.TAB_PERFORMANCE]
@@ -259,9 +333,18 @@ class TaskManagerInterface:
         return text
 
     def get_hints(self):
+        if self.active_tab == self.TAB_PERFORMANCE:
+            zoom = self.tabs[self.TAB_PERFORMANCE].get_zoom_label()
+            return [
+                ("class:footer-pad", f" q: Quit | ←→: Switch Tabs | +/-: Zoom ({zoom}) | p: Profiler ")
+            ]
         return [
-            ("class:footer-pad", " q: Quit | ←→: Switch Tabs ")
+            ("class:footer-pad", " q: Quit | ←→: Switch Tabs | p: Profiler ")
         ]
 
     def get_status_bar(self):
-        return [("class:status", f" {os.getcwd()} | {socket.gethostname()} | v0.0.1 ")]
\ No newline at end of file
+        if self.show_profiler:
+            return [("class:status", f" {get_profiler().get_status_text()} ")]
+        sampling = get_scheduler().get_status_text(["processes", "net", "details"])
+        sampling = f"{sampling} | " if sampling else ""
+        return [("class:status", f" {sampling}{os.getcwd()} | {socket.gethostname()} | v0.0.1 ")]
\ No newline at end of file
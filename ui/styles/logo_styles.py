@@ -1,4 +1,14 @@
 # Raw logo style definitions
+from core.config_manager import get_manager
+
+
+def get_configured_logo_style():
+    """Logo style name from settings.json (customs.logo_style); no rendering imports needed."""
+    style = get_manager().get_nested("customs", "logo_style", default="gradient")
+    if isinstance(style, str):
+        return style
+    return "gradient"
+
 
 # Gradient style (current): uses █ for logo, ░ for shadow
 GRADIENT_M = [
@@ -1,11 +1,15 @@
-from prompt_toolkit.styles import Style as PTStyle
-from core.theme_engine import get_current_theme_colors, get_pt_color_hex
+from core.theme_engine import get_cached_style, get_current_theme_colors, get_pt_color_hex
 
 _current_style = None
 
 
 def get_theme_style():
     global _current_style
+    _current_style = get_cached_style("theme", _theme_style_rules)
+    return _current_style
+
+
+def _theme_style_rules():
     colors = get_current_theme_colors()
     primary_hex = get_pt_color_hex(colors.get("primary", "#A9B7C6"))
     suggestion_bg = colors.get("suggestion_bg", "#3B3F41")
@@ -16,7 +20,7 @@ def get_theme_style():
     popup_text = colors.get("popup_text", "#BBBBBB")
     selected_fg = colors.get("selected_fg", "#000000")
 
-    _current_style = PTStyle.from_dict({
+    return {
         "app-background": f"bg:{background}",
         "output-field": f"bg:{background} fg:{colors.get('table_text', 'white')}",
         "input-field": f"bg:{background} fg:{primary_hex}",
@@ -41,9 +45,7 @@ def get_theme_style():
         "success": f"fg:{colors.get('success', '#00FF41')}",
         "error": f"fg:{colors.get('error', '#FF0000')}",
         "warning": f"fg:{colors.get('warning', '#FFFF00')}",
-    })
-
-    return _current_style
+    }
 
 
 def apply_theme_to_app(app):